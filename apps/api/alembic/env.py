@@ -17,8 +17,12 @@ from app.models import (  # noqa: F401
     UserArtist,
     Event,
     EventEmbedding,
+    EmbeddingCache,
     SearchCache,
+    SearchJob,
     RecentSearch,
+    ExtractionCache,
+    WebDocument,
 )
 
 config = context.config
@@ -0,0 +1,54 @@
+"""Add extraction_caches table
+
+Revision ID: 003_add_extraction_cache
+Revises: 002_add_events
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "003_add_extraction_cache"
+down_revision: Union[str, None] = "002_add_events"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "extraction_caches",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("cache_key", sa.String(length=64), nullable=False),
+        sa.Column("source_url", sa.String(length=500), nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("prompt_version", sa.String(length=20), nullable=False),
+        sa.Column("model", sa.String(length=100), nullable=False),
+        sa.Column("events", postgresql.JSON(astext_type=sa.Text()), nullable=False),
+        sa.Column("hit_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "last_hit_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("cache_key"),
+    )
+    op.create_index(op.f("ix_extraction_caches_cache_key"), "extraction_caches", ["cache_key"], unique=True)
+    op.create_index(op.f("ix_extraction_caches_last_hit_at"), "extraction_caches", ["last_hit_at"], unique=False)
+    op.create_index(op.f("ix_extraction_caches_expires_at"), "extraction_caches", ["expires_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_table("extraction_caches")
@@ -0,0 +1,47 @@
+"""Add embedding_caches table
+
+Revision ID: 004_add_embedding_cache
+Revises: 003_add_extraction_cache
+Create Date: 2026-02-21 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "004_add_embedding_cache"
+down_revision: Union[str, None] = "003_add_extraction_cache"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "embedding_caches",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("model", sa.String(length=100), nullable=False),
+        sa.Column("text_hash", sa.String(length=64), nullable=False),
+        sa.Column("embedding", sa.dialects.postgresql.ARRAY(sa.Float), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("model", "text_hash", name="uq_embedding_caches_model_text_hash"),
+    )
+
+    # Alter embedding column to vector type (pgvector)
+    op.execute("""
+        ALTER TABLE embedding_caches
+        ALTER COLUMN embedding TYPE vector(1536)
+        USING embedding::vector(1536)
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table("embedding_caches")
@@ -0,0 +1,76 @@
+"""Add search_jobs table
+
+Revision ID: 005_add_search_jobs
+Revises: 004_add_embedding_cache
+Create Date: 2026-02-22 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "005_add_search_jobs"
+down_revision: Union[str, None] = "004_add_embedding_cache"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create search job status enum
+    search_job_status_enum = postgresql.ENUM(
+        "pending", "running", "completed", "failed",
+        name="searchjobstatus",
+        create_type=True,
+    )
+    search_job_status_enum.create(op.get_bind(), checkfirst=True)
+
+    op.create_table(
+        "search_jobs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("query", sa.String(length=500), nullable=False),
+        sa.Column("force_refresh", sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column(
+            "status",
+            postgresql.ENUM(
+                "pending", "running", "completed", "failed",
+                name="searchjobstatus",
+                create_type=False,
+            ),
+            nullable=False,
+            server_default="pending",
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("error", sa.String(length=1000), nullable=True),
+        sa.Column("event_ids", postgresql.JSON(astext_type=sa.Text()), nullable=True),
+        sa.Column("search_time_seconds", sa.Float(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_search_jobs_query"), "search_jobs", ["query"], unique=False)
+    op.create_index(
+        "ix_search_jobs_status_created",
+        "search_jobs",
+        ["status", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("search_jobs")
+
+    # Drop enum type
+    search_job_status_enum = postgresql.ENUM(
+        "pending", "running", "completed", "failed",
+        name="searchjobstatus",
+    )
+    search_job_status_enum.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,29 @@
+"""Add stage_timings to search_caches
+
+Revision ID: 006_add_stage_timings
+Revises: 005_add_search_jobs
+Create Date: 2026-02-23 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "006_add_stage_timings"
+down_revision: Union[str, None] = "005_add_search_jobs"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "search_caches",
+        sa.Column("stage_timings", postgresql.JSON(astext_type=sa.Text()), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("search_caches", "stage_timings")
@@ -0,0 +1,79 @@
+"""Add natural_key to events
+
+Revision ID: 007_add_event_natural_key
+Revises: 006_add_stage_timings
+Create Date: 2026-02-24 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+import hashlib
+import re
+import unicodedata
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "007_add_event_natural_key"
+down_revision: Union[str, None] = "006_add_stage_timings"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+
+def _natural_key(artist_id, event_date, venue: str, title: str) -> str:
+    # Frozen copy of app.models.event.make_event_natural_key
+    def normalize(value: str) -> str:
+        return re.sub(r"[\W_]+", "", unicodedata.normalize("NFKC", value).casefold())
+
+    raw = "|".join(
+        [str(artist_id), event_date.isoformat(), normalize(venue), normalize(title)]
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def upgrade() -> None:
+    op.add_column("events", sa.Column("natural_key", sa.String(64), nullable=True))
+
+    # Backfill existing rows
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text("SELECT id, artist_id, event_date, venue, title FROM events")
+    ).fetchall()
+    params = [
+        {"id": row.id, "natural_key": _natural_key(*row[1:])} for row in rows
+    ]
+    for i in range(0, len(params), BATCH_SIZE):
+        bind.execute(
+            sa.text("UPDATE events SET natural_key = :natural_key WHERE id = :id"),
+            params[i:i + BATCH_SIZE],
+        )
+
+    # Drop duplicates collected so far, keeping the most recent collection
+    # (event_embeddings rows go with them via ON DELETE CASCADE)
+    op.execute(
+        """
+        DELETE FROM events
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY natural_key
+                    ORDER BY collected_at DESC, id DESC
+                ) AS rn
+                FROM events
+            ) ranked
+            WHERE ranked.rn > 1
+        )
+        """
+    )
+
+    op.alter_column("events", "natural_key", nullable=False)
+    op.create_index(
+        op.f("ix_events_natural_key"), "events", ["natural_key"], unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_events_natural_key"), table_name="events")
+    op.drop_column("events", "natural_key")
@@ -0,0 +1,62 @@
+"""Add web_documents table
+
+Revision ID: 008_add_web_documents
+Revises: 007_add_event_natural_key
+Create Date: 2026-02-25 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "008_add_web_documents"
+down_revision: Union[str, None] = "007_add_event_natural_key"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "web_documents",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("url", sa.String(length=2000), nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("etag", sa.String(length=500), nullable=True),
+        sa.Column("last_modified", sa.String(length=100), nullable=True),
+        sa.Column(
+            "event_ids",
+            postgresql.JSON(astext_type=sa.Text()),
+            nullable=False,
+            server_default=sa.text("'[]'::json"),
+        ),
+        sa.Column("fetch_count", sa.Integer(), nullable=False, server_default="1"),
+        sa.Column(
+            "first_fetched_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "fetched_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "changed_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("url"),
+    )
+    op.create_index(op.f("ix_web_documents_url"), "web_documents", ["url"], unique=True)
+    op.create_index(op.f("ix_web_documents_fetched_at"), "web_documents", ["fetched_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_table("web_documents")
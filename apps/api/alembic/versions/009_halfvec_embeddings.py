@@ -0,0 +1,70 @@
+"""Store embeddings as 512-dimensional halfvec
+
+Revision ID: 009_halfvec_embeddings
+Revises: 008_add_web_documents
+Create Date: 2026-02-26 00:00:00.000000
+
+text-embedding-3 vectors can be shortened by keeping their first values
+and re-normalizing, which is what the API's `dimensions` parameter
+returns. Existing vectors are converted in place that way (requires
+pgvector >= 0.7 for halfvec, subvector and l2_normalize); run
+`python -m app.workers.reembed` afterwards to replace them with fresh
+API output and to measure recall.
+
+DIMENSION is fixed here on purpose (a migration must not change with
+settings), so it has to stay in sync with `openai_embedding_dimensions`.
+The API and the reembed worker check this at startup; a different size
+needs a new migration that alters both columns.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009_halfvec_embeddings"
+down_revision: Union[str, None] = "008_add_web_documents"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Keep in sync with settings.openai_embedding_dimensions (see above)
+DIMENSION = 512
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_event_embeddings_embedding")
+
+    for table in ("event_embeddings", "embedding_caches"):
+        op.execute(f"""
+            ALTER TABLE {table}
+            ALTER COLUMN embedding TYPE halfvec({DIMENSION})
+            USING l2_normalize(subvector(embedding, 1, {DIMENSION}))::halfvec({DIMENSION})
+        """)
+
+    op.execute("""
+        CREATE INDEX ix_event_embeddings_embedding
+        ON event_embeddings
+        USING ivfflat (embedding halfvec_cosine_ops)
+        WITH (lists = 100)
+    """)
+
+
+def downgrade() -> None:
+    # Dropped dimensions can't be restored: event embeddings must be
+    # recomputed with `python -m app.workers.reembed` after downgrading
+    op.execute("DROP INDEX IF EXISTS ix_event_embeddings_embedding")
+    op.execute("DELETE FROM event_embeddings")
+    op.execute("DELETE FROM embedding_caches")
+
+    for table in ("event_embeddings", "embedding_caches"):
+        op.execute(f"""
+            ALTER TABLE {table}
+            ALTER COLUMN embedding TYPE vector(1536)
+            USING embedding::vector(1536)
+        """)
+
+    op.execute("""
+        CREATE INDEX ix_event_embeddings_embedding
+        ON event_embeddings
+        USING ivfflat (embedding vector_cosine_ops)
+        WITH (lists = 100)
+    """)
@@ -0,0 +1,44 @@
+"""Scope web_documents by who the events were extracted for
+
+Revision ID: 010_scope_web_documents
+Revises: 009_halfvec_embeddings
+Create Date: 2026-02-27 00:00:00.000000
+
+Extraction keeps only events of the searched artist, so a page's stored
+events are only valid for the artist it was extracted for. Existing rows
+don't say which artist that was and are dropped; pages are simply
+extracted again on their next crawl.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "010_scope_web_documents"
+down_revision: Union[str, None] = "009_halfvec_embeddings"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("DELETE FROM web_documents")
+    op.add_column(
+        "web_documents",
+        sa.Column("scope", sa.String(length=200), nullable=False, server_default=""),
+    )
+    op.drop_constraint("web_documents_url_key", "web_documents", type_="unique")
+    op.drop_index(op.f("ix_web_documents_url"), table_name="web_documents")
+    op.create_index(op.f("ix_web_documents_url"), "web_documents", ["url"], unique=False)
+    op.create_unique_constraint(
+        "uq_web_documents_url_scope", "web_documents", ["url", "scope"]
+    )
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM web_documents")
+    op.drop_constraint("uq_web_documents_url_scope", "web_documents", type_="unique")
+    op.drop_index(op.f("ix_web_documents_url"), table_name="web_documents")
+    op.create_index(op.f("ix_web_documents_url"), "web_documents", ["url"], unique=True)
+    op.create_unique_constraint("web_documents_url_key", "web_documents", ["url"])
+    op.drop_column("web_documents", "scope")
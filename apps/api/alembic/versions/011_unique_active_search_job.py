@@ -0,0 +1,48 @@
+"""Allow one pending/running search job per query
+
+Revision ID: 011_unique_active_search_job
+Revises: 010_scope_web_documents
+Create Date: 2026-02-28 00:00:00.000000
+
+SearchJobService.enqueue checks for an active job before inserting one;
+the partial unique index makes concurrent enqueues of the same query
+collide instead of both queueing a search. Existing duplicates are
+failed first, keeping the newest active job of each query.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "011_unique_active_search_job"
+down_revision: Union[str, None] = "010_scope_web_documents"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        UPDATE search_jobs
+        SET status = 'failed',
+            error = 'Duplicate of a newer job for the same query',
+            finished_at = now()
+        WHERE status IN ('pending', 'running')
+          AND id NOT IN (
+            SELECT DISTINCT ON (query) id
+            FROM search_jobs
+            WHERE status IN ('pending', 'running')
+            ORDER BY query, created_at DESC
+          )
+    """)
+    op.create_index(
+        "uq_search_jobs_active_query",
+        "search_jobs",
+        ["query"],
+        unique=True,
+        postgresql_where=sa.text("status IN ('pending', 'running')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_search_jobs_active_query", table_name="search_jobs")
@@ -0,0 +1,122 @@
+"""Shared, pooled upstream clients (Tavily over httpx, OpenAI)."""
+
+from typing import Optional
+import importlib.util
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+from app.config import settings
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional h2 package (httpx[http2])."""
+    return settings.http2_enabled and importlib.util.find_spec("h2") is not None
+
+
+def _limits() -> httpx.Limits:
+    """Connection pool limits shared by all upstream clients."""
+    return httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry_seconds,
+    )
+
+
+def _pool_stats(client: Optional[httpx.AsyncClient]) -> dict:
+    """
+    Connection pool utilization of an httpx client.
+
+    Reads httpcore's pool through private attributes; reports what it
+    can and leaves the rest out if httpx internals change.
+    """
+    if client is None:
+        return {"open": False}
+
+    stats = {"open": not client.is_closed}
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    connections = getattr(pool, "connections", None)
+    if connections is not None:
+        requests = getattr(pool, "_requests", [])
+        idle = sum(1 for connection in connections if connection.is_idle())
+        stats.update(
+            connections=len(connections),
+            active=len(connections) - idle,
+            idle=idle,
+            max_connections=settings.http_max_connections,
+            in_flight_requests=len(requests),
+            queued_requests=sum(1 for request in requests if request.is_queued()),
+        )
+    return stats
+
+
+class ClientRegistry:
+    """
+    Process-wide upstream clients sharing keep-alive connection pools.
+
+    Clients are created on first use, so code running outside the app
+    (workers, scripts) gets them too; the FastAPI lifespan (or the worker
+    entrypoint) calls aclose() on shutdown. After aclose() the next use
+    creates fresh clients.
+    """
+
+    def __init__(self):
+        self._http: Optional[httpx.AsyncClient] = None
+        self._openai_http: Optional[httpx.AsyncClient] = None
+        self._openai: Optional[AsyncOpenAI] = None
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """General-purpose client (Tavily)."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                http2=_http2_available(),
+                limits=_limits(),
+                timeout=httpx.Timeout(
+                    settings.http_timeout_seconds,
+                    connect=settings.http_connect_timeout_seconds,
+                ),
+            )
+        return self._http
+
+    @property
+    def openai(self) -> AsyncOpenAI:
+        """OpenAI client shared by the extractor and embeddings service."""
+        if self._openai is None or self._openai_http.is_closed:
+            self._openai_http = DefaultAsyncHttpxClient(
+                http2=_http2_available(),
+                limits=_limits(),
+                timeout=httpx.Timeout(
+                    settings.openai_timeout_seconds,
+                    connect=settings.http_connect_timeout_seconds,
+                ),
+            )
+            self._openai = AsyncOpenAI(
+                api_key=settings.openai_api_key,
+                http_client=self._openai_http,
+                max_retries=settings.openai_max_retries,
+            )
+        return self._openai
+
+    def stats(self) -> dict:
+        """Pool utilization per client, for the stats endpoint."""
+        return {
+            "http2": _http2_available(),
+            "http": _pool_stats(self._http),
+            "openai": _pool_stats(self._openai_http),
+        }
+
+    async def aclose(self) -> None:
+        """Close all clients and their pooled connections."""
+        if self._openai is not None:
+            # Also closes self._openai_http
+            await self._openai.close()
+        if self._http is not None:
+            await self._http.aclose()
+        self._http = None
+        self._openai_http = None
+        self._openai = None
+
+
+# Singleton instance
+clients = ClientRegistry()
@@ -8,9 +8,40 @@ class Settings(BaseSettings):
     # OpenAI
     openai_api_key: str = ""
     openai_embedding_model: str = "text-embedding-3-small"
+    openai_embedding_dimensions: int = 512  # Must match the embedding columns (see migration 009)
+    openai_embedding_batch_size: int = 256  # Max inputs per embeddings request
+    openai_extraction_model: str = "gpt-4o-mini"
+    openai_escalation_model: str = "gpt-4o"  # Redoes doubtful extractions ("" = off)
+    embedding_cache_max_entries: int = 5000  # In-process LRU size (~6 KB each)
+    embedding_batch_window_ms: float = 5.0  # Concurrent misses wait this long to share a request (0 = off)
 
     # Tavily (Web Search)
     tavily_api_key: str = ""
+    crawler_query_variants: int = 4  # Concurrent query phrasings (1 = single search)
+    crawler_include_raw_content: bool = False  # Full page text for extraction
+    structured_parsing_enabled: bool = True  # JSON-LD/site parsers before the LLM
+    structured_fetch_timeout_seconds: float = 10.0
+
+    # HTTP Clients (pooled, shared by Tavily and OpenAI)
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry_seconds: float = 30.0
+    http_connect_timeout_seconds: float = 5.0
+    http_timeout_seconds: float = 30.0  # Tavily read/write/pool timeout
+    http2_enabled: bool = True  # Used only if the h2 package is installed
+    openai_timeout_seconds: float = 60.0
+    openai_max_retries: int = 0  # SDK-level; retries are done by app.rag.resilience
+
+    # Upstream Resilience (rate limits, retries, circuit breaker per provider)
+    tavily_rate_per_second: float = 5.0  # 0 = unlimited
+    tavily_rate_burst: int = 10
+    openai_rate_per_second: float = 20.0
+    openai_rate_burst: int = 40
+    upstream_max_retries: int = 3
+    upstream_retry_base_delay_seconds: float = 0.5
+    upstream_retry_max_delay_seconds: float = 10.0
+    upstream_circuit_failure_threshold: int = 5  # Consecutive failed calls
+    upstream_circuit_reset_seconds: float = 30.0
 
     # JWT
     secret_key: str = "your-secret-key-change-in-production"
@@ -19,6 +50,35 @@ class Settings(BaseSettings):
 
     # Search Cache
     search_cache_ttl_hours: int = 24
+    search_coalesce_timeout_seconds: int = 60  # Max wait for another worker's run
+
+    # Search Jobs (background RAG searches)
+    search_worker_count: int = 4  # Concurrent jobs per worker process
+    search_job_poll_interval_seconds: float = 0.5
+    search_job_timeout_seconds: int = 300  # Running longer = worker presumed dead
+    search_job_max_attempts: int = 3
+
+    # Extraction Cache
+    extraction_cache_ttl_hours: int = 168
+    extraction_cache_max_entries: int = 50000
+
+    # RAG Pipeline
+    rag_extraction_concurrency: int = 5  # Max concurrent LLM extraction calls
+    rag_relevance_threshold: float = 0.45  # Skip web results scoring below (0 = off)
+    rag_near_duplicate_distance: int = 12  # Max SimHash bits (of 64) apart for a copy (-1 = off)
+    rag_near_duplicate_similarity: float = 0.8  # Min shingle Jaccard to confirm a copy
+    rag_compaction_enabled: bool = True  # Strip boilerplate / eventless sentences first
+    rag_extraction_chunk_tokens: int = 2000  # Content tokens per LLM extraction call
+    rag_extraction_chunk_overlap_tokens: int = 100  # Repeated between chunks
+    rag_extraction_max_chunks: int = 6  # Chunks per page (rest is dropped)
+    rag_extraction_pack_tokens: int = 3000  # Short results packed per request (0 = off)
+    rag_extraction_pack_doc_tokens: int = 600  # Only results up to this size are packed
+    rag_extraction_streaming: bool = True  # Stream LLM answers in streaming search
+    rag_stream_store_batch_size: int = 10  # Streamed events stored (embedded/upserted) together
+    rag_stream_store_window_ms: float = 300.0  # Max wait of a streamed event before storing
+    rag_rule_extraction_enabled: bool = True  # Regex dates/prices/venues before the LLM
+    rag_rule_confidence_threshold: float = 0.8  # Rule events at/above skip the LLM
+    rag_escalation_confidence_threshold: float = 0.6  # Fast-model events below escalate
 
     # App
     debug: bool = True
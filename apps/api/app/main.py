@@ -1,5 +1,8 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.ext.asyncio import create_async_engine
 
 from app.routers import (
     auth_router,
@@ -8,11 +11,42 @@ from app.routers import (
     events_router,
     search_router,
 )
+from app.clients import clients
+from app.config import settings
+from app.rag.compaction import compaction_stats
+from app.rag.dedup import near_duplicate_stats
+from app.rag.embeddings import (
+    check_embedding_dimension,
+    embedding_cache_stats,
+    embeddings_service,
+)
+from app.rag.extractor import extraction_tier_stats
+from app.rag.relevance import relevance_filter_stats
+from app.rag.resilience import openai_guard, tavily_guard
+from app.rag.rules import rule_extraction_stats
+from app.services.extraction_cache import extraction_cache_stats
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Refuse to start with embedding columns of another size than settings
+    engine = create_async_engine(settings.database_url)
+    try:
+        async with engine.connect() as conn:
+            await check_embedding_dimension(conn)
+    finally:
+        await engine.dispose()
+
+    # Upstream clients are created on first use; close their pools on shutdown
+    yield
+    await clients.aclose()
+
 
 app = FastAPI(
     title="Artist Event Aggregator API",
     description="RAG-based artist event search and calendar API",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # CORS 설정 (개발용)
@@ -40,3 +74,26 @@ async def root():
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+
+@app.get("/stats")
+async def runtime_stats():
+    """RAG pipeline counters for this worker process."""
+    return {
+        "extraction_cache": extraction_cache_stats.to_dict(),
+        "embedding_cache": embedding_cache_stats.to_dict(),
+        "embedding_batches": embeddings_service.batch_stats(),
+        "relevance_filter": relevance_filter_stats.to_dict(),
+        "near_duplicates": near_duplicate_stats.to_dict(),
+        "rule_extraction": rule_extraction_stats.to_dict(),
+        "compaction": compaction_stats.to_dict(),
+        "extraction_tiers": {
+            tier: tier_stats.to_dict()
+            for tier, tier_stats in extraction_tier_stats.items()
+        },
+        "http_clients": clients.stats(),
+        "upstreams": {
+            "tavily": tavily_guard.stats(),
+            "openai": openai_guard.stats(),
+        },
+    }
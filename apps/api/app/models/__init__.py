@@ -3,8 +3,10 @@ from app.models.base import UUIDMixin, TimestampMixin
 from app.models.user import User, AuthProvider
 from app.models.artist import Artist, UserArtist
 from app.models.event import Event, EventCategory
-from app.models.embedding import EventEmbedding, EMBEDDING_DIMENSION
-from app.models.search import SearchCache, RecentSearch
+from app.models.embedding import EventEmbedding, EmbeddingCache, EMBEDDING_DIMENSION
+from app.models.search import SearchCache, SearchJob, SearchJobStatus, RecentSearch
+from app.models.extraction import ExtractionCache
+from app.models.web_document import WebDocument
 
 __all__ = [
     "UUIDMixin",
@@ -16,7 +18,12 @@ __all__ = [
     "Event",
     "EventCategory",
     "EventEmbedding",
+    "EmbeddingCache",
     "EMBEDDING_DIMENSION",
     "SearchCache",
+    "SearchJob",
+    "SearchJobStatus",
     "RecentSearch",
+    "ExtractionCache",
+    "WebDocument",
 ]
@@ -4,11 +4,12 @@ from typing import TYPE_CHECKING, Optional, List
 import uuid
 from datetime import datetime
 
-from sqlalchemy import String, ForeignKey, DateTime, func, Index
+from sqlalchemy import String, ForeignKey, DateTime, func, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC
 
+from app.config import settings
 from app.database import Base
 from app.models.base import UUIDMixin
 
@@ -16,8 +17,10 @@ if TYPE_CHECKING:
     from app.models.event import Event
 
 
-# OpenAI text-embedding-3-small produces 1536-dimensional vectors
-EMBEDDING_DIMENSION = 1536
+# text-embedding-3 vectors shortened with the API's `dimensions` parameter and
+# stored as halfvec (2 bytes per value). Changing it needs a migration that
+# alters the columns (see 009) and a run of app.workers.reembed.
+EMBEDDING_DIMENSION = settings.openai_embedding_dimensions
 
 
 class EventEmbedding(Base, UUIDMixin):
@@ -34,9 +37,9 @@ class EventEmbedding(Base, UUIDMixin):
         index=True,
     )
 
-    # Embedding vector (1536 dimensions for text-embedding-3-small)
+    # Embedding vector (half precision, EMBEDDING_DIMENSION values)
     embedding: Mapped[List[float]] = mapped_column(
-        Vector(EMBEDDING_DIMENSION),
+        HALFVEC(EMBEDDING_DIMENSION),
         nullable=False,
     )
 
@@ -76,9 +79,46 @@ class EventEmbedding(Base, UUIDMixin):
             embedding,
             postgresql_using="ivfflat",
             postgresql_with={"lists": 100},
-            postgresql_ops={"embedding": "vector_cosine_ops"},
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
         ),
     )
 
     def __repr__(self) -> str:
         return f"<EventEmbedding event_id={self.event_id}>"
+
+
+class EmbeddingCache(Base, UUIDMixin):
+    """Cache of embedding vectors keyed by (model, normalized text hash)."""
+
+    __tablename__ = "embedding_caches"
+
+    # Model info
+    model: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+    )
+
+    # sha256 of the normalized text that was embedded
+    text_hash: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+    )
+
+    embedding: Mapped[List[float]] = mapped_column(
+        HALFVEC(EMBEDDING_DIMENSION),
+        nullable=False,
+    )
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        UniqueConstraint("model", "text_hash", name="uq_embedding_caches_model_text_hash"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<EmbeddingCache model={self.model} text_hash={self.text_hash[:12]}>"
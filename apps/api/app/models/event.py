@@ -4,6 +4,9 @@ from typing import TYPE_CHECKING, Optional, List
 from enum import Enum as PyEnum
 from decimal import Decimal
 import uuid
+import hashlib
+import re
+import unicodedata
 from datetime import datetime, date, time
 
 from sqlalchemy import (
@@ -36,6 +39,37 @@ class EventCategory(str, PyEnum):
     FESTIVAL = "festival"
 
 
+def make_event_natural_key(
+    artist_id: uuid.UUID,
+    event_date: date,
+    venue: str,
+    title: str,
+) -> str:
+    """
+    Natural key identifying the same real-world event across collections.
+
+    sha256 of artist_id + event_date + venue + title, with venue and title
+    normalized (NFKC, casefolded, punctuation and whitespace removed) so
+    "BTS World Tour" at "KSPO Dome" matches "BTS WORLD TOUR!" at "KSPO DOME".
+    """
+
+    def normalize(value: str) -> str:
+        return re.sub(r"[\W_]+", "", unicodedata.normalize("NFKC", value).casefold())
+
+    raw = "|".join(
+        [str(artist_id), event_date.isoformat(), normalize(venue), normalize(title)]
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _natural_key_default(context) -> str:
+    """Column default: derive natural_key from the row being inserted."""
+    params = context.get_current_parameters()
+    return make_event_natural_key(
+        params["artist_id"], params["event_date"], params["venue"], params["title"]
+    )
+
+
 class Event(Base, UUIDMixin, TimestampMixin):
     """Event model for artist events."""
 
@@ -144,17 +178,29 @@ class Event(Base, UUIDMixin, TimestampMixin):
         nullable=False,
     )
 
+    # Dedup key (see make_event_natural_key); repeat collections upsert on it
+    natural_key: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        unique=True,
+        index=True,
+        default=_natural_key_default,
+    )
+
     # Relationships
     artist: Mapped["Artist"] = relationship(
         "Artist",
         back_populates="events",
         lazy="selectin",
     )
+    # Never loaded implicitly: vectors are only needed by vector search,
+    # which reads them in SQL. Use selectinload(Event.embedding) if needed.
     embedding: Mapped[Optional["EventEmbedding"]] = relationship(
         "EventEmbedding",
         back_populates="event",
         uselist=False,
-        lazy="selectin",
+        lazy="raise",
+        passive_deletes=True,  # event_embeddings.event_id is ON DELETE CASCADE
     )
 
     def __repr__(self) -> str:
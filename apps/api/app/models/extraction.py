@@ -0,0 +1,76 @@
+"""Extraction cache model: LLM extraction results keyed by page content."""
+
+from typing import List
+from datetime import datetime
+
+from sqlalchemy import String, Integer, DateTime, func, JSON
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.models.base import UUIDMixin
+
+
+class ExtractionCache(Base, UUIDMixin):
+    """Cache of parsed LLM extraction results (TTL + LRU eviction)."""
+
+    __tablename__ = "extraction_caches"
+
+    # sha256 of (source_url, content_hash, scope, prompt_version, models)
+    cache_key: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        unique=True,
+        index=True,
+    )
+
+    # Key components (for debugging/audit)
+    source_url: Mapped[str] = mapped_column(
+        String(500),
+        nullable=False,
+    )
+    content_hash: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+    )
+    prompt_version: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+    )
+    model: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+    )
+
+    # Parsed ExtractedEvent list (JSON array)
+    events: Mapped[List[dict]] = mapped_column(
+        JSON,
+        nullable=False,
+    )
+
+    # Stats
+    hit_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    last_hit_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        index=True,
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        index=True,
+    )
+
+    def __repr__(self) -> str:
+        return f"<ExtractionCache source_url='{self.source_url}'>"
@@ -1,10 +1,22 @@
-"""Search-related models: SearchCache and RecentSearch."""
+"""Search-related models: SearchCache, SearchJob and RecentSearch."""
 
 from typing import Optional, List
+from enum import Enum as PyEnum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import String, Integer, ForeignKey, DateTime, func, JSON, Index
+from sqlalchemy import (
+    String,
+    Integer,
+    Boolean,
+    ForeignKey,
+    DateTime,
+    func,
+    JSON,
+    Index,
+    Enum,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -40,6 +52,12 @@ class SearchCache(Base, UUIDMixin):
     search_time_seconds: Mapped[float] = mapped_column(
         nullable=False,
     )
+    # Per-stage breakdown, e.g. {"crawl": 1.2, "extract": 2.9, ...,
+    # "sources": {url: seconds}}
+    stage_timings: Mapped[Optional[dict]] = mapped_column(
+        JSON,
+        nullable=True,
+    )
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -57,6 +75,97 @@ class SearchCache(Base, UUIDMixin):
         return f"<SearchCache query='{self.query}'>"
 
 
+class SearchJobStatus(str, PyEnum):
+    """Search job status enum."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class SearchJob(Base, UUIDMixin):
+    """Queued RAG search, run by a search worker (id is the searchId)."""
+
+    __tablename__ = "search_jobs"
+
+    # Search query (normalized: lowercase, trimmed)
+    query: Mapped[str] = mapped_column(
+        String(500),
+        nullable=False,
+        index=True,
+    )
+    force_refresh: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False,
+    )
+
+    # Queue state
+    status: Mapped[SearchJobStatus] = mapped_column(
+        Enum(
+            SearchJobStatus,
+            name="searchjobstatus",
+            create_type=True,
+            values_callable=lambda e: [m.value for m in e],
+        ),
+        nullable=False,
+        default=SearchJobStatus.PENDING,
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    error: Mapped[Optional[str]] = mapped_column(
+        String(1000),
+        nullable=True,
+    )
+
+    # Result (copied from the pipeline run, independent of cache expiry)
+    event_ids: Mapped[Optional[List[str]]] = mapped_column(
+        JSON,
+        nullable=True,
+    )
+    search_time_seconds: Mapped[Optional[float]] = mapped_column(
+        nullable=True,
+    )
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    started_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    finished_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    # Composite index for claiming the oldest pending job; at most one
+    # pending/running job per query
+    __table_args__ = (
+        Index(
+            "ix_search_jobs_status_created",
+            status,
+            created_at,
+        ),
+        Index(
+            "uq_search_jobs_active_query",
+            query,
+            unique=True,
+            postgresql_where=text("status IN ('pending', 'running')"),
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return f"<SearchJob query='{self.query}' status={self.status.value}>"
+
+
 class RecentSearch(Base, UUIDMixin):
     """User's recent search history."""
 
@@ -0,0 +1,85 @@
+"""Web document model: record of crawled pages and the events they yielded."""
+
+from typing import List, Optional
+from datetime import datetime
+
+from sqlalchemy import String, Integer, DateTime, func, JSON, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.models.base import UUIDMixin
+
+
+class WebDocument(Base, UUIDMixin):
+    """Crawled page, keyed by URL and scope, for incremental re-crawls."""
+
+    __tablename__ = "web_documents"
+
+    url: Mapped[str] = mapped_column(
+        String(2000),
+        nullable=False,
+        index=True,
+    )
+
+    # Who the events were extracted for (see app.rag.extractor.extraction_scope):
+    # the same page yields different events for different artists
+    scope: Mapped[str] = mapped_column(
+        String(200),
+        nullable=False,
+        default="",
+    )
+
+    # sha256 of the page text the events were extracted from
+    content_hash: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+    )
+
+    # HTTP validators from the last direct fetch (conditional requests)
+    etag: Mapped[Optional[str]] = mapped_column(
+        String(500),
+        nullable=True,
+    )
+    last_modified: Mapped[Optional[str]] = mapped_column(
+        String(100),
+        nullable=True,
+    )
+
+    # Event IDs derived from this content (JSON array of UUID strings)
+    event_ids: Mapped[List[str]] = mapped_column(
+        JSON,
+        nullable=False,
+        default=list,
+    )
+
+    # Stats
+    fetch_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=1,
+    )
+
+    # Timestamps
+    first_fetched_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    fetched_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        index=True,
+    )
+    changed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        UniqueConstraint("url", "scope", name="uq_web_documents_url_scope"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<WebDocument url='{self.url}' scope='{self.scope}'>"
@@ -0,0 +1,164 @@
+"""Micro-batching: merge concurrent small upstream calls into one request."""
+
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+import asyncio
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    """
+    Collect items submitted by concurrent callers and process them together.
+
+    Items wait at most window_seconds, or until max_items are pending, and
+    are then sent to fn in one call; each caller gets back the results
+    for its own items. Equal items submitted while a batch is open are
+    sent once. If fn fails, every caller in the batch gets the exception.
+
+    fn receives distinct items and returns their results in input order.
+    A window_seconds of 0 disables batching (fn is called per submit).
+    """
+
+    def __init__(
+        self,
+        fn: Callable[[List[T]], Awaitable[List[R]]],
+        max_items: int,
+        window_seconds: float,
+    ):
+        self._fn = fn
+        self.max_items = max(1, max_items)
+        self.window_seconds = window_seconds
+        self._pending: List[Tuple[T, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: set = set()  # Running batches (keeps them referenced)
+        self._batches = 0
+        self._items = 0
+
+    async def submit(self, items: List[T]) -> List[R]:
+        """Process items as part of the next batch; results in input order."""
+        if not items:
+            return []
+        if self.window_seconds <= 0:
+            self._record(len(items))
+            return await self._fn(items)
+
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Pending items of a previous event loop can never complete
+            self._pending, self._timer, self._loop = [], None, loop
+
+        futures: List[asyncio.Future] = []
+        for item in items:
+            future = loop.create_future()
+            self._pending.append((item, future))
+            futures.append(future)
+            if len(self._pending) >= self.max_items:
+                self._flush()
+        if self._pending and self._timer is None:
+            self._timer = loop.call_later(self.window_seconds, self._flush)
+
+        return list(await asyncio.gather(*futures))
+
+    def stats(self) -> dict:
+        """Snapshot for the stats endpoint."""
+        return {
+            "batches": self._batches,
+            "items": self._items,
+            "avg_batch_size": (
+                round(self._items / self._batches, 2) if self._batches else 0.0
+            ),
+            "pending": len(self._pending),
+        }
+
+    def _record(self, count: int) -> None:
+        self._batches += 1
+        self._items += count
+
+    def _flush(self) -> None:
+        """Start processing everything pending."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[T, asyncio.Future]]) -> None:
+        # Callers that gave up (cancelled futures) still ride along: the
+        # request may already be shared with others
+        unique = list(dict.fromkeys(item for item, _ in batch))
+        self._record(len(unique))
+        try:
+            results = await self._fn(unique)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        by_item: Dict[T, R] = dict(zip(unique, results))
+        for item, future in batch:
+            if not future.done():
+                future.set_result(by_item[item])
+
+
+async def window_batches(
+    source: AsyncIterator[List[T]],
+    max_items: int,
+    window_seconds: float,
+) -> AsyncIterator[List[T]]:
+    """
+    Regroup an async stream of small lists into batches.
+
+    A batch is yielded once it holds max_items items or its first item
+    has waited window_seconds, whichever comes first; the rest is yielded
+    when the source ends. The source keeps being read while the consumer
+    handles a batch.
+    """
+    iterator = source.__aiter__()
+    loop = asyncio.get_running_loop()
+    pending: List[T] = []
+    deadline: Optional[float] = None
+    next_items = asyncio.ensure_future(iterator.__anext__())
+    try:
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            done, _ = await asyncio.wait({next_items}, timeout=timeout)
+            if not done:
+                batch, pending, deadline = pending, [], None
+                yield batch
+                continue
+
+            try:
+                items = next_items.result()
+            except StopAsyncIteration:
+                break
+            next_items = asyncio.ensure_future(iterator.__anext__())
+
+            pending.extend(items)
+            if pending and deadline is None:
+                deadline = loop.time() + window_seconds
+            if len(pending) >= max_items:
+                batch, pending, deadline = pending, [], None
+                yield batch
+
+        if pending:
+            yield pending
+    finally:
+        # Consumer stopped early: stop reading the source too
+        next_items.cancel()
@@ -0,0 +1,210 @@
+"""Fit page content to extraction prompts: split long pages, pack short ones."""
+
+from functools import lru_cache
+from typing import List
+import importlib.util
+import re
+
+from app.config import settings
+from app.rag.relevance import DATE_PATTERN
+
+PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+
+def _split_at_dates(segment: str, max_chars: int) -> List[str]:
+    """Split an oversized segment before date mentions, hard-splitting if needed."""
+    cuts = [m.start() for m in DATE_PATTERN.finditer(segment)] + [len(segment)]
+
+    pieces: List[str] = []
+    start = 0
+    last_cut = 0  # Last date boundary seen inside the current piece
+    for cut in cuts:
+        while cut - start > max_chars:
+            end = last_cut if last_cut > start else start + max_chars
+            pieces.append(segment[start:end])
+            start = end
+        last_cut = cut
+    pieces.append(segment[start:])
+    return [piece for piece in pieces if piece.strip()]
+
+
+def _tail(text: str, max_chars: int) -> str:
+    """Last max_chars of text, starting at a word boundary when possible."""
+    if max_chars <= 0:
+        return ""
+    tail = text[-max_chars:]
+    if len(text) > max_chars and " " in tail:
+        tail = tail[tail.index(" ") + 1:]
+    return tail
+
+
+def split_content(
+    content: str,
+    chunk_chars: int,
+    overlap_chars: int = 0,
+) -> List[str]:
+    """
+    Split content into chunks of at most chunk_chars characters.
+
+    Splits on paragraph breaks, and inside overly long paragraphs before
+    date mentions, so one schedule entry rarely straddles two chunks.
+    Each chunk after the first starts with up to overlap_chars of the
+    previous one to keep entries that do straddle a cut intact.
+
+    Args:
+        content: Page content
+        chunk_chars: Max characters per chunk (including overlap)
+        overlap_chars: Characters repeated from the previous chunk
+
+    Returns:
+        Chunks in content order ([content] if it already fits)
+    """
+    if len(content) <= chunk_chars:
+        return [content]
+
+    overlap_chars = min(overlap_chars, chunk_chars // 4)
+    budget = chunk_chars - overlap_chars
+
+    segments: List[str] = []
+    for paragraph in PARAGRAPH_BREAK.split(content):
+        if not paragraph.strip():
+            continue
+        if len(paragraph) > budget:
+            segments.extend(_split_at_dates(paragraph, budget))
+        else:
+            segments.append(paragraph)
+
+    # Greedily pack segments into chunks
+    packed: List[str] = []
+    current = ""
+    for segment in segments:
+        candidate = f"{current}\n\n{segment}" if current else segment
+        if len(candidate) > budget and current:
+            packed.append(current)
+            current = segment
+        else:
+            current = candidate
+    if current:
+        packed.append(current)
+
+    chunks = [packed[0]]
+    for previous, chunk in zip(packed, packed[1:]):
+        overlap = _tail(previous, overlap_chars)
+        chunks.append(f"{overlap}\n\n{chunk}" if overlap else chunk)
+    return chunks
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token count without a tokenizer.
+
+    ~4 characters per token for ASCII text; Hangul and other non-ASCII
+    characters are counted as a token each, which errs on the high side.
+    """
+    non_ascii = sum(1 for char in text if ord(char) > 127)
+    return (len(text) - non_ascii + 3) // 4 + non_ascii
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    """tiktoken encoding of the extraction model; None without tiktoken."""
+    if importlib.util.find_spec("tiktoken") is None:
+        return None
+    import tiktoken
+
+    try:
+        try:
+            return tiktoken.encoding_for_model(settings.openai_extraction_model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        # Encodings are downloaded on first use; offline falls back
+        print(f"tiktoken unavailable, estimating tokens: {e}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """
+    Token count of text for the extraction model.
+
+    Exact with the optional tiktoken package, estimate_tokens otherwise.
+    """
+    encoding = _encoding()
+    if encoding is None:
+        return estimate_tokens(text)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_tokens(text: str, max_tokens: int) -> str:
+    """Longest prefix of text that fits in max_tokens."""
+    encoding = _encoding()
+    if encoding is not None:
+        tokens = encoding.encode(text, disallowed_special=())
+        return text if len(tokens) <= max_tokens else encoding.decode(
+            tokens[:max_tokens]
+        )
+
+    tokens = estimate_tokens(text)
+    while tokens > max_tokens:
+        text = text[: max(0, int(len(text) * max_tokens / tokens) - 1)]
+        tokens = estimate_tokens(text)
+    return text
+
+
+def split_content_tokens(
+    content: str,
+    chunk_tokens: int,
+    overlap_tokens: int = 0,
+) -> List[str]:
+    """
+    split_content with chunk and overlap sizes in tokens (count_tokens).
+
+    Token budgets are turned into character budgets at the content's own
+    characters-per-token ratio, so Hangul pages get shorter chunks than
+    English ones; a chunk still over budget (denser than the page
+    average) is split again.
+    """
+    tokens = count_tokens(content)
+    if tokens <= chunk_tokens:
+        return [content]
+
+    chars_per_token = len(content) / tokens
+    chunks: List[str] = []
+    for chunk in split_content(
+        content,
+        max(1, int(chunk_tokens * chars_per_token)),
+        int(overlap_tokens * chars_per_token),
+    ):
+        if len(chunk) < len(content) and count_tokens(chunk) > chunk_tokens:
+            chunks.extend(split_content_tokens(chunk, chunk_tokens, overlap_tokens))
+        else:
+            chunks.append(chunk)
+    return chunks
+
+
+def pack_documents(sizes: List[int], budget: int) -> List[List[int]]:
+    """
+    Bin-pack documents into groups whose total size fits budget.
+
+    First-fit decreasing: few groups, so few requests. A document larger
+    than budget gets a group of its own.
+
+    Args:
+        sizes: Size (e.g. estimated tokens) of each document
+        budget: Max total size per group
+
+    Returns:
+        Groups of document indices, each in ascending index order
+    """
+    bins: List[List[int]] = []
+    remaining: List[int] = []
+    for index in sorted(range(len(sizes)), key=lambda i: sizes[i], reverse=True):
+        for bin_index, space in enumerate(remaining):
+            if sizes[index] <= space:
+                bins[bin_index].append(index)
+                remaining[bin_index] -= sizes[index]
+                break
+        else:
+            bins.append([index])
+            remaining.append(budget - sizes[index])
+    return [sorted(group) for group in sorted(bins, key=min)]
@@ -0,0 +1,127 @@
+"""Compact page content before LLM extraction: fewer tokens, same events."""
+
+from typing import List
+import re
+
+from app.rag.relevance import DATE_PATTERN, EVENT_KEYWORDS, PRICE_PATTERN
+from app.rag.rules import CLOCK_TIME, find_venues
+from app.rag.stats import CompactionStats
+
+compaction_stats = CompactionStats()
+
+# Sentences kept before each sentence with an event detail: the event's
+# title or artist is often named just before its date/venue line
+CONTEXT_SENTENCES = 1
+# Boilerplate wording only marks a line as boilerplate if the line is short;
+# a long paragraph mentioning "login" is still content
+MAX_BOILERPLATE_CHARS = 200
+# Navigation: a line of at least this many short items between separators
+MIN_NAV_ITEMS = 4
+MAX_NAV_ITEM_WORDS = 3
+
+BOILERPLATE_PATTERN = re.compile(
+    r"""
+    cookie | privacy\s+policy | terms\s+of\s+(?:use|service)
+    | all\s+rights\s+reserved | copyright | ©
+    | subscribe | newsletter | sign\s+(?:in|up) | log\s?in | log\s?out
+    | skip\s+to\s+(?:main\s+)?content | share\s+on | follow\s+us | advertisement
+    | 쿠키 | 개인정보\s?처리방침 | 이용약관 | 무단\s?전재 | 재배포\s?금지
+    | 구독 | 로그인 | 회원가입 | 공유하기 | 광고
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+NAV_SEPARATOR = re.compile(r"\s*[|·•›»>]\s*")
+INLINE_SPACE = re.compile(r"[ \t\f\v\u00a0\u200b\u3000]+")
+SENTENCE_END = re.compile(r"(?<=[.!?。])\s+")
+
+
+def collapse_whitespace(text: str) -> List[str]:
+    """Non-empty lines of text with runs of spaces collapsed."""
+    lines = (INLINE_SPACE.sub(" ", line).strip() for line in text.splitlines())
+    return [line for line in lines if line]
+
+
+def _has_schedule(text: str) -> bool:
+    """Whether text has a date, price or clock time."""
+    return bool(
+        DATE_PATTERN.search(text)
+        or PRICE_PATTERN.search(text)
+        or CLOCK_TIME.search(text)
+    )
+
+
+def is_boilerplate(line: str) -> bool:
+    """
+    Cookie banners, footers, share/login links and navigation menus.
+
+    Lines with a date, price or time are never boilerplate (e.g. a
+    "2026.03.15 | 18:00 | KSPO DOME | 110,000원" schedule row).
+    """
+    if _has_schedule(line):
+        return False
+    if len(line) <= MAX_BOILERPLATE_CHARS and BOILERPLATE_PATTERN.search(line):
+        return True
+    items = [item for item in NAV_SEPARATOR.split(line) if item]
+    return len(items) >= MIN_NAV_ITEMS and all(
+        len(item.split()) <= MAX_NAV_ITEM_WORDS for item in items
+    )
+
+
+def has_event_detail(sentence: str) -> bool:
+    """Whether a sentence mentions a date, time, price or venue."""
+    if _has_schedule(sentence):
+        return True
+    lowered = sentence.casefold()
+    return any(keyword in lowered for keyword in EVENT_KEYWORDS) or bool(
+        find_venues(sentence)
+    )
+
+
+def compact_content(text: str) -> str:
+    """
+    Shrink page content to what event extraction needs.
+
+    Drops boilerplate lines and repeated lines (menus in header and
+    footer), collapses whitespace, then keeps only sentences with a date,
+    time, price or venue plus CONTEXT_SENTENCES before each. Runs of
+    dropped sentences become paragraph breaks, so chunking still splits
+    between schedule entries.
+
+    Args:
+        text: Page text
+
+    Returns:
+        Compacted text; the cleaned text unfiltered if no sentence has an
+        event detail (nothing to anchor on, so don't guess)
+    """
+    seen_lines = set()
+    sentences: List[str] = []
+    line_starts = set()  # Indices of sentences starting a line
+    for line in collapse_whitespace(text):
+        if line in seen_lines or is_boilerplate(line):
+            continue
+        seen_lines.add(line)
+        line_starts.add(len(sentences))
+        sentences.extend(part for part in SENTENCE_END.split(line) if part)
+
+    keep = set()
+    for index, sentence in enumerate(sentences):
+        if has_event_detail(sentence):
+            keep.update(range(max(0, index - CONTEXT_SENTENCES), index + 1))
+    if not keep:
+        keep = set(range(len(sentences)))
+
+    compacted = ""
+    previous = None
+    for index in sorted(keep):
+        if previous is None:
+            compacted = sentences[index]
+        elif index != previous + 1:
+            compacted += "\n\n" + sentences[index]
+        elif index in line_starts:
+            compacted += "\n" + sentences[index]
+        else:
+            compacted += " " + sentences[index]
+        previous = index
+    return compacted
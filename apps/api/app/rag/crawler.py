@@ -1,10 +1,15 @@
 """Web crawler using Tavily API for event search."""
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import asyncio
+import re
+
 import httpx
 from pydantic import BaseModel
 
+from app.clients import clients
 from app.config import settings
+from app.rag.resilience import UpstreamError, tavily_guard
 
 
 class WebSearchResult(BaseModel):
@@ -14,6 +19,95 @@ class WebSearchResult(BaseModel):
     url: str
     content: str
     score: float
+    raw_content: Optional[str] = None  # Full page text, if requested
+
+    @property
+    def text(self) -> str:
+        """Best available page text for extraction."""
+        return self.raw_content or self.content
+
+
+class FetchedPage(BaseModel):
+    """Page fetched directly, with its HTTP validators."""
+
+    html: str = ""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    not_modified: bool = False  # 304: unchanged since the validators were issued
+
+
+# Search phrasing per event category; "concert" is the default search
+CATEGORY_SUFFIXES = {
+    "concert": "concert event schedule 콘서트 일정",
+    "fanmeeting": "fan meeting 팬미팅 일정",
+    "festival": "festival lineup 페스티벌 출연",
+    "broadcast": "broadcast 방송 출연 일정",
+}
+
+
+def build_query_variants(
+    query: str,
+    artists: Iterable[Sequence[str]] = (),
+    max_variants: int = 4,
+) -> List[str]:
+    """
+    Build full search queries for one user query.
+
+    In priority order: the query with the concert phrasing (the single
+    search done before variants), the query with each artist's other
+    known names (e.g. name_ko) swapped for the name it was matched by,
+    then the query with the other category phrasings. A name is only
+    ever replaced by an alias of the same artist.
+
+    Args:
+        query: User search query (e.g., "BTS 서울")
+        artists: Names/aliases of each artist in the query, best match
+            first (see ArtistService.get_artists_in_query)
+        max_variants: Max queries returned
+
+    Returns:
+        Distinct full queries, at least one
+    """
+    query = query.strip()
+
+    subjects = [query]
+    for artist in artists:
+        names = [name.strip() for name in artist if name and name.strip()]
+        in_query = [name for name in names if name.casefold() in query.casefold()]
+        for name in names:
+            if name in in_query:
+                continue
+            if in_query:
+                # Swap the matched name for the alias, keep the rest of the query
+                pattern = re.compile(re.escape(in_query[0]), re.IGNORECASE)
+                subjects.append(pattern.sub(name, query, count=1))
+            else:
+                subjects.append(name)
+
+    variants = [f"{subject} {CATEGORY_SUFFIXES['concert']}" for subject in subjects]
+    variants += [
+        f"{query} {suffix}"
+        for category, suffix in CATEGORY_SUFFIXES.items()
+        if category != "concert"
+    ]
+    return list(dict.fromkeys(variants))[: max(1, max_variants)]
+
+
+def merge_results(
+    result_lists: Iterable[List[WebSearchResult]],
+) -> List[WebSearchResult]:
+    """
+    Merge results of several searches, deduped by URL and ranked by score.
+
+    A URL found by several searches keeps its best score.
+    """
+    best: Dict[str, WebSearchResult] = {}
+    for results in result_lists:
+        for result in results:
+            key = result.url.rstrip("/")
+            if key not in best or result.score > best[key].score:
+                best[key] = result
+    return sorted(best.values(), key=lambda result: result.score, reverse=True)
 
 
 class TavilyCrawler:
@@ -42,48 +136,175 @@ class TavilyCrawler:
 
         Returns:
             List of search results with content
+
+        Raises:
+            UpstreamError: Tavily failed (after retries) or its circuit is open
+        """
+        return await self._search(
+            f"{query} {CATEGORY_SUFFIXES['concert']}",
+            max_results,
+            search_depth,
+            include_domains,
+        )
+
+    async def search_variants(
+        self,
+        query: str,
+        artists: Iterable[Sequence[str]] = (),
+        max_results: int = 10,
+        search_depth: str = "advanced",
+        include_domains: Optional[List[str]] = None,
+    ) -> Tuple[List[WebSearchResult], List[UpstreamError]]:
         """
+        Search several phrasings of a query concurrently and merge them.
+
+        Variants come from the artists' known names and event categories
+        (see build_query_variants, up to crawler_query_variants). Results
+        are deduped by URL and the best-scoring max_results are returned.
+
+        Args:
+            query: Search query
+            artists: Names/aliases of each artist in the query
+            max_results: Maximum number of merged results
+            search_depth: "basic" or "advanced"
+            include_domains: Limit to specific domains
+
+        Returns:
+            Tuple of (merged search results, best score first; errors of
+            the variants that failed, which make the results partial)
+
+        Raises:
+            UpstreamError: Every variant failed
+        """
+        variants = build_query_variants(query, artists, settings.crawler_query_variants)
+        outcomes = await asyncio.gather(
+            *(
+                self._search(variant, max_results, search_depth, include_domains)
+                for variant in variants
+            ),
+            return_exceptions=True,
+        )
+
+        result_lists = []
+        errors = []
+        for variant, outcome in zip(variants, outcomes):
+            if isinstance(outcome, UpstreamError):
+                print(f"Tavily search failed for '{variant}': {outcome}")
+                errors.append(outcome)
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                result_lists.append(outcome)
+
+        if errors and not result_lists:
+            raise errors[0]
+        return merge_results(result_lists)[:max_results], errors
+
+    async def _search(
+        self,
+        full_query: str,
+        max_results: int,
+        search_depth: str,
+        include_domains: Optional[List[str]],
+    ) -> List[WebSearchResult]:
+        """One Tavily search request for an already-phrased query."""
         if not self.api_key:
             # Return empty results if no API key (for testing)
             return []
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            payload = {
-                "api_key": self.api_key,
-                "query": f"{query} concert event schedule 콘서트 일정",
-                "search_depth": search_depth,
-                "max_results": max_results,
-                "include_answer": False,
-                "include_raw_content": False,
-            }
-
-            if include_domains:
-                payload["include_domains"] = include_domains
-
-            try:
-                response = await client.post(
-                    f"{self.BASE_URL}/search",
-                    json=payload,
+        payload = {
+            "api_key": self.api_key,
+            "query": full_query,
+            "search_depth": search_depth,
+            "max_results": max_results,
+            "include_answer": False,
+            "include_raw_content": settings.crawler_include_raw_content,
+        }
+
+        if include_domains:
+            payload["include_domains"] = include_domains
+
+        async def post() -> httpx.Response:
+            response = await clients.http.post(
+                f"{self.BASE_URL}/search",
+                json=payload,
+            )
+            response.raise_for_status()
+            return response
+
+        try:
+            response = await tavily_guard.call(post)
+            data = response.json()
+        except UpstreamError:
+            raise
+        except (httpx.HTTPError, ValueError) as e:
+            # Not retryable (e.g. 4xx, bad JSON), but still a failed search
+            raise UpstreamError("tavily", str(e)) from e
+
+        results = []
+        for item in data.get("results", []):
+            results.append(
+                WebSearchResult(
+                    title=item.get("title", ""),
+                    url=item.get("url", ""),
+                    content=item.get("content", ""),
+                    score=item.get("score", 0.0),
+                    raw_content=item.get("raw_content") or None,
                 )
-                response.raise_for_status()
-                data = response.json()
-
-                results = []
-                for item in data.get("results", []):
-                    results.append(
-                        WebSearchResult(
-                            title=item.get("title", ""),
-                            url=item.get("url", ""),
-                            content=item.get("content", ""),
-                            score=item.get("score", 0.0),
-                        )
-                    )
-                return results
-
-            except httpx.HTTPError as e:
-                # Log error and return empty results
-                print(f"Tavily API error: {e}")
-                return []
+            )
+        return results
+
+    async def fetch_page(
+        self,
+        url: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> Optional[FetchedPage]:
+        """
+        Fetch a page's HTML directly (Tavily returns extracted text only).
+
+        Used for pages whose structured data (e.g. JSON-LD) is parsed
+        without the LLM. Validators from an earlier fetch make it a
+        conditional GET, so an unchanged page comes back as not_modified
+        without a body.
+
+        Args:
+            url: Page URL
+            etag: ETag from the last fetch
+            last_modified: Last-Modified from the last fetch
+
+        Returns:
+            Fetched page, or None on any error or non-HTML response
+        """
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        try:
+            response = await clients.http.get(
+                url,
+                headers=headers,
+                follow_redirects=True,
+                timeout=settings.structured_fetch_timeout_seconds,
+            )
+            if response.status_code == 304:
+                return FetchedPage(
+                    etag=etag, last_modified=last_modified, not_modified=True
+                )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            print(f"Page fetch error for {url}: {e}")
+            return None
+
+        if "html" not in response.headers.get("content-type", "html"):
+            return None
+        return FetchedPage(
+            html=response.text,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
 
 
 # Singleton instance
@@ -0,0 +1,135 @@
+"""Near-duplicate detection of web results (SimHash) before LLM extraction."""
+
+from typing import List, NamedTuple, Optional, Set, Tuple
+import hashlib
+import re
+
+from app.rag.crawler import WebSearchResult
+from app.rag.stats import FilterStats
+
+near_duplicate_stats = FilterStats()
+
+FINGERPRINT_BITS = 64
+SHINGLE_WORDS = 3
+# Shorter texts share too few shingles for a meaningful fingerprint
+MIN_WORDS = 12
+
+_WORD = re.compile(r"\w+")
+_NUMBER = re.compile(r"\d+")
+
+
+class _Fingerprinted(NamedTuple):
+    """A kept result's fingerprint and what its copies are checked against."""
+
+    simhash: int
+    shingles: Set[str]
+    numbers: Set[str]
+
+
+def shingles(text: str, size: int = SHINGLE_WORDS) -> List[str]:
+    """Distinct overlapping word n-grams of case-folded text, in order."""
+    words = _WORD.findall(text.casefold())
+    if len(words) < size:
+        return [" ".join(words)] if words else []
+    return list(
+        dict.fromkeys(
+            " ".join(words[i : i + size]) for i in range(len(words) - size + 1)
+        )
+    )
+
+
+def simhash(text: str) -> Optional[int]:
+    """
+    64-bit SimHash of the text's word shingles.
+
+    Texts that differ only in boilerplate (bylines, share buttons, a
+    sentence or two) get fingerprints a few bits apart. Returns None for
+    texts too short to fingerprint reliably.
+    """
+    if len(_WORD.findall(text)) < MIN_WORDS:
+        return None
+
+    counts = [0] * FINGERPRINT_BITS
+    for shingle in shingles(text):
+        digest = hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest()
+        value = int.from_bytes(digest, "big")
+        for bit in range(FINGERPRINT_BITS):
+            counts[bit] += 1 if value >> bit & 1 else -1
+
+    return sum(1 << bit for bit, count in enumerate(counts) if count > 0)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two fingerprints."""
+    return bin(a ^ b).count("1")
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    """Jaccard similarity of two shingle sets."""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def _is_copy(
+    candidate: _Fingerprinted,
+    kept: _Fingerprinted,
+    min_similarity: float,
+) -> bool:
+    """
+    Whether a SimHash match is confirmed as a copy of a kept page.
+
+    SimHash only says two pages share most of their wording; pages built
+    from one template (a ticket site's page per tour date) do too. So the
+    shingle sets must also overlap by min_similarity, and the candidate
+    must not mention a number (date, time, price) the kept page doesn't.
+    """
+    return (
+        jaccard(candidate.shingles, kept.shingles) >= min_similarity
+        and candidate.numbers <= kept.numbers
+    )
+
+
+def drop_near_duplicates(
+    results: List[WebSearchResult],
+    max_distance: int,
+    min_similarity: float = 0.8,
+) -> Tuple[List[WebSearchResult], List[WebSearchResult]]:
+    """
+    Split web results into (kept, dropped) near-duplicates.
+
+    Each result whose fingerprint is within max_distance bits of an
+    earlier kept result, confirmed by shingle overlap and numbers (see
+    _is_copy), is dropped, so the first (best ranked) copy of a
+    syndicated article represents its cluster. Order is preserved; a
+    negative max_distance keeps everything.
+    """
+    if max_distance < 0:
+        near_duplicate_stats.record(len(results), 0)
+        return list(results), []
+
+    kept: List[WebSearchResult] = []
+    dropped: List[WebSearchResult] = []
+    fingerprints: List[_Fingerprinted] = []
+    for result in results:
+        fingerprint = simhash(result.text)
+        if fingerprint is None:
+            kept.append(result)
+            continue
+        candidate = _Fingerprinted(
+            fingerprint,
+            set(shingles(result.text)),
+            set(_NUMBER.findall(result.text)),
+        )
+        if any(
+            hamming_distance(fingerprint, other.simhash) <= max_distance
+            and _is_copy(candidate, other, min_similarity)
+            for other in fingerprints
+        ):
+            dropped.append(result)
+            continue
+        kept.append(result)
+        fingerprints.append(candidate)
+
+    near_duplicate_stats.record(len(kept), len(dropped))
+    return kept, dropped
@@ -1,71 +1,249 @@
 """OpenAI embeddings for vector search."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Union
+from array import array
+import asyncio
+import hashlib
+import re
+import time
+import unicodedata
+
 from openai import AsyncOpenAI
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 
+from app.clients import clients
 from app.config import settings
+from app.models import EMBEDDING_DIMENSION, EmbeddingCache
+from app.rag.batching import MicroBatcher
+from app.rag.cache import LRUCache
+from app.rag.resilience import openai_guard
+from app.rag.stats import CacheStats
+
+# Process-wide hit/miss counters (exposed via GET /stats)
+embedding_cache_stats = CacheStats()
 
 
 class EmbeddingsService:
-    """Generate embeddings using OpenAI API."""
+    """
+    Generate embeddings using OpenAI API.
+
+    Embeddings are cached by (model, normalized text hash) in two levels:
+    an in-process LRU and, when a DB session is given, the
+    embedding_caches table. Only misses are sent to OpenAI, and misses of
+    concurrent calls (e.g. one query embedding per search request) are
+    micro-batched into shared requests.
+    """
 
-    def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
-        self.client = AsyncOpenAI(api_key=api_key or settings.openai_api_key)
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: Optional[str] = None,
+        dimensions: Optional[int] = None,
+    ):
+        # Own client only for an explicit key; otherwise the shared pooled one
+        self._client = AsyncOpenAI(api_key=api_key) if api_key else None
         self.model = model or settings.openai_embedding_model
+        # None = the model's full size (text-embedding-3-small: 1536)
+        self.dimensions = (
+            settings.openai_embedding_dimensions if dimensions is None else dimensions
+        ) or None
+        # float32 arrays: ~2 KB per 512-dim vector instead of ~17 KB as list
+        self._memory_cache: LRUCache[array] = LRUCache(
+            settings.embedding_cache_max_entries
+        )
+        self._batcher: MicroBatcher[str, List[float]] = MicroBatcher(
+            self._create_embeddings,
+            settings.openai_embedding_batch_size,
+            settings.embedding_batch_window_ms / 1000,
+        )
 
-    async def get_embedding(self, text: str) -> List[float]:
+    @property
+    def client(self) -> AsyncOpenAI:
+        """OpenAI client for requests."""
+        return self._client or clients.openai
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """Normalize text for embedding: NFC, collapsed whitespace, max 8000 chars."""
+        text = unicodedata.normalize("NFC", text)
+        text = re.sub(r"\s+", " ", text).strip()
+        return text[:8000]
+
+    @staticmethod
+    def text_hash(text: str) -> str:
+        """Cache key component for an already-normalized text."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    async def get_embedding(
+        self,
+        text: str,
+        db: Optional[AsyncSession] = None,
+    ) -> List[float]:
         """
         Generate embedding for a single text.
 
         Args:
             text: Text to embed
+            db: Session for the persistent cache level (optional)
 
         Returns:
-            1536-dimensional embedding vector
+            Embedding vector of self.dimensions values
         """
-        if not settings.openai_api_key:
-            # Return zero vector for testing
-            return [0.0] * 1536
-
-        # Clean and truncate text
-        text = text.replace("\n", " ").strip()
-        if len(text) > 8000:
-            text = text[:8000]
+        return (await self.get_embeddings([text], db=db))[0]
 
-        response = await self.client.embeddings.create(
-            model=self.model,
-            input=text,
-        )
-
-        return response.data[0].embedding
-
-    async def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+    async def get_embeddings(
+        self,
+        texts: List[str],
+        db: Optional[AsyncSession] = None,
+    ) -> List[List[float]]:
         """
         Generate embeddings for multiple texts.
 
+        Cached vectors are served from memory, then from embedding_caches
+        (when db is given). Remaining unique texts wait up to
+        `embedding_batch_window_ms` for misses of concurrent calls and are
+        sent together in chunks of `openai_embedding_batch_size` inputs,
+        one API request per chunk. New vectors are written back
+        to both levels; the DB write is not committed.
+
         Args:
             texts: List of texts to embed
+            db: Session for the persistent cache level (optional)
 
         Returns:
-            List of 1536-dimensional embedding vectors
+            List of embedding vectors, in input order
         """
+        if not texts:
+            return []
+
         if not settings.openai_api_key:
-            return [[0.0] * 1536 for _ in texts]
-
-        # Clean and truncate texts
-        cleaned_texts = []
-        for text in texts:
-            text = text.replace("\n", " ").strip()
-            if len(text) > 8000:
-                text = text[:8000]
-            cleaned_texts.append(text)
-
-        response = await self.client.embeddings.create(
-            model=self.model,
-            input=cleaned_texts,
+            return [[0.0] * (self.dimensions or 1536) for _ in texts]
+
+        if self.dimensions != EMBEDDING_DIMENSION:
+            # embedding_caches only holds vectors of the column size
+            db = None
+
+        cleaned_texts = [self.normalize_text(text) for text in texts]
+        hashes = [self.text_hash(text) for text in cleaned_texts]
+
+        # Level 1: in-process LRU
+        found: Dict[str, array] = {}
+        for text_hash in dict.fromkeys(hashes):
+            vector = self._memory_cache.get(self._memory_key(text_hash))
+            if vector is not None:
+                found[text_hash] = vector
+
+        # Level 2: Postgres
+        if db is not None:
+            missing_hashes = [h for h in dict.fromkeys(hashes) if h not in found]
+            for text_hash, vector in (await self._load_cached(db, missing_hashes)).items():
+                found[text_hash] = vector
+                self._memory_cache.set(self._memory_key(text_hash), vector)
+
+        embedding_cache_stats.record_hits(len(found))
+
+        # Upstream: unique misses only
+        to_fetch = {
+            text_hash: text
+            for text_hash, text in zip(hashes, cleaned_texts)
+            if text_hash not in found
+        }
+        if to_fetch:
+            start_time = time.perf_counter()
+            vectors = await self._batcher.submit(list(to_fetch.values()))
+            elapsed = time.perf_counter() - start_time
+
+            new_vectors = {}
+            for text_hash, vector in zip(to_fetch, vectors):
+                embedding_cache_stats.record_miss(elapsed / len(to_fetch))
+                found[text_hash] = new_vectors[text_hash] = array("f", vector)
+                self._memory_cache.set(self._memory_key(text_hash), found[text_hash])
+
+            if db is not None:
+                await self._save_cached(db, new_vectors)
+
+        return [found[text_hash].tolist() for text_hash in hashes]
+
+    def _memory_key(self, text_hash: str) -> tuple:
+        return (self.model, self.dimensions, text_hash)
+
+    def batch_stats(self) -> dict:
+        """Micro-batching counters for the stats endpoint."""
+        return self._batcher.stats()
+
+    async def _create_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Call the embeddings API in chunks, preserving input order.
+
+        Raises UpstreamError if OpenAI keeps failing (see resilience).
+        """
+        batch_size = max(1, settings.openai_embedding_batch_size)
+        chunks = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+        responses = await asyncio.gather(
+            *(
+                openai_guard.call(
+                    lambda chunk=chunk: self.client.embeddings.create(
+                        **self._request_args(chunk)
+                    )
+                )
+                for chunk in chunks
+            )
         )
 
-        return [item.embedding for item in response.data]
+        embeddings: List[List[float]] = []
+        for response in responses:
+            # API returns items with an index; keep input order explicitly
+            items = sorted(response.data, key=lambda item: item.index)
+            embeddings.extend(item.embedding for item in items)
+        return embeddings
+
+    def _request_args(self, texts: List[str]) -> dict:
+        """embeddings.create arguments; `dimensions` shortens the output."""
+        args = {"model": self.model, "input": texts}
+        if self.dimensions:
+            args["dimensions"] = self.dimensions
+        return args
+
+    async def _load_cached(
+        self,
+        db: AsyncSession,
+        text_hashes: List[str],
+    ) -> Dict[str, array]:
+        """Fetch cached vectors from embedding_caches in one query."""
+        if not text_hashes:
+            return {}
+
+        result = await db.execute(
+            select(EmbeddingCache.text_hash, EmbeddingCache.embedding).where(
+                EmbeddingCache.model == self.model,
+                EmbeddingCache.text_hash.in_(text_hashes),
+            )
+        )
+        return {
+            text_hash: array("f", embedding)
+            for text_hash, embedding in result.all()
+        }
+
+    async def _save_cached(self, db: AsyncSession, vectors: Dict[str, array]) -> None:
+        """Write new vectors to embedding_caches with one multi-row INSERT."""
+        if not vectors:
+            return
+
+        await db.execute(
+            insert(EmbeddingCache).on_conflict_do_nothing(
+                index_elements=[EmbeddingCache.model, EmbeddingCache.text_hash]
+            ),
+            [
+                {
+                    "model": self.model,
+                    "text_hash": text_hash,
+                    "embedding": vector.tolist(),
+                }
+                for text_hash, vector in vectors.items()
+            ],
+        )
 
     def create_event_text(
         self,
@@ -93,5 +271,33 @@ class EmbeddingsService:
         return f"{artist_name} {title} {category} at {venue}, {city}, {country}"
 
 
+async def check_embedding_dimension(db: Union[AsyncSession, AsyncConnection]) -> None:
+    """
+    Fail fast if openai_embedding_dimensions doesn't match the database.
+
+    The embedding columns get their size from a migration (see 009), not
+    from settings; a mismatch would otherwise only surface as insert and
+    search errors.
+
+    Raises:
+        RuntimeError: If a column isn't halfvec(EMBEDDING_DIMENSION)
+    """
+    expected = f"halfvec({EMBEDDING_DIMENSION})"
+    for table in ("event_embeddings", "embedding_caches"):
+        column_type = await db.scalar(
+            text(
+                "SELECT format_type(atttypid, atttypmod) FROM pg_attribute "
+                "WHERE attrelid = CAST(:table AS regclass) AND attname = 'embedding'"
+            ),
+            {"table": table},
+        )
+        if column_type != expected:
+            raise RuntimeError(
+                f"{table}.embedding is {column_type}, but "
+                f"openai_embedding_dimensions={EMBEDDING_DIMENSION} needs {expected}; "
+                "add a migration altering the columns and run app.workers.reembed"
+            )
+
+
 # Singleton instance
 embeddings_service = EmbeddingsService()
@@ -1,14 +1,31 @@
 """LLM-based event information extractor using OpenAI."""
 
-from typing import List, Optional
-from datetime import datetime, date, time
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple, Type
+from datetime import date, time
 from decimal import Decimal
+import asyncio
+import hashlib
 import json
-from pydantic import BaseModel, Field
+from contextlib import nullcontext
+from time import perf_counter
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 from openai import AsyncOpenAI
 
+from app.clients import clients
 from app.config import settings
 from app.models.event import EventCategory
+from app.rag.chunking import split_content_tokens, truncate_tokens
+from app.rag.relevance import artist_terms
+from app.rag.resilience import UpstreamError, openai_guard
+from app.rag.stats import TierStats
+from app.rag.streaming import JsonArrayStream
+
+# Per-tier counters of the extraction cascade ("fast" = openai_extraction_model,
+# "strong" = openai_escalation_model)
+extraction_tier_stats: Dict[str, TierStats] = {
+    "fast": TierStats(),
+    "strong": TierStats(),
+}
 
 
 class ExtractedEvent(BaseModel):
@@ -32,10 +49,160 @@ class ExtractedEvent(BaseModel):
     confidence: float = Field(ge=0.0, le=1.0, description="Confidence score 0-1")
 
 
-EXTRACTION_PROMPT = """You are an expert at extracting concert and event information from web content.
-Extract all artist events (concerts, fanmeetings, broadcasts, festivals) from the following content.
+def event_key(event: ExtractedEvent) -> Tuple[str, str]:
+    """Key dedupe_events treats as the same event: (lowercased title, date)."""
+    return (event.title.lower(), event.event_date.isoformat())
+
+
+def dedupe_events(
+    events: Iterable[ExtractedEvent],
+    seen: Optional[Set[Tuple[str, str]]] = None,
+) -> List[ExtractedEvent]:
+    """
+    Deduplicate events by (lowercased title, date), keeping the first.
+
+    Args:
+        events: Events in priority order
+        seen: Keys already emitted; updated in place when given
+
+    Returns:
+        Events whose key was not seen before
+    """
+    if seen is None:
+        seen = set()
+
+    unique_events = []
+    for event in events:
+        key = event_key(event)
+        if key not in seen:
+            seen.add(key)
+            unique_events.append(event)
+    return unique_events
+
+
+def content_hash(content: str) -> str:
+    """SHA-256 hex digest of page content."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+# web_documents.scope column size
+MAX_SCOPE_LENGTH = 200
+
+
+def extraction_scope(query: str, artist_names: Iterable[str] = ()) -> str:
+    """
+    Who an extraction is about, for keying what is reused across searches.
+
+    Extraction prompts keep only events of the searched artist, so a
+    page's events depend on the artist as well as its content. The scope
+    is the artists' known names when the query matched any (so "BTS" and
+    "방탄소년단 콘서트" share it), else the query's non-generic words.
+    """
+    terms = sorted(artist_terms(query, artist_names))
+    return " ".join(terms)[:MAX_SCOPE_LENGTH]
+
+
+# Structured-output formats have no date/time "format"s; patterns instead
+FORMAT_PATTERNS = {
+    "date": r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$",
+    "time": r"^([01]\d|2[0-3]):[0-5]\d$",
+}
+
+
+def strict_json_schema(model: Type[BaseModel]) -> dict:
+    """
+    JSON schema of a pydantic model for OpenAI strict structured outputs.
+
+    Inlines $defs, drops title/default, makes every property required
+    (optional ones stay nullable) and forbids extra properties. Decimal
+    fields (number or string in pydantic) become plain numbers.
+    """
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+
+    def convert(node):
+        if isinstance(node, list):
+            return [convert(item) for item in node]
+        if not isinstance(node, dict):
+            return node
+        if "$ref" in node:
+            node = defs[node["$ref"].rsplit("/", 1)[-1]]
+
+        strict = {
+            key: convert(value)
+            for key, value in node.items()
+            if key not in ("title", "default", "properties")
+        }
+        if "properties" in node:
+            strict["properties"] = {
+                name: convert(value) for name, value in node["properties"].items()
+            }
+        if strict.get("format") in FORMAT_PATTERNS:
+            strict["pattern"] = FORMAT_PATTERNS[strict.pop("format")]
+        if "anyOf" in strict and {"type": "number"} in strict["anyOf"]:
+            strict["anyOf"] = [
+                option for option in strict["anyOf"] if option.get("type") != "string"
+            ]
+        if strict.get("type") == "object":
+            strict["required"] = list(strict.get("properties", {}))
+            strict["additionalProperties"] = False
+        return strict
+
+    return convert(schema)
 
-For each event, extract:
+
+# The LLM answers {"events": [<ExtractedEvent>, ...]}, enforced by the API
+EXTRACTION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "extracted_events",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "events": {
+                    "type": "array",
+                    "items": strict_json_schema(ExtractedEvent),
+                },
+            },
+            "required": ["events"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+_EVENT_LIST = TypeAdapter(List[ExtractedEvent])
+
+
+def validate_events(items: List[dict]) -> Tuple[List[ExtractedEvent], Set[int]]:
+    """
+    Validate LLM event objects in one batched pydantic pass.
+
+    Returns:
+        Tuple of (valid events in order, indices of the invalid items)
+    """
+    try:
+        return _EVENT_LIST.validate_python(items), set()
+    except ValidationError as e:
+        invalid = {error["loc"][0] for error in e.errors() if error["loc"]}
+        first = e.errors()[0]
+        print(
+            f"Dropping {len(invalid)} invalid extracted events "
+            f"(e.g. {first['loc']}: {first['msg']})"
+        )
+        valid = [item for index, item in enumerate(items) if index not in invalid]
+        return _EVENT_LIST.validate_python(valid), invalid
+
+
+# Bump whenever EXTRACTION_PROMPT (or how content is fed to it) changes so
+# cached extractions are not reused. The output format is enforced by
+# EXTRACTION_RESPONSE_FORMAT, so prompts carry no example output.
+EXTRACTION_PROMPT_VERSION = "v5"
+# Packed requests (PACKED_EXTRACTION_PROMPT) answer several pages at once
+# and are not escalated as a whole, so they are cached apart
+PACKED_PROMPT_VERSION = f"{EXTRACTION_PROMPT_VERSION}-packed"
+
+EVENT_FIELDS = """For each event, extract:
 - title: Event name
 - artist_name: Artist/group name
 - category: One of "concert", "fanmeeting", "broadcast", "festival"
@@ -52,10 +219,40 @@ For each event, extract:
 - ticket_url: Ticket purchase URL, if available
 - source_url: The URL this information came from
 - confidence: Your confidence in this extraction (0.0 to 1.0)
+"""
 
+EXTRACTION_PROMPT = (
+    """You are an expert at extracting concert and event information from web content.
+Extract all artist events (concerts, fanmeetings, broadcasts, festivals) from the following content.
+
+"""
+    + EVENT_FIELDS
+    + """
 Only extract events that are clearly about the searched artist.
 Skip events with unclear or incomplete information.
-Return a JSON array of events.
+Return them in the "events" array, with null for unknown optional fields.
+
+Search query: {query}
+Source URL: {source_url}
+
+Content:
+{content}"""
+)
+
+# Prompt for pages the rule-based extractor (app.rag.rules) partly
+# understood: its findings are passed along to be verified
+HINTED_EXTRACTION_PROMPT = (
+    """You are an expert at extracting concert and event information from web content.
+Extract all artist events (concerts, fanmeetings, broadcasts, festivals) from the following content.
+
+"""
+    + EVENT_FIELDS
+    + """
+Only extract events that are clearly about the searched artist.
+Skip events with unclear or incomplete information.
+
+Values found by pattern matching (verify them against the content; they may be incomplete):
+{hints}
 
 Search query: {query}
 Source URL: {source_url}
@@ -63,33 +260,96 @@ Source URL: {source_url}
 Content:
 {content}
 
-Return ONLY a valid JSON array. Example format:
-[
-  {{
-    "title": "BTS World Tour",
-    "artist_name": "BTS",
-    "category": "concert",
-    "event_date": "2024-03-15",
-    "event_time": "18:00",
-    "venue": "Seoul Olympic Stadium",
-    "city": "Seoul",
-    "country": "South Korea",
-    "timezone": "Asia/Seoul",
-    "price_currency": "KRW",
-    "price_min": 110000,
-    "price_max": 198000,
-    "source_url": "https://example.com",
-    "confidence": 0.9
-  }}
-]
+Return the events in the "events" array, with null for unknown optional fields."""
+)
+
+# Several short documents in one request; each is wrapped in markers
+# carrying its URL so events can be attributed back to their source
+PACKED_EXTRACTION_PROMPT = (
+    """You are an expert at extracting concert and event information from web content.
+Extract all artist events (concerts, fanmeetings, broadcasts, festivals) from the documents below.
+Each document starts with "=== DOCUMENT n: <url> ===" and ends with "=== END DOCUMENT n ===".
+
 """
+    + EVENT_FIELDS
+    + """
+Set source_url to the URL of the document the event was found in, copied exactly from its marker.
+Never combine information from different documents into one event.
+Only extract events that are clearly about the searched artist.
+Skip events with unclear or incomplete information.
+Return them in the "events" array, with null for unknown optional fields.
+
+Search query: {query}
+
+Documents:
+{documents}"""
+)
+
+DOCUMENT_MARKER = "=== DOCUMENT {index}: {source_url} ===\n{content}\n=== END DOCUMENT {index} ==="
 
 
 class EventExtractor:
-    """Extract event information from web content using GPT-4."""
+    """
+    Extract event information from web content using GPT-4.
+
+    Extraction is a cascade: the fast model answers first (with the
+    hinted prompt when there are rule hints), and answers with an
+    event below rag_escalation_confidence_threshold or an object that
+    fails validation are redone by the escalation model with the full
+    prompt.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: Optional[str] = None,
+        escalation_model: Optional[str] = None,
+    ):
+        # Own client only for an explicit key; otherwise the shared pooled one
+        self._client = AsyncOpenAI(api_key=api_key) if api_key else None
+        self.model = model or settings.openai_extraction_model
+        self.escalation_model = (
+            settings.openai_escalation_model
+            if escalation_model is None
+            else escalation_model
+        )
+
+    @property
+    def client(self) -> AsyncOpenAI:
+        """OpenAI client for requests."""
+        return self._client or clients.openai
+
+    @property
+    def available(self) -> bool:
+        """Whether extraction can call the LLM at all (API key configured)."""
+        return self._client is not None or bool(settings.openai_api_key)
+
+    def cache_key(
+        self,
+        source_url: str,
+        content: str,
+        scope: str = "",
+        prompt_version: str = EXTRACTION_PROMPT_VERSION,
+    ) -> str:
+        """
+        Cache key for an extraction result.
 
-    def __init__(self, api_key: Optional[str] = None):
-        self.client = AsyncOpenAI(api_key=api_key or settings.openai_api_key)
+        Covers everything that determines the LLM output: the source,
+        the content it sees, who it extracts for (scope, see
+        extraction_scope: only that artist's events are kept), the prompt
+        (EXTRACTION_PROMPT_VERSION or PACKED_PROMPT_VERSION) and the models.
+        """
+        raw = "\x1f".join(
+            [
+                source_url,
+                content_hash(content),
+                scope,
+                prompt_version,
+                self.model,
+                self.escalation_model,
+            ]
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
     async def extract_events(
         self,
@@ -108,94 +368,418 @@ class EventExtractor:
         Returns:
             List of extracted events
         """
-        if not settings.openai_api_key:
-            return []
+        return await self.try_extract_events(query, content, source_url) or []
+
+    async def try_extract_events(
+        self,
+        query: str,
+        content: str,
+        source_url: str,
+        hints: str = "",
+        dropped: Optional[Dict[str, int]] = None,
+        limit: Optional[asyncio.Semaphore] = None,
+    ) -> Optional[List[ExtractedEvent]]:
+        """
+        Extract events from web content using LLM.
+
+        Same as extract_events, but returns None instead of [] when the LLM
+        could not be asked (no API key, API error), so callers can tell
+        "no events on this page" apart from "no answer".
+
+        hints (see RuleExtraction.hints) switch to the hinted
+        prompt; they describe the whole page, so chunked pages ignore them.
+        Objects failing validation are counted in dropped[source_url].
+        limit, if given, is held for each LLM request (not for the whole
+        page), so a chunked page can't exceed the caller's concurrency.
+        """
+        if not self.available:
+            return None
+
+        # Long pages (e.g. full tour schedules) are split into chunks that
+        # are extracted concurrently, instead of truncating the content
+        chunks = self._chunks(content, source_url)
+        if len(chunks) == 1:
+            return await self._extract_chunk(
+                query, chunks[0], source_url, hints, dropped, limit
+            )
+
+        results = await asyncio.gather(
+            *(
+                self._extract_chunk(query, chunk, source_url, "", dropped, limit)
+                for chunk in chunks
+            )
+        )
+        if any(events is None for events in results):
+            # Partial answer: don't let it be cached as the page's result
+            return None
+
+        # Overlapping chunks can yield the same event twice
+        return dedupe_events(event for events in results for event in events)
+
+    async def stream_events(
+        self,
+        query: str,
+        content: str,
+        source_url: str,
+        hints: str = "",
+        dropped: Optional[Dict[str, int]] = None,
+        limit: Optional[asyncio.Semaphore] = None,
+    ) -> AsyncIterator[ExtractedEvent]:
+        """
+        Extract events from web content, yielding each one as soon as the
+        LLM has finished writing it.
+
+        Uses a streamed completion parsed with JsonArrayStream, so callers
+        can embed/store the first events while the rest is generated.
+        Chunks of long pages are streamed one after another. Events already
+        yielded can't be taken back, so doubtful events (below
+        rag_escalation_confidence_threshold while an escalation model is
+        configured) are held until the chunk is complete: if it escalates,
+        the escalation model's events take their place, otherwise (or if
+        escalation fails) they are yielded then. Confident events of an
+        escalated chunk stay, next to the escalation model's events.
+
+        Args:
+            query: Original search query
+            content: Web page content
+            source_url: URL of the source
+            hints: Rule-based findings (see try_extract_events)
+            dropped: Counts of invalid objects by source_url, updated in place
+            limit: Held for each LLM request (see try_extract_events)
+
+        Yields:
+            Validated events, without duplicates across chunks
+
+        Raises:
+            UpstreamError: If a request or its stream failed; events
+                already yielded are valid but the page's result is partial
+        """
+        if not self.available:
+            return
+
+        chunks = self._chunks(content, source_url)
+        seen: Set[Tuple[str, str]] = set()
+        for chunk in chunks:
+            prompt = self._build_prompt(
+                query, chunk, source_url, hints if len(chunks) == 1 else ""
+            )
+            chunk_events: List[ExtractedEvent] = []
+            held: List[ExtractedEvent] = []
+            invalid = 0
+            # Set again once the limit is acquired; this one covers failures
+            # while waiting for it
+            start_time = perf_counter()
+            try:
+                async with limit or nullcontext():
+                    start_time = perf_counter()
+                    stream = await openai_guard.call(
+                        lambda: self.client.chat.completions.create(
+                            **self._completion_args(prompt), stream=True
+                        )
+                    )
+                    parser = JsonArrayStream()
+                    async for part in stream:
+                        delta = part.choices[0].delta.content if part.choices else None
+                        if not delta:
+                            continue
+                        for item in parser.feed(delta):
+                            events, item_invalid = self._parse_events(
+                                [item], source_url, dropped
+                            )
+                            invalid += item_invalid
+                            chunk_events.extend(events)
+                            held.extend(filter(self._is_doubtful, events))
+                            confident = [e for e in events if not self._is_doubtful(e)]
+                            for event in dedupe_events(confident, seen):
+                                yield event
+            except Exception as e:
+                extraction_tier_stats["fast"].record_call(
+                    perf_counter() - start_time, failed=True
+                )
+                if isinstance(e, UpstreamError):
+                    raise
+                raise UpstreamError("openai", f"extraction stream failed: {e}") from e
 
-        prompt = EXTRACTION_PROMPT.format(
+            extraction_tier_stats["fast"].record_call(perf_counter() - start_time)
+            extraction_tier_stats["fast"].record_yield(len(chunk_events), invalid)
+            if self._needs_escalation(chunk_events, invalid):
+                escalated = await self._escalate(
+                    query, chunk, source_url, dropped, limit
+                )
+                if escalated is not None:
+                    held = escalated
+            for event in dedupe_events(held, seen):
+                yield event
+
+    def _chunks(self, content: str, source_url: str) -> List[str]:
+        """Split content into extraction chunks, at most rag_extraction_max_chunks."""
+        chunks = split_content_tokens(
+            content,
+            settings.rag_extraction_chunk_tokens,
+            settings.rag_extraction_chunk_overlap_tokens,
+        )
+        if len(chunks) > settings.rag_extraction_max_chunks:
+            print(
+                f"Extracting first {settings.rag_extraction_max_chunks} of "
+                f"{len(chunks)} chunks from {source_url}"
+            )
+            chunks = chunks[: settings.rag_extraction_max_chunks]
+        return chunks
+
+    @staticmethod
+    def _build_prompt(query: str, content: str, source_url: str, hints: str) -> str:
+        """Extraction prompt for one chunk; the hinted one if there are hints."""
+        content = truncate_tokens(content, settings.rag_extraction_chunk_tokens)
+        if hints:
+            return HINTED_EXTRACTION_PROMPT.format(
+                hints=hints,
+                query=query,
+                source_url=source_url,
+                content=content,
+            )
+        return EXTRACTION_PROMPT.format(
             query=query,
             source_url=source_url,
-            content=content[:8000],  # Limit content length
+            content=content,
         )
 
+    async def _extract_chunk(
+        self,
+        query: str,
+        content: str,
+        source_url: str,
+        hints: str = "",
+        dropped: Optional[Dict[str, int]] = None,
+        limit: Optional[asyncio.Semaphore] = None,
+    ) -> Optional[List[ExtractedEvent]]:
+        """Extract events from one chunk of content, escalating if needed."""
+        prompt = self._build_prompt(query, content, source_url, hints)
+
+        events_data = await self._request_tier("fast", prompt, limit)
+        if events_data is None:
+            return None
+
+        events, invalid = self._parse_events(events_data, source_url, dropped)
+        extraction_tier_stats["fast"].record_yield(len(events), invalid)
+        if not self._needs_escalation(events, invalid):
+            return events
+
+        escalated = await self._escalate(query, content, source_url, dropped, limit)
+        return events if escalated is None else escalated
+
+    def _escalation_enabled(self) -> bool:
+        """Whether doubtful answers can be redone by another model."""
+        return bool(self.escalation_model) and self.escalation_model != self.model
+
+    def _is_doubtful(self, event: ExtractedEvent) -> bool:
+        """Whether a fast-tier event alone makes its answer escalate."""
+        return (
+            self._escalation_enabled()
+            and event.confidence < settings.rag_escalation_confidence_threshold
+        )
+
+    def _needs_escalation(self, events: List[ExtractedEvent], invalid: int) -> bool:
+        """Whether a fast-tier answer should be redone by the escalation model."""
+        if not self._escalation_enabled():
+            return False
+        return invalid > 0 or any(self._is_doubtful(event) for event in events)
+
+    async def _escalate(
+        self,
+        query: str,
+        content: str,
+        source_url: str,
+        dropped: Optional[Dict[str, int]] = None,
+        limit: Optional[asyncio.Semaphore] = None,
+    ) -> Optional[List[ExtractedEvent]]:
+        """
+        Extract with the escalation model and the full prompt.
+
+        Returns None if it didn't answer; callers then keep the fast answer.
+        """
+        extraction_tier_stats["fast"].escalated += 1
+        events_data = await self._request_tier(
+            "strong",
+            self._build_prompt(query, content, source_url, ""),
+            limit,
+        )
+        if events_data is None:
+            return None
+
+        events, invalid = self._parse_events(events_data, source_url, dropped)
+        extraction_tier_stats["strong"].record_yield(len(events), invalid)
+        return events
+
+    @staticmethod
+    def _parse_events(
+        events_data: List[dict],
+        source_url: str,
+        dropped: Optional[Dict[str, int]] = None,
+    ) -> Tuple[List[ExtractedEvent], int]:
+        """
+        Valid events of an answer and the number of invalid objects.
+
+        Invalid objects are also counted in dropped[source_url], if given.
+        """
+        events, invalid = validate_events(
+            [{**item, "source_url": source_url} for item in events_data]
+        )
+        if invalid and dropped is not None:
+            dropped[source_url] = dropped.get(source_url, 0) + len(invalid)
+        return events, len(invalid)
+
+    async def try_extract_packed(
+        self,
+        query: str,
+        documents: List[Tuple[str, str]],
+        dropped: Optional[Dict[str, int]] = None,
+        limit: Optional[asyncio.Semaphore] = None,
+    ) -> Optional[List[List[ExtractedEvent]]]:
+        """
+        Extract events from several short documents with one LLM call.
+
+        Each document is wrapped in markers carrying its source URL, and
+        events are attributed back by the source_url the LLM reports.
+        Events naming a URL that isn't one of the documents are dropped.
+
+        Args:
+            query: Original search query
+            documents: (source_url, content) pairs
+            dropped: Counts of invalid objects by source_url, updated in place
+            limit: Held for each LLM request (see try_extract_events)
+
+        Returns:
+            Events per document, in documents order; None if the LLM
+            could not be asked (no API key, API error)
+        """
+        if not self.available:
+            return None
+
+        prompt = PACKED_EXTRACTION_PROMPT.format(
+            query=query,
+            documents="\n\n".join(
+                DOCUMENT_MARKER.format(
+                    index=index, source_url=source_url, content=content
+                )
+                for index, (source_url, content) in enumerate(documents, start=1)
+            ),
+        )
+
+        events_data = await self._request_tier("fast", prompt, limit)
+        if events_data is None:
+            return None
+
+        positions = {
+            source_url.rstrip("/"): position
+            for position, (source_url, _) in enumerate(documents)
+        }
+        items_per_document: List[List[dict]] = [[] for _ in documents]
+        for item in events_data:
+            reported_url = str(item.get("source_url") or "").strip().rstrip("/")
+            position = positions.get(reported_url)
+            if position is None:
+                print(f"Dropping packed event with unknown source: {reported_url}")
+                continue
+            items_per_document[position].append(item)
+
+        events: List[List[ExtractedEvent]] = []
+        invalid: List[int] = []
+        for (source_url, _), items in zip(documents, items_per_document):
+            document_events, document_invalid = self._parse_events(
+                items, source_url, dropped
+            )
+            events.append(document_events)
+            invalid.append(document_invalid)
+        extraction_tier_stats["fast"].record_yield(
+            sum(len(doc_events) for doc_events in events), sum(invalid)
+        )
+
+        # Documents with doubtful answers are escalated one by one
+        to_escalate = [
+            position
+            for position in range(len(documents))
+            if self._needs_escalation(events[position], invalid[position])
+        ]
+        escalated = await asyncio.gather(
+            *(
+                self._escalate(
+                    query,
+                    documents[position][1],
+                    documents[position][0],
+                    dropped,
+                    limit,
+                )
+                for position in to_escalate
+            )
+        )
+        for position, escalated_events in zip(to_escalate, escalated):
+            if escalated_events is not None:
+                events[position] = escalated_events
+        return events
+
+    async def _request_tier(
+        self,
+        tier: str,
+        prompt: str,
+        limit: Optional[asyncio.Semaphore] = None,
+    ) -> Optional[List[dict]]:
+        """_request_events with the tier's model, recording its latency."""
+        model = self.model if tier == "fast" else self.escalation_model
+        async with limit or nullcontext():
+            start_time = perf_counter()
+            events_data = await self._request_events(prompt, model)
+        extraction_tier_stats[tier].record_call(
+            perf_counter() - start_time, failed=events_data is None
+        )
+        return events_data
+
+    async def _request_events(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+    ) -> Optional[List[dict]]:
+        """
+        Send an extraction prompt and return the raw event objects.
+
+        Goes through the OpenAI rate limiter / retries / circuit breaker.
+        Returns None on API or JSON errors.
+        """
         try:
-            response = await self.client.chat.completions.create(
-                model="gpt-4o-mini",  # Cost-effective for extraction
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an event extraction assistant. Always respond with valid JSON.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.1,
-                response_format={"type": "json_object"},
+            response = await openai_guard.call(
+                lambda: self.client.chat.completions.create(
+                    **self._completion_args(prompt, model)
+                )
             )
 
-            content = response.choices[0].message.content
-            if not content:
+            message = response.choices[0].message
+            if getattr(message, "refusal", None):
+                print(f"OpenAI extraction refused: {message.refusal}")
+                return []
+            if not message.content:
                 return []
 
-            # Parse JSON response
-            data = json.loads(content)
-
-            # Handle both array and object with array
-            events_data = data if isinstance(data, list) else data.get("events", [])
-
-            events = []
-            for item in events_data:
-                try:
-                    # Parse date
-                    event_date = datetime.strptime(
-                        item["event_date"], "%Y-%m-%d"
-                    ).date()
-
-                    # Parse time if present
-                    event_time = None
-                    if item.get("event_time"):
-                        try:
-                            event_time = datetime.strptime(
-                                item["event_time"], "%H:%M"
-                            ).time()
-                        except ValueError:
-                            pass
-
-                    # Create event
-                    event = ExtractedEvent(
-                        title=item["title"],
-                        artist_name=item["artist_name"],
-                        category=EventCategory(item["category"]),
-                        event_date=event_date,
-                        event_time=event_time,
-                        venue=item["venue"],
-                        address=item.get("address"),
-                        city=item["city"],
-                        country=item["country"],
-                        timezone=item.get("timezone", "Asia/Seoul"),
-                        price_currency=item.get("price_currency"),
-                        price_min=(
-                            Decimal(str(item["price_min"]))
-                            if item.get("price_min")
-                            else None
-                        ),
-                        price_max=(
-                            Decimal(str(item["price_max"]))
-                            if item.get("price_max")
-                            else None
-                        ),
-                        ticket_url=item.get("ticket_url"),
-                        source_url=source_url,
-                        confidence=float(item.get("confidence", 0.5)),
-                    )
-                    events.append(event)
-                except (KeyError, ValueError) as e:
-                    print(f"Error parsing event: {e}")
-                    continue
-
-            return events
+            # The schema guarantees {"events": [{...}, ...]}
+            return json.loads(message.content)["events"]
 
         except Exception as e:
             print(f"OpenAI extraction error: {e}")
-            return []
+            return None
+
+    def _completion_args(self, prompt: str, model: Optional[str] = None) -> dict:
+        """Chat completion arguments for an extraction prompt."""
+        return {
+            # gpt-4o-mini by default: cost-effective
+            "model": model or self.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are an event extraction assistant. Always respond with valid JSON.",
+                },
+                {"role": "user", "content": prompt},
+            ],
+            "temperature": 0.1,
+            "response_format": EXTRACTION_RESPONSE_FORMAT,
+        }
 
 
 # Singleton instance
@@ -0,0 +1,67 @@
+"""
+Deterministic event parsers for pages with structured data.
+
+Pages a parser handles are turned into ExtractedEvent objects without the
+LLM. Add a site by subclassing PageParser (or JsonLdEventParser) and
+passing an instance to register_parser().
+"""
+
+from typing import List, Optional
+
+from app.rag.extractor import ExtractedEvent
+from app.rag.parsers.base import PageParser, url_domain
+from app.rag.parsers.jsonld import JsonLdEventParser
+from app.rag.parsers.sites import InterparkParser, MelonTicketParser, TicketlinkParser
+
+_parsers: List[PageParser] = [
+    TicketlinkParser(),
+    MelonTicketParser(),
+    InterparkParser(),
+]
+
+# Any other page that happens to come with HTML
+_fallback_parser = JsonLdEventParser()
+
+
+def register_parser(parser: PageParser) -> None:
+    """Add a site parser; later registrations take precedence."""
+    _parsers.insert(0, parser)
+
+
+def parser_for(url: str) -> Optional[PageParser]:
+    """Site parser for the URL, if any."""
+    return next((parser for parser in _parsers if parser.handles(url)), None)
+
+
+def parse_structured_events(
+    url: str,
+    html: str,
+    artist_hint: Optional[str] = None,
+) -> Optional[List[ExtractedEvent]]:
+    """
+    Extract events from HTML with the site's parser (or generic JSON-LD).
+
+    Returns:
+        Events, or None if no parser found any (the LLM should handle it)
+    """
+    parser = parser_for(url) or _fallback_parser
+    try:
+        events = parser.parse(url, html, artist_hint)
+    except Exception as e:
+        # A broken page must not break the search; let the LLM try instead
+        print(f"Structured parsing error for {url}: {e}")
+        return None
+    return events or None
+
+
+__all__ = [
+    "PageParser",
+    "JsonLdEventParser",
+    "TicketlinkParser",
+    "MelonTicketParser",
+    "InterparkParser",
+    "url_domain",
+    "register_parser",
+    "parser_for",
+    "parse_structured_events",
+]
@@ -0,0 +1,51 @@
+"""Base class for deterministic page parsers."""
+
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+from urllib.parse import urlparse
+
+from app.rag.extractor import ExtractedEvent
+
+
+def url_domain(url: str) -> str:
+    """Lowercased host of a URL without a leading "www."."""
+    host = (urlparse(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+class PageParser(ABC):
+    """
+    Extracts events from a page's HTML without the LLM.
+
+    Subclasses set `domains` (matched against the URL host and its parent
+    domains) and implement parse(). Defaults fill in what structured data
+    usually leaves out, e.g. the country of a Korean ticketing site.
+    """
+
+    domains: Tuple[str, ...] = ()
+    default_country: str = ""
+    default_timezone: str = "Asia/Seoul"
+
+    def handles(self, url: str) -> bool:
+        """Whether this parser is meant for the URL's site."""
+        host = url_domain(url)
+        return any(host == d or host.endswith(f".{d}") for d in self.domains)
+
+    @abstractmethod
+    def parse(
+        self,
+        url: str,
+        html: str,
+        artist_hint: Optional[str] = None,
+    ) -> List[ExtractedEvent]:
+        """
+        Extract events from HTML.
+
+        Args:
+            url: Page URL (becomes source_url)
+            html: Page HTML
+            artist_hint: Artist name to use when the page doesn't name one
+
+        Returns:
+            Events found; [] if the page has nothing this parser understands
+        """
@@ -0,0 +1,180 @@
+"""schema.org Event parser for JSON-LD embedded in HTML."""
+
+from typing import Any, Iterator, List, Optional
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from zoneinfo import ZoneInfo
+import html as html_lib
+import json
+import re
+
+from app.models.event import EventCategory
+from app.rag.extractor import ExtractedEvent
+from app.rag.parsers.base import PageParser
+
+JSONLD_SCRIPT = re.compile(
+    r"<script[^>]*type\s*=\s*[\"']application/ld\+json[\"'][^>]*>(.*?)</script>",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# schema.org Event subtypes we collect
+EVENT_TYPES = {
+    "Event",
+    "MusicEvent",
+    "Festival",
+    "TheaterEvent",
+    "ComedyEvent",
+    "DanceEvent",
+    "SocialEvent",
+    "BroadcastEvent",
+    "ScreeningEvent",
+}
+
+FANMEETING_WORDS = ("팬미팅", "fan meeting", "fanmeeting", "fan-meeting", "팬콘")
+
+
+def _types(node: dict) -> List[str]:
+    value = node.get("@type", [])
+    return [value] if isinstance(value, str) else [v for v in value if isinstance(v, str)]
+
+
+def _walk(data: Any) -> Iterator[dict]:
+    """Yield every JSON object in a JSON-LD document (lists, @graph, nesting)."""
+    if isinstance(data, list):
+        for item in data:
+            yield from _walk(item)
+    elif isinstance(data, dict):
+        yield data
+        for value in data.values():
+            if isinstance(value, (list, dict)):
+                yield from _walk(value)
+
+
+def _first(value: Any) -> Any:
+    """First element of a list, or the value itself."""
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
+def _text(value: Any) -> Optional[str]:
+    """Plain string for a JSON-LD value that may be a string or {"name": ...}."""
+    value = _first(value)
+    if isinstance(value, dict):
+        value = value.get("name")
+    if value is None:
+        return None
+    text = html_lib.unescape(str(value)).strip()
+    return text or None
+
+
+def _decimal(value: Any) -> Optional[Decimal]:
+    if value is None or value == "":
+        return None
+    try:
+        return Decimal(str(value).replace(",", ""))
+    except InvalidOperation:
+        return None
+
+
+def _category(node: dict, title: str) -> EventCategory:
+    types = _types(node)
+    lowered = title.lower()
+    if any(word in lowered for word in FANMEETING_WORDS):
+        return EventCategory.FANMEETING
+    if "Festival" in types:
+        return EventCategory.FESTIVAL
+    if "BroadcastEvent" in types:
+        return EventCategory.BROADCAST
+    return EventCategory.CONCERT
+
+
+class JsonLdEventParser(PageParser):
+    """
+    Builds events from schema.org Event objects in JSON-LD.
+
+    Works on any site that embeds them; site subclasses only add domains
+    and defaults. Events without a name, start date or venue are skipped.
+    """
+
+    def parse(
+        self,
+        url: str,
+        html: str,
+        artist_hint: Optional[str] = None,
+    ) -> List[ExtractedEvent]:
+        events = []
+        for block in JSONLD_SCRIPT.findall(html):
+            try:
+                data = json.loads(block.strip())
+            except json.JSONDecodeError:
+                continue
+            for node in _walk(data):
+                if EVENT_TYPES.intersection(_types(node)):
+                    event = self._to_event(node, url, artist_hint)
+                    if event:
+                        events.append(event)
+        return events
+
+    def _to_event(
+        self,
+        node: dict,
+        url: str,
+        artist_hint: Optional[str],
+    ) -> Optional[ExtractedEvent]:
+        title = _text(node.get("name"))
+        start = _text(node.get("startDate"))
+        location = _first(node.get("location")) or {}
+        if isinstance(location, str):
+            location = {"name": location}
+        venue = _text(location.get("name"))
+        artist_name = _text(node.get("performer")) or artist_hint
+        if not (title and start and venue and artist_name):
+            return None
+
+        try:
+            start_at = datetime.fromisoformat(start.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if start_at.tzinfo is not None:
+            # Date and time are stored as local to the event's timezone
+            start_at = start_at.astimezone(ZoneInfo(self.default_timezone))
+        has_time = "T" in start or " " in start
+
+        address = _first(location.get("address")) or {}
+        if isinstance(address, str):
+            address = {"streetAddress": address}
+
+        offers = [o for o in _walk(node.get("offers", [])) if "price" in o or "lowPrice" in o]
+        prices = [
+            price
+            for offer in offers
+            for price in (
+                _decimal(offer.get("price")),
+                _decimal(offer.get("lowPrice")),
+                _decimal(offer.get("highPrice")),
+            )
+            if price is not None
+        ]
+        first_offer = offers[0] if offers else {}
+
+        return ExtractedEvent(
+            title=title,
+            artist_name=artist_name,
+            category=_category(node, title),
+            event_date=start_at.date(),
+            event_time=start_at.time() if has_time else None,
+            venue=venue,
+            address=_text(address.get("streetAddress")),
+            city=_text(address.get("addressLocality"))
+            or _text(address.get("addressRegion"))
+            or "",
+            country=_text(address.get("addressCountry")) or self.default_country,
+            timezone=self.default_timezone,
+            price_currency=_text(first_offer.get("priceCurrency")),
+            price_min=min(prices) if prices else None,
+            price_max=max(prices) if prices else None,
+            ticket_url=_text(first_offer.get("url")) or url,
+            source_url=url,
+            confidence=0.95,
+        )
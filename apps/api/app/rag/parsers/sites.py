@@ -0,0 +1,22 @@
+"""Parsers for ticketing sites known to embed schema.org Event data."""
+
+from app.rag.parsers.jsonld import JsonLdEventParser
+
+
+class KoreanTicketingParser(JsonLdEventParser):
+    """JSON-LD events from Korean ticketing sites (KRW, Asia/Seoul)."""
+
+    default_country = "South Korea"
+    default_timezone = "Asia/Seoul"
+
+
+class TicketlinkParser(KoreanTicketingParser):
+    domains = ("ticketlink.co.kr",)
+
+
+class MelonTicketParser(KoreanTicketingParser):
+    domains = ("ticket.melon.com", "melon.com")
+
+
+class InterparkParser(KoreanTicketingParser):
+    domains = ("interpark.com", "nol.interpark.com", "tickets.interpark.com")
@@ -1,16 +1,66 @@
 """RAG Pipeline: combines crawler, extractor, and embeddings."""
 
-from typing import List, Tuple
+from typing import AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
 from datetime import datetime
 from uuid import UUID
+import asyncio
+import time
 
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.rag.crawler import crawler, WebSearchResult
-from app.rag.extractor import extractor, ExtractedEvent
+from app.config import settings
+from app.rag.batching import window_batches
+from app.rag.chunking import count_tokens, pack_documents
+from app.rag.compaction import compact_content, compaction_stats
+from app.rag.crawler import crawler, FetchedPage, WebSearchResult
+from app.rag.dedup import drop_near_duplicates
+from app.rag.parsers import parse_structured_events, parser_for
+from app.rag.extractor import (
+    extractor,
+    ExtractedEvent,
+    EXTRACTION_PROMPT_VERSION,
+    PACKED_PROMPT_VERSION,
+    content_hash,
+    dedupe_events,
+    event_key,
+    extraction_scope,
+)
 from app.rag.embeddings import embeddings_service
-from app.models import Event, EventEmbedding, Artist
+from app.rag.relevance import artist_terms, filter_relevant, mentions_artist
+from app.rag.resilience import UpstreamError
+from app.rag.rules import extract_with_rules, rule_extraction_stats
+from app.rag.timing import StageTimings
+from app.models import Event, EventEmbedding, Artist, WebDocument
+from app.models.event import make_event_natural_key
 from app.services.artist import ArtistService
+from app.services.extraction_cache import (
+    ExtractionCacheService,
+    extraction_cache_stats,
+)
+from app.services.web_document import DocumentVersion, WebDocumentService
+
+
+# Columns refreshed when a re-collected event hits an existing natural key
+EVENT_REFRESH_COLUMNS = (
+    "title",
+    "category",
+    "artist_name",
+    "event_time",
+    "timezone",
+    "venue",
+    "address",
+    "city",
+    "country",
+    "price_currency",
+    "price_min",
+    "price_max",
+    "ticket_url",
+    "source",
+    "source_url",
+    "collected_at",
+)
 
 
 class RAGPipeline:
@@ -19,14 +69,51 @@ class RAGPipeline:
 
     Flow:
     1. Web search (Tavily)
-    2. LLM extraction (GPT-4)
-    3. Embeddings generation (OpenAI)
-    4. Store in database (PostgreSQL + pgvector)
+    2. Local relevance pre-filter
+    3. Near-duplicate (syndicated) pages reduced to one copy
+    4. Skip pages unchanged since the last crawl (web_documents)
+    5. Structured data parsing (JSON-LD, no LLM)
+    6. Rule-based extraction (dates/times/prices/known venues, no LLM)
+    7. LLM extraction (GPT-4) for the remaining pages
+    8. Embeddings generation (OpenAI)
+    9. Store in database (PostgreSQL + pgvector)
     """
 
     def __init__(self, db: AsyncSession):
         self.db = db
         self.artist_service = ArtistService(db)
+        self.extraction_cache = ExtractionCacheService(db)
+        self.web_documents = WebDocumentService(db)
+        # Stage breakdown of the current/last run
+        self.timings = StageTimings()
+        # Upstream failures in the current/last run; such runs must not be
+        # cached as if the web had nothing to offer
+        self.upstream_errors: List[str] = []
+        # (cache_key, source_url, content, prompt_version, events) awaiting
+        # a cache write
+        self._pending_extractions: List[
+            Tuple[str, str, str, str, List[ExtractedEvent]]
+        ] = []
+        # Rule-based findings for pages left to the LLM, by URL
+        self._rule_hints: Dict[str, str] = {}
+        self._reset_documents()
+
+    def _reset_documents(self) -> None:
+        """Clear the per-run web document state."""
+        # Known documents for this run's results, by URL
+        self._documents: Dict[str, WebDocument] = {}
+        # New/changed pages being extracted; recorded after storing
+        self._changed_documents: Dict[str, DocumentVersion] = {}
+        # Unchanged pages whose stored events are still to be returned
+        self._unchanged_documents: List[WebDocument] = []
+        # Unchanged pages to mark as seen
+        self._unchanged_urls: List[str] = []
+        # Events extracted from each page before dedup, by URL
+        self._page_events: Dict[str, List[ExtractedEvent]] = {}
+        # Stored event ID of each event_key passed to store_events
+        self._stored_event_ids: Dict[Tuple[str, str], UUID] = {}
+        # Who this run extracts events for (see extraction_scope)
+        self._scope = ""
 
     async def search_and_extract(
         self,
@@ -43,32 +130,749 @@ class RAGPipeline:
         Returns:
             List of extracted events
         """
-        # Step 1: Web search
-        web_results = await crawler.search(query, max_results=max_web_results)
+        # Steps 1-4: Web search, relevance pre-filter, near-duplicates,
+        # unchanged pages
+        artist_names, web_results = await self._collect_sources(
+            query, max_web_results
+        )
+
+        # Step 5: Parse pages with structured data (JSON-LD) without the LLM
+        structured_events, web_results = await self._parse_structured(
+            query, web_results, artist_names
+        )
 
+        # Step 6: Pages the rules understand confidently skip the LLM too
+        rule_events, web_results = self._extract_with_rules(web_results, artist_names)
         if not web_results:
-            return []
+            return dedupe_events([*structured_events, *rule_events])
+
+        # Step 7: Strip what the LLM doesn't need from the remaining pages
+        web_results = self._compact_results(web_results)
+
+        # Step 8: Extract events from the remaining results concurrently.
+        # Unchanged pages are served from the extraction cache; short ones
+        # share a request.
+        cache_keys, cached = await self._load_extraction_cache(web_results)
+        groups = self._plan_extraction(web_results, cache_keys, cached)
+        semaphore = self._extraction_semaphore()
+        with self.timings.stage("extract"):
+            group_results = await asyncio.gather(
+                *(
+                    self._extract_group(
+                        query,
+                        [(web_results[i], cache_keys[i]) for i in group],
+                        cached,
+                        semaphore,
+                    )
+                    for group in groups
+                )
+            )
+        await self._save_extraction_cache()
+
+        # Back to web result order, so dedup below stays deterministic
+        results: Dict[int, List[ExtractedEvent]] = {}
+        for group, events_per_source in zip(groups, group_results):
+            results.update(zip(group, events_per_source))
+
+        # Deduplicate by title + date; structured data wins over the LLM,
+        # and the LLM over the rules
+        return dedupe_events(
+            [
+                *structured_events,
+                *(event for index in sorted(results) for event in results[index]),
+                *rule_events,
+            ]
+        )
+
+    async def iter_extracted(
+        self,
+        query: str,
+        max_web_results: int = 10,
+    ) -> AsyncIterator[List[ExtractedEvent]]:
+        """
+        Search web and yield extracted events per source as each finishes.
+
+        Same dedup semantics as search_and_extract, but batches arrive in
+        completion order so callers can act before the slowest source.
+        With rag_extraction_streaming, a source extracted by the LLM yields
+        each event as soon as the model has written it. Pages unchanged
+        since the last crawl are skipped here too.
+
+        Args:
+            query: Search query
+            max_web_results: Max web search results
+
+        Yields:
+            Lists of newly seen extracted events, one per finished source
+            (or group of packed sources) or streamed event
+        """
+        artist_names, web_results = await self._collect_sources(
+            query, max_web_results
+        )
+
+        seen: Set[Tuple[str, str]] = set()
+        structured_events, web_results = await self._parse_structured(
+            query, web_results, artist_names
+        )
+        if structured_events:
+            yield dedupe_events(structured_events, seen)
+
+        rule_events, web_results = self._extract_with_rules(web_results, artist_names)
+        if rule_events:
+            yield dedupe_events(rule_events, seen)
+        if not web_results:
+            return
+
+        web_results = self._compact_results(web_results)
+        cache_keys, cached = await self._load_extraction_cache(web_results)
+        groups = self._plan_extraction(web_results, cache_keys, cached)
+        semaphore = self._extraction_semaphore()
+
+        # Groups put their events here when done (streamed sources also put
+        # each event as it arrives), then None
+        batches: asyncio.Queue = asyncio.Queue()
+
+        async def extract(group: List[int]) -> None:
+            try:
+                events_per_source = await self._extract_group(
+                    query,
+                    [(web_results[i], cache_keys[i]) for i in group],
+                    cached,
+                    semaphore,
+                    emit=batches.put_nowait,
+                )
+                batches.put_nowait(
+                    [event for events in events_per_source for event in events]
+                )
+            finally:
+                batches.put_nowait(None)
 
-        # Step 2: Extract events from each result
-        all_events: List[ExtractedEvent] = []
+        tasks = [asyncio.create_task(extract(group)) for group in groups]
+        extract_start = time.perf_counter()
+        try:
+            running = len(tasks)
+            while running:
+                batch = await batches.get()
+                if batch is None:
+                    running -= 1
+                    continue
+                events = dedupe_events(batch, seen)
+                if events:
+                    yield events
+            # Re-raise anything a group failed with
+            await asyncio.gather(*tasks)
+        finally:
+            # Includes time the consumer spent between batches
+            self.timings.add("extract", time.perf_counter() - extract_start)
+            # Client went away or caller stopped early
+            for task in tasks:
+                task.cancel()
+
+        await self._save_extraction_cache()
+
+    async def _collect_sources(
+        self,
+        query: str,
+        max_web_results: int,
+    ) -> Tuple[List[str], List[WebSearchResult]]:
+        """
+        Find the web results worth extracting for a query.
+
+        Web search (query variants from the artist's known names), then
+        the relevance pre-filter and near-duplicate removal, then pages
+        unchanged since the last crawl are set aside (see _skip_unchanged).
+
+        Returns:
+            Tuple of (artist names/aliases in the query, web results)
+        """
+        self._reset_documents()
+        artists = await self._artists(query)
+        artist_names = [name for names in artists for name in names]
+        self._scope = extraction_scope(query, artist_names)
+        web_results = await self._crawl(query, artists, max_web_results)
+
+        # Drop results unlikely to contain events before paying for LLM
+        web_results = self._filter_relevant(query, artist_names, web_results)
+
+        # Extract one copy of syndicated articles
+        web_results = self._drop_near_duplicates(web_results)
+
+        web_results = await self._skip_unchanged(web_results)
+        return artist_names, web_results
+
+    async def _artists(self, query: str) -> List[List[str]]:
+        """Known names/aliases (name, name_ko) of each artist in the query."""
+        with self.timings.stage("artists"):
+            return await self.artist_service.get_artists_in_query(query)
+
+    async def _crawl(
+        self,
+        query: str,
+        artists: List[List[str]],
+        max_web_results: int,
+    ) -> List[WebSearchResult]:
+        """
+        Web search; failed searches are recorded and yield no results.
+
+        A failed query variant is recorded too: the merged results are
+        partial, so the search mustn't be cached as complete.
+        """
+        with self.timings.stage("crawl"):
+            try:
+                web_results, errors = await crawler.search_variants(
+                    query, artists, max_results=max_web_results
+                )
+            except UpstreamError as e:
+                print(f"Web search failed: {e}")
+                self.upstream_errors.append(str(e))
+                return []
+        self.upstream_errors.extend(str(e) for e in errors)
+        return web_results
+
+    def _filter_relevant(
+        self,
+        query: str,
+        artist_names: List[str],
+        web_results: List[WebSearchResult],
+    ) -> List[WebSearchResult]:
+        """
+        Keep web results that score at least rag_relevance_threshold.
+
+        Scoring is local (artist names/aliases, dates, venue/price wording,
+        Tavily score), so every skipped page saves an LLM round-trip.
+        """
+        if not web_results or settings.rag_relevance_threshold <= 0:
+            return web_results
+
+        with self.timings.stage("relevance"):
+            kept, skipped = filter_relevant(
+                web_results,
+                artist_terms(query, artist_names),
+                settings.rag_relevance_threshold,
+            )
+
+        if skipped:
+            print(
+                f"Relevance filter skipped {len(skipped)}/{len(web_results)} "
+                f"results for '{query}'"
+            )
+        return kept
+
+    def _drop_near_duplicates(
+        self,
+        web_results: List[WebSearchResult],
+    ) -> List[WebSearchResult]:
+        """
+        Keep the best ranked copy of each cluster of near-identical pages.
+
+        Pages within rag_near_duplicate_distance SimHash bits of a kept
+        page (e.g. one press release on several news sites), sharing at
+        least rag_near_duplicate_similarity of its shingles and no new
+        numbers, would yield the same events, so only one copy goes to
+        the LLM.
+        """
+        if len(web_results) < 2:
+            return web_results
+
+        with self.timings.stage("dedup"):
+            kept, dropped = drop_near_duplicates(
+                web_results,
+                settings.rag_near_duplicate_distance,
+                settings.rag_near_duplicate_similarity,
+            )
+
+        if dropped:
+            print(
+                f"Dropped {len(dropped)}/{len(web_results)} near-duplicate "
+                f"results: {', '.join(result.url for result in dropped)}"
+            )
+        return kept
+
+    async def _skip_unchanged(
+        self,
+        web_results: List[WebSearchResult],
+    ) -> List[WebSearchResult]:
+        """
+        Set aside pages whose content hash matches the last crawl for the
+        same artist (extraction scope).
+
+        Their events are already stored (web_documents.event_ids), so they
+        skip parsing, extraction, embedding and storing entirely. The rest
+        are remembered as changed and recorded once their events are stored.
+
+        Returns:
+            Web results that are new or changed
+        """
+        if not web_results:
+            return web_results
+
+        with self.timings.stage("documents"):
+            self._documents = await self.web_documents.get_many(
+                [result.url for result in web_results], self._scope
+            )
+
+        remaining: List[WebSearchResult] = []
         for result in web_results:
-            events = await extractor.extract_events(
+            document = self._documents.get(result.url)
+            text_hash = content_hash(result.text)
+            if document is not None and document.content_hash == text_hash:
+                self._mark_unchanged(document)
+                continue
+            self._changed_documents[result.url] = {
+                "content_hash": text_hash,
+                "etag": document.etag if document else None,
+                "last_modified": document.last_modified if document else None,
+            }
+            remaining.append(result)
+
+        if len(remaining) < len(web_results):
+            print(
+                f"Skipped {len(web_results) - len(remaining)} unchanged pages, "
+                f"{len(remaining)} new or changed"
+            )
+        return remaining
+
+    def _mark_unchanged(self, document: WebDocument) -> None:
+        """Serve a page's events from its web_documents record."""
+        self._changed_documents.pop(document.url, None)
+        self._unchanged_documents.append(document)
+        self._unchanged_urls.append(document.url)
+
+    async def _parse_structured(
+        self,
+        query: str,
+        web_results: List[WebSearchResult],
+        artist_names: List[str],
+    ) -> Tuple[List[ExtractedEvent], List[WebSearchResult]]:
+        """
+        Extract events from pages with structured data, without the LLM.
+
+        HTML comes from the result itself when it is HTML, otherwise it is
+        fetched for sites with a registered parser (see app.rag.parsers),
+        conditionally if the page was fetched before. A page the site
+        reports as not modified is treated as unchanged.
+
+        Only events of the searched artist are kept (see
+        _searched_artist_events); a page without any goes to the LLM.
+
+        Returns:
+            Tuple of (parsed events, results still needing the LLM)
+        """
+        if not web_results or not settings.structured_parsing_enabled:
+            return [], web_results
+
+        # Best match's canonical name first (see get_artists_in_query)
+        artist_hint = artist_names[0] if artist_names else None
+        terms = artist_terms(query, artist_names)
+
+        with self.timings.stage("structured"):
+            pages = await asyncio.gather(
+                *(self._page_html(result) for result in web_results)
+            )
+
+            events: List[ExtractedEvent] = []
+            remaining: List[WebSearchResult] = []
+            parsed_count = 0
+            for result, page in zip(web_results, pages):
+                if page and page.not_modified and result.url in self._documents:
+                    self._mark_unchanged(self._documents[result.url])
+                    continue
+                if page and result.url in self._changed_documents:
+                    self._changed_documents[result.url].update(
+                        etag=page.etag, last_modified=page.last_modified
+                    )
+                parsed = (
+                    parse_structured_events(result.url, page.html, artist_hint)
+                    if page and page.html
+                    else None
+                )
+                parsed = self._searched_artist_events(parsed or [], terms, artist_hint)
+                if parsed:
+                    self._record_page_events(result.url, parsed)
+                    events.extend(parsed)
+                    parsed_count += 1
+                else:
+                    remaining.append(result)
+
+        if parsed_count:
+            print(
+                f"Parsed {parsed_count} pages from "
+                f"structured data, {len(remaining)} left for the LLM"
+            )
+        return events, remaining
+
+    @staticmethod
+    def _searched_artist_events(
+        events: List[ExtractedEvent],
+        terms: List[str],
+        artist_hint: Optional[str],
+    ) -> List[ExtractedEvent]:
+        """
+        Parsed events whose title or performer names the searched artist.
+
+        Listing pages (venues, ticket sites) carry JSON-LD for every show.
+        A performer equal to artist_hint may just be the hint filled in
+        for an event without one, so then the title has to name the artist.
+        """
+        if not terms:
+            return events
+        return [
+            event
+            for event in events
+            if mentions_artist(event.title, terms)
+            or (
+                event.artist_name != artist_hint
+                and mentions_artist(event.artist_name, terms)
+            )
+        ]
+
+    async def _page_html(self, result: WebSearchResult) -> Optional[FetchedPage]:
+        """HTML for structured parsing, or None if the page isn't worth fetching."""
+        raw = result.raw_content or ""
+        if "<script" in raw.lower():
+            return FetchedPage(html=raw)
+        if parser_for(result.url):
+            document = self._documents.get(result.url)
+            return await crawler.fetch_page(
+                result.url,
+                etag=document.etag if document else None,
+                last_modified=document.last_modified if document else None,
+            )
+        return None
+
+    def _extract_with_rules(
+        self,
+        web_results: List[WebSearchResult],
+        artist_names: List[str],
+    ) -> Tuple[List[ExtractedEvent], List[WebSearchResult]]:
+        """
+        Extract events with the rule-based extractor (app.rag.rules).
+
+        Pages whose rule events reach rag_rule_confidence_threshold skip
+        the LLM; for the rest, whatever the rules found is kept as hints
+        for the hinted extraction prompt.
+
+        Returns:
+            Tuple of (confident rule events, results still needing the LLM)
+        """
+        self._rule_hints = {}
+        if not web_results or not settings.rag_rule_extraction_enabled:
+            return [], web_results
+
+        events: List[ExtractedEvent] = []
+        remaining: List[WebSearchResult] = []
+        with self.timings.stage("rules"):
+            for result in web_results:
+                extraction = extract_with_rules(
+                    result.text, result.url, artist_names, result.title
+                )
+                if (
+                    extraction.events
+                    and extraction.confidence >= settings.rag_rule_confidence_threshold
+                ):
+                    self._record_page_events(result.url, extraction.events)
+                    events.extend(extraction.events)
+                    continue
+                remaining.append(result)
+                hints = extraction.hints()
+                if hints:
+                    self._rule_hints[result.url] = hints
+
+        rule_extraction_stats.record(len(remaining), len(web_results) - len(remaining))
+        if len(remaining) < len(web_results):
+            print(
+                f"Extracted {len(web_results) - len(remaining)} pages with rules, "
+                f"{len(remaining)} left for the LLM"
+            )
+        return events, remaining
+
+    def _compact_results(
+        self,
+        web_results: List[WebSearchResult],
+    ) -> List[WebSearchResult]:
+        """
+        Compact result texts for the LLM (see app.rag.compaction).
+
+        Returns copies whose text is the compacted content; the extraction
+        cache keys and packing sizes are computed on it too.
+        """
+        if not settings.rag_compaction_enabled:
+            return web_results
+
+        compacted: List[WebSearchResult] = []
+        with self.timings.stage("compaction"):
+            for result in web_results:
+                text = compact_content(result.text)
+                compaction_stats.record(count_tokens(result.text), count_tokens(text))
+                compacted.append(result.model_copy(update={"raw_content": text}))
+        return compacted
+
+    def _extraction_semaphore(self) -> asyncio.Semaphore:
+        """
+        Semaphore bounding concurrent LLM extraction calls.
+
+        The extractor holds it per request, so chunks and escalations of
+        one source count against the limit like separate sources.
+        """
+        return asyncio.Semaphore(max(1, settings.rag_extraction_concurrency))
+
+    async def _load_extraction_cache(
+        self,
+        web_results: List[WebSearchResult],
+    ) -> Tuple[List[str], Dict[str, List[ExtractedEvent]]]:
+        """
+        Compute cache keys for web results and fetch cached extractions.
+
+        A result is cached if it was extracted on its own or in a packed
+        request (the single-page answer wins); cached is keyed by the
+        single-page keys returned.
+        """
+        cache_keys = [
+            extractor.cache_key(r.url, r.text, self._scope) for r in web_results
+        ]
+        packed_keys = [
+            extractor.cache_key(r.url, r.text, self._scope, PACKED_PROMPT_VERSION)
+            for r in web_results
+        ]
+        with self.timings.stage("extraction_cache"):
+            hits = await self.extraction_cache.get_many(cache_keys + packed_keys)
+        cached = {
+            key: hits[key] if key in hits else hits[packed_key]
+            for key, packed_key in zip(cache_keys, packed_keys)
+            if key in hits or packed_key in hits
+        }
+        return cache_keys, cached
+
+    async def _save_extraction_cache(self) -> None:
+        """Persist extractions collected by _extract_source since last save."""
+        entries, self._pending_extractions = self._pending_extractions, []
+        with self.timings.stage("extraction_cache"):
+            await self.extraction_cache.save_many(entries, model=extractor.model)
+            await self.db.commit()
+
+    def _plan_extraction(
+        self,
+        web_results: List[WebSearchResult],
+        cache_keys: List[str],
+        cached: Dict[str, List[ExtractedEvent]],
+    ) -> List[List[int]]:
+        """
+        Group web results (by index) into extraction requests.
+
+        Uncached results of up to rag_extraction_pack_doc_tokens are
+        bin-packed into shared requests of rag_extraction_pack_tokens;
+        everything else is extracted on its own.
+        """
+        budget = settings.rag_extraction_pack_tokens
+        groups: List[List[int]] = []
+        packable: List[int] = []
+        for index, (result, cache_key) in enumerate(zip(web_results, cache_keys)):
+            if (
+                budget > 0
+                and cache_key not in cached
+                and count_tokens(result.text)
+                <= settings.rag_extraction_pack_doc_tokens
+            ):
+                packable.append(index)
+            else:
+                groups.append([index])
+
+        sizes = [count_tokens(web_results[i].text) for i in packable]
+        for group in pack_documents(sizes, budget):
+            groups.append([packable[i] for i in group])
+        return groups
+
+    async def _extract_group(
+        self,
+        query: str,
+        sources: List[Tuple[WebSearchResult, str]],
+        cached: Dict[str, List[ExtractedEvent]],
+        semaphore: asyncio.Semaphore,
+        emit: Optional[Callable[[List[ExtractedEvent]], None]] = None,
+    ) -> List[List[ExtractedEvent]]:
+        """
+        Extract events for a group of (result, cache_key); one list per source.
+
+        emit, if given, receives events of a single source while the LLM
+        is still streaming them (see _extract_source).
+        """
+        if len(sources) == 1:
+            result, cache_key = sources[0]
+            return [
+                await self._extract_source(
+                    query, result, cache_key, cached, semaphore, emit
+                )
+            ]
+
+        start_time = time.perf_counter()
+        packed_events = await extractor.try_extract_packed(
+            query=query,
+            documents=[(result.url, result.text) for result, _ in sources],
+            dropped=self.timings.dropped,
+            limit=semaphore,
+        )
+        elapsed = time.perf_counter() - start_time
+
+        for result, _ in sources:
+            self.timings.record_source(result.url, elapsed)
+
+        if packed_events is None:
+            # No LLM answer (error / no API key): don't cache
+            self._record_extraction_failure([result.url for result, _ in sources])
+            return [[] for _ in sources]
+
+        for (result, _), events in zip(sources, packed_events):
+            self._record_page_events(result.url, events)
+            # Each source saved one share of the shared request
+            extraction_cache_stats.record_miss(elapsed / len(sources))
+            self._pending_extractions.append(
+                (
+                    extractor.cache_key(
+                        result.url, result.text, self._scope, PACKED_PROMPT_VERSION
+                    ),
+                    result.url,
+                    result.text,
+                    PACKED_PROMPT_VERSION,
+                    events,
+                )
+            )
+        return packed_events
+
+    async def _extract_source(
+        self,
+        query: str,
+        result: WebSearchResult,
+        cache_key: str,
+        cached: Dict[str, List[ExtractedEvent]],
+        semaphore: asyncio.Semaphore,
+        emit: Optional[Callable[[List[ExtractedEvent]], None]] = None,
+    ) -> List[ExtractedEvent]:
+        """
+        Extract events from a single web result, using the cache first.
+
+        With emit and rag_extraction_streaming, the LLM answer is streamed
+        and each event is passed to emit as soon as it is complete.
+        """
+        if cache_key in cached:
+            self.timings.record_source(result.url, 0.0)
+            self._record_page_events(result.url, cached[cache_key])
+            return cached[cache_key]
+
+        hints = self._rule_hints.get(result.url, "")
+        start_time = time.perf_counter()
+        if emit and settings.rag_extraction_streaming and extractor.available:
+            events = await self._stream_source(query, result, hints, semaphore, emit)
+        else:
+            events = await extractor.try_extract_events(
+                query=query,
+                content=result.text,
+                source_url=result.url,
+                hints=hints,
+                dropped=self.timings.dropped,
+                limit=semaphore,
+            )
+        elapsed = time.perf_counter() - start_time
+        self.timings.record_source(result.url, elapsed)
+
+        if events is None:
+            # No LLM answer (error / no API key): don't cache
+            self._record_extraction_failure([result.url])
+            return []
+
+        self._record_page_events(result.url, events)
+        extraction_cache_stats.record_miss(elapsed)
+        self._pending_extractions.append(
+            (cache_key, result.url, result.text, EXTRACTION_PROMPT_VERSION, events)
+        )
+        return events
+
+    async def _stream_source(
+        self,
+        query: str,
+        result: WebSearchResult,
+        hints: str,
+        semaphore: asyncio.Semaphore,
+        emit: Callable[[List[ExtractedEvent]], None],
+    ) -> Optional[List[ExtractedEvent]]:
+        """Stream one source's events to emit; None if the stream failed."""
+        events: List[ExtractedEvent] = []
+        try:
+            async for event in extractor.stream_events(
                 query=query,
-                content=result.content,
+                content=result.text,
                 source_url=result.url,
+                hints=hints,
+                dropped=self.timings.dropped,
+                limit=semaphore,
+            ):
+                events.append(event)
+                emit([event])
+        except UpstreamError as e:
+            # Events already emitted stay; the source's result isn't cached
+            print(f"Streaming extraction failed for {result.url}: {e}")
+            return None
+        return events
+
+    def _record_extraction_failure(self, source_urls: List[str]) -> None:
+        """Mark the run as failed if the LLM should have answered but didn't."""
+        # Not recorded as crawled, so the next run extracts them again
+        for url in source_urls:
+            self._changed_documents.pop(url, None)
+        if extractor.available:
+            self.upstream_errors.extend(
+                f"extraction failed: {url}" for url in source_urls
             )
-            all_events.extend(events)
 
-        # Deduplicate by title + date
-        seen = set()
-        unique_events = []
-        for event in all_events:
-            key = (event.title.lower(), event.event_date.isoformat())
-            if key not in seen:
-                seen.add(key)
-                unique_events.append(event)
+    async def _load_unchanged_events(self) -> List[Event]:
+        """Stored events of unchanged pages not returned yet."""
+        documents, self._unchanged_documents = self._unchanged_documents, []
+        event_ids = {
+            UUID(event_id) for document in documents for event_id in document.event_ids
+        }
+        if not event_ids:
+            return []
+
+        with self.timings.stage("documents"):
+            result = await self.db.execute(
+                select(Event).where(Event.id.in_(event_ids))
+            )
+        return list(result.scalars().all())
+
+    def _record_page_events(self, url: str, events: List[ExtractedEvent]) -> None:
+        """Remember the events a crawled page yielded, for _record_documents."""
+        self._page_events.setdefault(url, []).extend(events)
+
+    async def _record_documents(self) -> None:
+        """
+        Record this run's pages in web_documents.
+
+        New/changed pages are saved with their content hash, validators
+        and the IDs of the events stored from them; unchanged pages are
+        only marked as seen.
+
+        A page's events are the ones extracted from it before dedup, so a
+        page whose events were merged into another page's (same event_key
+        or natural key) still records the stored events they became.
+        """
+        if not self._changed_documents and not self._unchanged_urls:
+            return
 
-        return unique_events
+        event_ids: Dict[str, List[str]] = {}
+        for url in self._changed_documents:
+            ids = [
+                self._stored_event_ids.get(event_key(event))
+                for event in self._page_events.get(url, [])
+            ]
+            event_ids[url] = [str(i) for i in dict.fromkeys(ids) if i is not None]
+
+        with self.timings.stage("documents"):
+            await self.web_documents.save_many(
+                self._changed_documents, event_ids, self._scope
+            )
+            await self.web_documents.touch(self._unchanged_urls, self._scope)
+            await self.db.commit()
+        self._changed_documents = {}
+        self._unchanged_urls = []
 
     async def store_events(
         self,
@@ -77,69 +881,150 @@ class RAGPipeline:
         """
         Store extracted events in database with embeddings.
 
+        Runs in bulk so round-trips don't scale with the number of events:
+        one query to resolve artists, one (chunked) embeddings request,
+        and multi-row INSERTs for events and their embeddings.
+
         Args:
             extracted_events: Events extracted by LLM
 
         Returns:
             List of created Event models
         """
-        stored_events: List[Event] = []
+        if not extracted_events:
+            return []
 
-        for extracted in extracted_events:
-            # Get or create artist
-            artist, _ = await self.artist_service.get_or_create_artist(
-                name=extracted.artist_name
+        # Resolve all artists in one round-trip
+        with self.timings.stage("store"):
+            artist_ids = await self.artist_service.get_or_create_artist_ids(
+                [extracted.artist_name for extracted in extracted_events]
             )
 
-            # Create event
-            event = Event(
+        # Embed every event text in one batched API call (cache misses only)
+        event_texts = [
+            embeddings_service.create_event_text(
                 title=extracted.title,
-                category=extracted.category,
-                artist_id=artist.id,
                 artist_name=extracted.artist_name,
-                event_date=extracted.event_date,
-                event_time=extracted.event_time,
-                timezone=extracted.timezone,
+                category=extracted.category.value,
                 venue=extracted.venue,
-                address=extracted.address,
                 city=extracted.city,
                 country=extracted.country,
-                price_currency=extracted.price_currency,
-                price_min=extracted.price_min,
-                price_max=extracted.price_max,
-                ticket_url=extracted.ticket_url,
-                source=extracted.source_url.split("/")[2]
-                if "/" in extracted.source_url
-                else extracted.source_url,
-                source_url=extracted.source_url,
-                collected_at=datetime.utcnow(),
             )
-            self.db.add(event)
-            await self.db.flush()  # Get event.id
+            for extracted in extracted_events
+        ]
+        with self.timings.stage("embed"):
+            embedding_vectors = await embeddings_service.get_embeddings(
+                event_texts, db=self.db
+            )
 
-            # Generate embedding
-            event_text = embeddings_service.create_event_text(
-                title=extracted.title,
-                artist_name=extracted.artist_name,
-                category=extracted.category.value,
-                venue=extracted.venue,
-                city=extracted.city,
-                country=extracted.country,
+        with self.timings.stage("store"):
+            stored_events = await self._insert_events(
+                extracted_events, artist_ids, event_texts, embedding_vectors
             )
-            embedding_vector = await embeddings_service.get_embedding(event_text)
+            await self.db.commit()
+
+        return stored_events
+
+    async def _insert_events(
+        self,
+        extracted_events: List[ExtractedEvent],
+        artist_ids: Dict[str, UUID],
+        event_texts: List[str],
+        embedding_vectors: List[List[float]],
+    ) -> List[Event]:
+        """
+        Upsert events and their embeddings with multi-row statements.
 
-            # Store embedding
-            event_embedding = EventEmbedding(
-                event_id=event.id,
-                embedding=embedding_vector,
-                embedded_text=event_text[:2000],
-                model=embeddings_service.model,
+        Events are keyed by natural_key, so re-collecting a known event
+        refreshes the existing row (and its embedding) instead of
+        inserting a duplicate.
+        """
+        collected_at = datetime.utcnow()
+
+        # One row per natural key: ON CONFLICT can't touch a row twice
+        rows: Dict[str, dict] = {}
+        embedding_rows: Dict[str, dict] = {}
+        natural_keys: List[str] = []
+        for extracted, event_text, embedding_vector in zip(
+            extracted_events, event_texts, embedding_vectors
+        ):
+            artist_id = artist_ids[extracted.artist_name]
+            natural_key = make_event_natural_key(
+                artist_id, extracted.event_date, extracted.venue, extracted.title
             )
-            self.db.add(event_embedding)
+            natural_keys.append(natural_key)
+            if natural_key in rows:
+                continue
+
+            rows[natural_key] = {
+                "title": extracted.title,
+                "category": extracted.category,
+                "artist_id": artist_id,
+                "artist_name": extracted.artist_name,
+                "event_date": extracted.event_date,
+                "event_time": extracted.event_time,
+                "timezone": extracted.timezone,
+                "venue": extracted.venue,
+                "address": extracted.address,
+                "city": extracted.city,
+                "country": extracted.country,
+                "price_currency": extracted.price_currency,
+                "price_min": extracted.price_min,
+                "price_max": extracted.price_max,
+                "ticket_url": extracted.ticket_url,
+                "source": extracted.source_url.split("/")[2]
+                if "/" in extracted.source_url
+                else extracted.source_url,
+                "source_url": extracted.source_url,
+                "collected_at": collected_at,
+                "natural_key": natural_key,
+            }
+            embedding_rows[natural_key] = {
+                "embedding": embedding_vector,
+                "embedded_text": event_text[:2000],
+                "model": embeddings_service.model,
+            }
 
-            stored_events.append(event)
+        # Upsert events with a multi-row INSERT ... ON CONFLICT ... RETURNING
+        stmt = pg_insert(Event)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Event.natural_key],
+            set_={
+                **{
+                    column: stmt.excluded[column]
+                    for column in EVENT_REFRESH_COLUMNS
+                },
+                "updated_at": func.now(),
+            },
+        ).returning(Event)
+        result = await self.db.scalars(
+            stmt,
+            list(rows.values()),
+            execution_options={"populate_existing": True},
+        )
+        events_by_key = {event.natural_key: event for event in result.all()}
+        stored_events = [events_by_key[key] for key in rows]
+        # Events merged into another row map to that row
+        for extracted, natural_key in zip(extracted_events, natural_keys):
+            self._stored_event_ids[event_key(extracted)] = events_by_key[natural_key].id
+
+        # Upsert embeddings with a multi-row INSERT ... ON CONFLICT
+        stmt = pg_insert(EventEmbedding)
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[EventEmbedding.event_id],
+                set_={
+                    "embedding": stmt.excluded.embedding,
+                    "embedded_text": stmt.excluded.embedded_text,
+                    "model": stmt.excluded.model,
+                },
+            ),
+            [
+                {"event_id": events_by_key[key].id, **embedding_row}
+                for key, embedding_row in embedding_rows.items()
+            ],
+        )
 
-        await self.db.commit()
         return stored_events
 
     async def run(
@@ -156,16 +1041,70 @@ class RAGPipeline:
 
         Returns:
             Tuple of (events, search_time_seconds)
+
+        Events of pages unchanged since the last crawl are included
+        without being extracted again. The per-stage breakdown of the run
+        is left in self.timings, and upstream failures (search or
+        extraction) in self.upstream_errors.
+        """
+        self.timings = StageTimings()
+        self.upstream_errors = []
+
+        with self.timings.stage("total"):
+            # Extract events from web
+            extracted_events = await self.search_and_extract(query, max_web_results)
+
+            # Store events with embeddings
+            events = await self.store_events(extracted_events)
+            await self._record_documents()
+
+            # Add events of unchanged pages
+            seen_ids = {event.id for event in events}
+            for event in await self._load_unchanged_events():
+                if event.id not in seen_ids:
+                    seen_ids.add(event.id)
+                    events.append(event)
+
+        return events, self.timings.stages["total"]
+
+    async def run_stream(
+        self,
+        query: str,
+        max_web_results: int = 10,
+    ) -> AsyncIterator[List[Event]]:
+        """
+        Run RAG pipeline, storing and yielding events as they are extracted.
+
+        Extracted events (one per streamed LLM object, or one list per
+        source) are stored in batches of rag_stream_store_batch_size,
+        waiting at most rag_stream_store_window_ms, so embedding and
+        upserting stay bulk operations (see window_batches).
+
+        Args:
+            query: Search query
+            max_web_results: Max web search results
+
+        Yields:
+            Lists of stored Event models; events of pages unchanged since
+            the last crawl come as one batch, without extraction
         """
-        import time
+        self.timings = StageTimings()
+        self.upstream_errors = []
 
-        start_time = time.time()
+        async for extracted_events in window_batches(
+            self.iter_extracted(query, max_web_results),
+            settings.rag_stream_store_batch_size,
+            settings.rag_stream_store_window_ms / 1000,
+        ):
+            unchanged_events = await self._load_unchanged_events()
+            if unchanged_events:
+                yield unchanged_events
 
-        # Extract events from web
-        extracted_events = await self.search_and_extract(query, max_web_results)
+            yield await self.store_events(extracted_events)
 
-        # Store events with embeddings
-        events = await self.store_events(extracted_events)
+        # Every page was unchanged (nothing to extract)
+        unchanged_events = await self._load_unchanged_events()
+        if unchanged_events:
+            yield unchanged_events
 
-        search_time = time.time() - start_time
-        return events, search_time
+        await self._record_documents()
@@ -0,0 +1,163 @@
+"""Cheap local relevance scoring of web results before LLM extraction."""
+
+from typing import Iterable, List, Tuple
+import re
+
+from app.rag.crawler import WebSearchResult
+from app.rag.stats import FilterStats
+
+relevance_filter_stats = FilterStats()
+
+# Score weights (sum to 1.0)
+ARTIST_WEIGHT = 0.4
+DATE_WEIGHT = 0.25
+EVENT_WEIGHT = 0.2  # Venue / price / ticket wording
+TAVILY_WEIGHT = 0.15
+
+_MONTHS = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+
+DATE_PATTERN = re.compile(
+    r"""
+    \b20\d{2}\s?[./-]\s?\d{1,2}\s?[./-]\s?\d{1,2}\b  # 2024-05-12, 2024. 5. 12
+    | \d{1,2}\s?월\s?\d{1,2}\s?일                     # 5월 12일
+    | 20\d{2}\s?년\s?\d{1,2}\s?월                     # 2024년 5월
+    | \b"""
+    + _MONTHS
+    + r"""\s+\d{1,2}(?:st|nd|rd|th)?\b                # May 12
+    | \b\d{1,2}(?:st|nd|rd|th)?\s+"""
+    + _MONTHS
+    + r"""                                            # 12 May
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+PRICE_PATTERN = re.compile(
+    r"[$₩€£¥]\s?\d|\d[\d,]*\s?(?:원|usd|krw|jpy|eur)\b|\d[\d,]*\s?원",
+    re.IGNORECASE,
+)
+
+EVENT_KEYWORDS = (
+    # English
+    "venue",
+    "arena",
+    "stadium",
+    "dome",
+    "hall",
+    "theater",
+    "theatre",
+    "ticket",
+    "presale",
+    "price",
+    # Korean
+    "공연장",
+    "경기장",
+    "체육관",
+    "아레나",
+    "스타디움",
+    "돔",
+    "장소",
+    "티켓",
+    "예매",
+    "가격",
+)
+
+# Query words that say what kind of page we want, not whose
+GENERIC_QUERY_WORDS = {
+    "concert",
+    "concerts",
+    "tour",
+    "world",
+    "event",
+    "events",
+    "schedule",
+    "fanmeeting",
+    "fanmeet",
+    "festival",
+    "live",
+    "콘서트",
+    "투어",
+    "월드투어",
+    "공연",
+    "일정",
+    "팬미팅",
+    "페스티벌",
+    "행사",
+    "내한",
+}
+
+
+def artist_terms(query: str, known_names: Iterable[str] = ()) -> List[str]:
+    """
+    Terms whose presence marks a page as being about the searched artist.
+
+    Known artist names/aliases matched from the DB are preferred; if the
+    artist is unknown, falls back to the non-generic words of the query.
+    """
+    terms = [name.strip() for name in known_names if name and name.strip()]
+    if not terms:
+        terms = [
+            word
+            for word in query.split()
+            if word.casefold() not in GENERIC_QUERY_WORDS
+            and not re.fullmatch(r"\d+년?", word)
+        ]
+    return list(dict.fromkeys(term.casefold() for term in terms))
+
+
+def _contains_term(text: str, term: str) -> bool:
+    """Case-folded containment; ASCII terms must match on word boundaries."""
+    if term.isascii():
+        return re.search(rf"(?<!\w){re.escape(term)}(?!\w)", text) is not None
+    return term in text
+
+
+def mentions_artist(text: str, terms: List[str]) -> bool:
+    """Whether text mentions one of the artist_terms (any case)."""
+    text = text.casefold()
+    return any(_contains_term(text, term) for term in terms)
+
+
+def score_result(result: WebSearchResult, terms: List[str]) -> float:
+    """
+    Score how likely a web result is to describe an event of the artist.
+
+    Combines artist name/alias presence, detected dates, venue/price
+    wording and the Tavily relevance score into 0.0-1.0.
+    """
+    text = f"{result.title}\n{result.text}".casefold()
+
+    score = 0.0
+    if mentions_artist(text, terms):
+        score += ARTIST_WEIGHT
+    if DATE_PATTERN.search(text):
+        score += DATE_WEIGHT
+    if PRICE_PATTERN.search(text) or any(k in text for k in EVENT_KEYWORDS):
+        score += EVENT_WEIGHT
+    score += TAVILY_WEIGHT * min(max(result.score, 0.0), 1.0)
+    return score
+
+
+def filter_relevant(
+    results: List[WebSearchResult],
+    terms: List[str],
+    threshold: float,
+) -> Tuple[List[WebSearchResult], List[WebSearchResult]]:
+    """
+    Split web results into (kept, skipped) by score_result >= threshold.
+
+    Order is preserved. A threshold of 0 keeps everything.
+    """
+    if threshold <= 0:
+        relevance_filter_stats.record(len(results), 0)
+        return list(results), []
+
+    kept: List[WebSearchResult] = []
+    skipped: List[WebSearchResult] = []
+    for result in results:
+        if score_result(result, terms) >= threshold:
+            kept.append(result)
+        else:
+            skipped.append(result)
+
+    relevance_filter_stats.record(len(kept), len(skipped))
+    return kept, skipped
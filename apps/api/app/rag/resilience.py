@@ -0,0 +1,247 @@
+"""Rate limiting, retries and circuit breaking for upstream APIs."""
+
+from typing import Awaitable, Callable, Optional, TypeVar
+import asyncio
+import random
+import time
+
+import httpx
+import openai
+
+from app.config import settings
+
+T = TypeVar("T")
+
+
+class UpstreamError(Exception):
+    """An upstream API call failed after retries."""
+
+    def __init__(self, provider: str, message: str):
+        super().__init__(f"{provider}: {message}")
+        self.provider = provider
+
+
+class CircuitOpenError(UpstreamError):
+    """The provider's circuit is open; the call was not attempted."""
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter.
+
+    Holds up to `burst` tokens, refilled at `rate` tokens per second.
+    acquire() waits until a token is available.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        """Take one token, waiting for the refill if the bucket is empty."""
+        if self.rate <= 0:
+            return
+
+        # The lock makes waiters take tokens in arrival order
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class CircuitBreaker:
+    """
+    Fail fast while a provider is down.
+
+    Opens after `failure_threshold` consecutive failures. After
+    `reset_seconds` it lets one trial call through (half-open): success
+    closes the circuit, failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at >= self.reset_seconds:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self) -> bool:
+        """Whether a call may be attempted now."""
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._trial_in_flight or self.failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """Give back the half-open trial slot of a call that didn't finish."""
+        self._trial_in_flight = False
+
+
+def is_retryable(error: Exception) -> bool:
+    """Transient errors worth retrying: timeouts, connection errors, 429, 5xx."""
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    if isinstance(error, httpx.TransportError):
+        return True
+    if isinstance(error, (openai.APIConnectionError, openai.RateLimitError)):
+        return True
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code >= 500
+    return False
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds from a Retry-After header, if the error carries one."""
+    response = getattr(error, "response", None)
+    value = response.headers.get("retry-after") if response is not None else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class ProviderGuard:
+    """
+    Rate limit, retry and circuit breaker for one upstream provider.
+
+    call() waits for a rate-limit token, then runs the request. Retryable
+    errors are retried with jittered exponential backoff (or Retry-After);
+    failures after the last retry count towards the circuit breaker.
+    Raises UpstreamError when the call ultimately fails and
+    CircuitOpenError without calling while the circuit is open.
+    Non-retryable errors (e.g. 400, bad API key) are raised as-is and
+    don't change the breaker state.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        burst: int,
+        max_retries: int,
+        failure_threshold: int,
+        reset_seconds: float,
+    ):
+        self.name = name
+        self.bucket = TokenBucket(rate, burst)
+        self.breaker = CircuitBreaker(failure_threshold, reset_seconds)
+        self.max_retries = max_retries
+        self.calls = 0
+        self.retries = 0
+        self.failures = 0
+        self.rejected = 0
+
+    async def call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run fn() under the provider's limits; see class docstring."""
+        if not self.breaker.allow():
+            self.rejected += 1
+            raise CircuitOpenError(self.name, "circuit open, failing fast")
+
+        try:
+            return await self._call_with_retries(fn)
+        except asyncio.CancelledError:
+            # Don't leave a half-open trial slot taken forever
+            self.breaker.release_trial()
+            raise
+
+    async def _call_with_retries(self, fn: Callable[[], Awaitable[T]]) -> T:
+        attempt = 0
+        while True:
+            await self.bucket.acquire()
+            self.calls += 1
+            try:
+                result = await fn()
+            except Exception as e:
+                if not is_retryable(e):
+                    # Says nothing about the provider's health: leave the
+                    # breaker as it is, but free a half-open trial slot
+                    self.breaker.release_trial()
+                    raise
+                if attempt >= self.max_retries:
+                    self.failures += 1
+                    self.breaker.record_failure()
+                    raise UpstreamError(self.name, str(e)) from e
+
+                attempt += 1
+                self.retries += 1
+                await asyncio.sleep(self._backoff(attempt, _retry_after(e)))
+            else:
+                self.breaker.record_success()
+                return result
+
+    @staticmethod
+    def _backoff(attempt: int, retry_after: Optional[float]) -> float:
+        """Full-jitter exponential backoff, or the server's Retry-After."""
+        if retry_after is not None:
+            return min(retry_after, settings.upstream_retry_max_delay_seconds)
+        ceiling = min(
+            settings.upstream_retry_max_delay_seconds,
+            settings.upstream_retry_base_delay_seconds * 2 ** (attempt - 1),
+        )
+        return random.uniform(0, ceiling)
+
+    def stats(self) -> dict:
+        """Counters for the stats endpoint."""
+        return {
+            "state": self.breaker.state,
+            "calls": self.calls,
+            "retries": self.retries,
+            "failures": self.failures,
+            "rejected": self.rejected,
+        }
+
+
+# Process-wide guards, one per provider (exposed via GET /stats)
+tavily_guard = ProviderGuard(
+    "tavily",
+    rate=settings.tavily_rate_per_second,
+    burst=settings.tavily_rate_burst,
+    max_retries=settings.upstream_max_retries,
+    failure_threshold=settings.upstream_circuit_failure_threshold,
+    reset_seconds=settings.upstream_circuit_reset_seconds,
+)
+openai_guard = ProviderGuard(
+    "openai",
+    rate=settings.openai_rate_per_second,
+    burst=settings.openai_rate_burst,
+    max_retries=settings.upstream_max_retries,
+    failure_threshold=settings.upstream_circuit_failure_threshold,
+    reset_seconds=settings.upstream_circuit_reset_seconds,
+)
@@ -0,0 +1,547 @@
+"""Rule-based event extraction (dates, times, prices, known venues) without the LLM."""
+
+from typing import List, NamedTuple, Optional, Tuple
+from dataclasses import dataclass, field
+from datetime import date, time
+from decimal import Decimal
+import re
+
+from app.models.event import EventCategory
+from app.rag.extractor import ExtractedEvent
+from app.rag.stats import FilterStats
+
+# kept = pages left for the LLM, skipped = LLM calls saved
+rule_extraction_stats = FilterStats()
+
+# Confidence weights (sum to 1.0); date, venue and artist are required,
+# and every date needs a start time or price next to it
+DATE_WEIGHT = 0.3
+VENUE_WEIGHT = 0.25
+ARTIST_WEIGHT = 0.15
+TIME_WEIGHT = 0.15
+PRICE_WEIGHT = 0.15
+
+# More dates than this is a schedule/listing: pairing them is the LLM's job
+MAX_DATES = 3
+
+# Characters around a date searched for its start time or price
+DATE_CONTEXT_CHARS = 40
+# Characters before a date searched for sale/publication words
+DATE_LABEL_CHARS = 12
+
+
+class Venue(NamedTuple):
+    """Well-known venue with the location fields the LLM would fill in."""
+
+    name: str
+    aliases: Tuple[str, ...]
+    city: str
+    country: str
+    timezone: str
+
+
+KNOWN_VENUES: Tuple[Venue, ...] = (
+    # South Korea
+    Venue(
+        "KSPO DOME",
+        ("KSPO DOME", "KSPO돔", "올림픽체조경기장", "체조경기장"),
+        "Seoul",
+        "South Korea",
+        "Asia/Seoul",
+    ),
+    Venue(
+        "Seoul Olympic Stadium",
+        (
+            "서울올림픽주경기장",
+            "잠실올림픽주경기장",
+            "잠실종합운동장 주경기장",
+            "Seoul Olympic Stadium",
+            "Jamsil Olympic Stadium",
+        ),
+        "Seoul",
+        "South Korea",
+        "Asia/Seoul",
+    ),
+    Venue(
+        "Olympic Hall",
+        ("올림픽홀", "Olympic Hall"),
+        "Seoul",
+        "South Korea",
+        "Asia/Seoul",
+    ),
+    Venue(
+        "Handball Gymnasium",
+        ("핸드볼경기장", "Handball Gymnasium"),
+        "Seoul",
+        "South Korea",
+        "Asia/Seoul",
+    ),
+    Venue(
+        "Gocheok Sky Dome",
+        ("고척스카이돔", "고척돔", "Gocheok Sky Dome"),
+        "Seoul",
+        "South Korea",
+        "Asia/Seoul",
+    ),
+    Venue(
+        "Jangchung Arena",
+        ("장충체육관", "Jangchung Arena"),
+        "Seoul",
+        "South Korea",
+        "Asia/Seoul",
+    ),
+    Venue(
+        "Blue Square",
+        ("블루스퀘어", "Blue Square"),
+        "Seoul",
+        "South Korea",
+        "Asia/Seoul",
+    ),
+    Venue(
+        "Goyang Stadium",
+        ("고양종합운동장", "Goyang Stadium"),
+        "Goyang",
+        "South Korea",
+        "Asia/Seoul",
+    ),
+    Venue("KINTEX", ("킨텍스", "KINTEX"), "Goyang", "South Korea", "Asia/Seoul"),
+    Venue(
+        "Inspire Arena",
+        ("인스파이어 아레나", "Inspire Arena"),
+        "Incheon",
+        "South Korea",
+        "Asia/Seoul",
+    ),
+    Venue(
+        "Incheon Asiad Main Stadium",
+        ("인천아시아드주경기장", "Incheon Asiad Main Stadium"),
+        "Incheon",
+        "South Korea",
+        "Asia/Seoul",
+    ),
+    Venue(
+        "Busan Asiad Main Stadium",
+        ("부산아시아드주경기장", "Busan Asiad Main Stadium"),
+        "Busan",
+        "South Korea",
+        "Asia/Seoul",
+    ),
+    Venue("BEXCO", ("벡스코", "BEXCO"), "Busan", "South Korea", "Asia/Seoul"),
+    # Japan
+    Venue("Tokyo Dome", ("東京ドーム", "도쿄돔", "Tokyo Dome"), "Tokyo", "Japan", "Asia/Tokyo"),
+    Venue(
+        "Kyocera Dome Osaka",
+        ("京セラドーム大阪", "京セラドーム", "교세라돔", "Kyocera Dome"),
+        "Osaka",
+        "Japan",
+        "Asia/Tokyo",
+    ),
+    Venue(
+        "Saitama Super Arena",
+        ("さいたまスーパーアリーナ", "사이타마 슈퍼 아레나", "Saitama Super Arena"),
+        "Saitama",
+        "Japan",
+        "Asia/Tokyo",
+    ),
+    Venue(
+        "Nissan Stadium",
+        ("日産スタジアム", "닛산 스타디움", "Nissan Stadium"),
+        "Yokohama",
+        "Japan",
+        "Asia/Tokyo",
+    ),
+    Venue(
+        "Vantelin Dome Nagoya",
+        ("バンテリンドーム", "반테린돔", "Vantelin Dome"),
+        "Nagoya",
+        "Japan",
+        "Asia/Tokyo",
+    ),
+    Venue(
+        "Fukuoka PayPay Dome",
+        ("みずほPayPayドーム", "福岡PayPayドーム", "PayPay Dome"),
+        "Fukuoka",
+        "Japan",
+        "Asia/Tokyo",
+    ),
+    # United States
+    Venue(
+        "SoFi Stadium",
+        ("SoFi Stadium",),
+        "Los Angeles",
+        "United States",
+        "America/Los_Angeles",
+    ),
+    Venue(
+        "Madison Square Garden",
+        ("Madison Square Garden",),
+        "New York",
+        "United States",
+        "America/New_York",
+    ),
+    Venue(
+        "MetLife Stadium",
+        ("MetLife Stadium",),
+        "East Rutherford",
+        "United States",
+        "America/New_York",
+    ),
+)
+
+_MONTH_NAMES = "jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec"
+_MONTHS = {name: index for index, name in enumerate(_MONTH_NAMES.split("|"), start=1)}
+
+# 2026.03.15 / 2026-3-15 / 2026. 3. 15
+NUMERIC_DATE = re.compile(
+    r"(?<!\d)(20\d{2})\s?[./-]\s?(\d{1,2})\s?[./-]\s?(\d{1,2})(?!\d)"
+)
+# 2026년 3월 15일 / 2026年3月15日
+CJK_DATE = re.compile(r"(20\d{2})\s?[년年]\s?(\d{1,2})\s?[월月]\s?(\d{1,2})\s?[일日]")
+# March 15, 2026 / Mar. 15th 2026
+EN_DATE_MDY = re.compile(
+    rf"\b({_MONTH_NAMES})[a-z]*\.?\s+(\d{{1,2}})(?:st|nd|rd|th)?,?\s+(20\d{{2}})\b",
+    re.IGNORECASE,
+)
+# 15 March 2026
+EN_DATE_DMY = re.compile(
+    rf"\b(\d{{1,2}})(?:st|nd|rd|th)?\s+({_MONTH_NAMES})[a-z]*\.?,?\s+(20\d{{2}})\b",
+    re.IGNORECASE,
+)
+
+# 18:00 / 6:30 PM
+CLOCK_TIME = re.compile(
+    r"(?<![\d:.])([01]?\d|2[0-3]):([0-5]\d)(?![\d:])(?:\s?([ap])\.?m\.?\b)?",
+    re.IGNORECASE,
+)
+# 6 PM
+EN_HOUR_TIME = re.compile(
+    r"(?<![:\d])\b(1[0-2]|0?[1-9])\s?([ap])\.?m\.?\b", re.IGNORECASE
+)
+# 오후 6시 30분 / 午後6時 / 18時 (not 시간, "hours")
+CJK_TIME = re.compile(
+    r"(오전|오후|午前|午後)?\s?(?<!\d)(\d{1,2})\s?[시時](?!간)(?:\s?(\d{1,2})\s?[분分])?"
+)
+# Words right before the show's start time (vs. doors open)
+START_WORDS = ("開演", "공연 시작", "공연시작", "start", "show")
+# Words right before a date that isn't the show's: ticket sales, releases,
+# article timestamps
+NON_EVENT_DATE_WORDS = (
+    "티켓 오픈",
+    "티켓오픈",
+    "예매",
+    "판매",
+    "발매",
+    "입력",
+    "수정",
+    "등록",
+    "기사",
+    "発売",
+    "販売",
+    "先行",
+    "on sale",
+    "presale",
+    "ticket open",
+    "tickets open",
+    "published",
+    "updated",
+    "posted",
+)
+
+_AMOUNT = r"(\d{1,3}(?:,\d{3})+|\d+)(?:\.(\d{2}))?"
+PRICE_PATTERNS = (
+    ("KRW", re.compile(rf"(?:₩|KRW)\s?{_AMOUNT}", re.IGNORECASE)),
+    ("KRW", re.compile(rf"{_AMOUNT}\s?(?:원|KRW)", re.IGNORECASE)),
+    ("JPY", re.compile(rf"(?:¥|￥|JPY)\s?{_AMOUNT}", re.IGNORECASE)),
+    ("JPY", re.compile(rf"{_AMOUNT}\s?(?:円|엔|JPY)", re.IGNORECASE)),
+    ("USD", re.compile(rf"(?:US\$|\$|USD)\s?{_AMOUNT}", re.IGNORECASE)),
+)
+
+FANMEETING_WORDS = ("팬미팅", "fan meeting", "fanmeeting", "ファンミーティング", "팬콘")
+FESTIVAL_WORDS = ("festival", "페스티벌", "フェス")
+
+# Site names trailing page titles ("... | 티켓링크")
+TITLE_SUFFIX = re.compile(r"\s*[|｜][^|｜]{1,30}$")
+
+
+def _normalize(text: str) -> str:
+    """Case-folded text without whitespace, for venue matching."""
+    return re.sub(r"\s+", "", text.casefold())
+
+
+def _mentions(text: str, name: str) -> bool:
+    """Case-folded containment; ASCII names must match on word boundaries."""
+    name = name.strip().casefold()
+    if not name:
+        return False
+    if name.isascii():
+        pattern = rf"(?<!\w){re.escape(name)}(?!\w)"
+        return re.search(pattern, text.casefold()) is not None
+    return _normalize(name) in _normalize(text)
+
+
+def find_dates(text: str) -> List[date]:
+    """Distinct full dates (year required) in order of appearance."""
+    spans = _find_date_spans(text)
+    return list(dict.fromkeys(found_date for _, _, found_date in spans))
+
+
+def _find_date_spans(text: str) -> List[Tuple[int, int, date]]:
+    """(start, end, date) of every full date in the text, in order."""
+    found: List[Tuple[int, int, date]] = []
+    for pattern, order in (
+        (NUMERIC_DATE, "ymd"),
+        (CJK_DATE, "ymd"),
+        (EN_DATE_MDY, "mdy"),
+        (EN_DATE_DMY, "dmy"),
+    ):
+        for match in pattern.finditer(text):
+            parts = dict(zip(order, match.groups()))
+            month = parts["m"]
+            if not month.isdigit():
+                month = _MONTHS[month[:3].lower()]
+            try:
+                found_date = date(int(parts["y"]), int(month), int(parts["d"]))
+            except ValueError:
+                continue
+            found.append((match.start(), match.end(), found_date))
+    return sorted(found)
+
+
+def find_times(text: str) -> List[Tuple[int, time]]:
+    """(position, time) of clock times in the text, in order of appearance."""
+    found: List[Tuple[int, time]] = []
+    for match in CLOCK_TIME.finditer(text):
+        hour, minute, meridiem = match.groups()
+        found.append((match.start(), _to_time(int(hour), int(minute), meridiem)))
+    for match in EN_HOUR_TIME.finditer(text):
+        hour, meridiem = match.groups()
+        found.append((match.start(), _to_time(int(hour), 0, meridiem)))
+    for match in CJK_TIME.finditer(text):
+        meridiem, hour, minute = match.groups()
+        if int(hour) > 23:
+            continue
+        pm = "p" if meridiem in ("오후", "午後") else None
+        found.append((match.start(), _to_time(int(hour), int(minute or 0), pm)))
+    return sorted((pos, found_time) for pos, found_time in found if found_time)
+
+
+def _to_time(hour: int, minute: int, meridiem: Optional[str]) -> Optional[time]:
+    if meridiem and meridiem.lower() == "p" and hour < 12:
+        hour += 12
+    if hour > 23 or minute > 59:
+        return None
+    return time(hour, minute)
+
+
+def find_prices(text: str) -> Tuple[Optional[str], List[Decimal]]:
+    """Currency of the first price found and all its amounts."""
+    found = _find_price_spans(text)
+    if not found:
+        return None, []
+    currency = found[0][1]
+    return currency, [amount for _, c, amount in found if c == currency]
+
+
+def _find_price_spans(text: str) -> List[Tuple[int, str, Decimal]]:
+    """(position, currency, amount) of every price in the text, in order."""
+    found: List[Tuple[int, str, Decimal]] = []
+    for currency, pattern in PRICE_PATTERNS:
+        for match in pattern.finditer(text):
+            whole, cents = match.groups()
+            amount = Decimal(whole.replace(",", ""))
+            if cents:
+                amount += Decimal(cents) / 100
+            if amount > 0:
+                found.append((match.start(), currency, amount))
+    return sorted(found)
+
+
+def find_venues(text: str) -> List[Venue]:
+    """Known venues mentioned in the text."""
+    normalized = _normalize(text)
+    return [
+        venue
+        for venue in KNOWN_VENUES
+        if any(_normalize(alias) in normalized for alias in venue.aliases)
+    ]
+
+
+def _start_time(text: str, times: List[Tuple[int, time]]) -> Optional[time]:
+    """The show's start time: the only one, or the one after a start word."""
+    distinct = list(dict.fromkeys(found_time for _, found_time in times))
+    if len(distinct) == 1:
+        return distinct[0]
+    lowered = text.casefold()
+    for position, found_time in times:
+        before = lowered[max(0, position - 8) : position]
+        if any(word in before for word in START_WORDS):
+            return found_time
+    return None
+
+
+def _event_dates(text: str, today: date) -> Tuple[List[date], bool]:
+    """
+    Upcoming dates that may be the event's, and whether each has evidence.
+
+    Past dates and dates right after a sale/publication word ("티켓 오픈",
+    "입력", "on sale") are dropped. Every time and price is given to the
+    nearest date mention within DATE_CONTEXT_CHARS (dropped ones
+    included); a date has evidence if one of its mentions got any.
+    """
+    spans = _find_date_spans(text)
+    positions = [pos for pos, _ in find_times(text)]
+    positions += [pos for pos, _, _ in _find_price_spans(text)]
+    supported = set()
+    for pos in positions:
+        distance, index = min(
+            (
+                (max(start - pos, pos - end, 0), index)
+                for index, (start, end, _) in enumerate(spans)
+            ),
+            default=(None, None),
+        )
+        if distance is not None and distance <= DATE_CONTEXT_CHARS:
+            supported.add(index)
+
+    lowered = text.casefold()
+    dates: List[date] = []
+    dates_supported = set()
+    for index, (start, _, found_date) in enumerate(spans):
+        if found_date < today:
+            continue
+        before = lowered[max(0, start - DATE_LABEL_CHARS) : start]
+        if any(word in before for word in NON_EVENT_DATE_WORDS):
+            continue
+        if found_date not in dates:
+            dates.append(found_date)
+        if index in supported:
+            dates_supported.add(found_date)
+    return dates, bool(dates) and dates_supported.issuperset(dates)
+
+
+def _category(text: str) -> EventCategory:
+    lowered = text.casefold()
+    if any(word in lowered for word in FANMEETING_WORDS):
+        return EventCategory.FANMEETING
+    if any(word in lowered for word in FESTIVAL_WORDS):
+        return EventCategory.FESTIVAL
+    return EventCategory.CONCERT
+
+
+def _clean_title(page_title: str) -> str:
+    """Page title without a trailing site name."""
+    return TITLE_SUFFIX.sub("", page_title.strip()).strip()
+
+
+@dataclass
+class RuleExtraction:
+    """What the rules found in a page, and the events built from it."""
+
+    dates: List[date] = field(default_factory=list)
+    event_time: Optional[time] = None
+    venues: List[Venue] = field(default_factory=list)
+    price_currency: Optional[str] = None
+    prices: List[Decimal] = field(default_factory=list)
+    artist_name: Optional[str] = None
+    title: Optional[str] = None
+    confidence: float = 0.0
+    events: List[ExtractedEvent] = field(default_factory=list)
+
+    def hints(self) -> str:
+        """Found values as prompt lines for the LLM; "" if nothing was found."""
+        lines = []
+        if self.dates:
+            lines.append(f"- dates: {', '.join(d.isoformat() for d in self.dates)}")
+        if self.event_time:
+            lines.append(f"- start time: {self.event_time.strftime('%H:%M')}")
+        if self.venues:
+            lines.append(
+                "- venues: "
+                + "; ".join(f"{v.name} ({v.city}, {v.country})" for v in self.venues)
+            )
+        if self.prices:
+            lines.append(
+                f"- prices: {self.price_currency} "
+                + ", ".join(str(price) for price in self.prices)
+            )
+        return "\n".join(lines)
+
+
+def extract_with_rules(
+    text: str,
+    source_url: str,
+    artist_names: List[str],
+    page_title: str = "",
+    today: Optional[date] = None,
+) -> RuleExtraction:
+    """
+    Extract events from text with patterns only.
+
+    Finds full dates (Korean/Japanese/English/numeric), times, KRW/JPY/USD
+    prices and known venues. Events are built only for a page text about
+    one of artist_names at exactly one known venue on a few upcoming
+    dates, each with a start time or price next to it; anything else
+    (news articles, schedules) is left to the LLM with the found values
+    as hints. The confidence says how complete the events are.
+
+    Args:
+        text: Page text
+        source_url: Page URL (becomes source_url)
+        artist_names: Names/aliases of the searched artist, canonical first
+        page_title: Page title, used as the event title only
+        today: Dates before this are dropped (default: today)
+
+    Returns:
+        RuleExtraction; events is empty if the rules can't build any
+    """
+    dates, dates_supported = _event_dates(text, today or date.today())
+    result = RuleExtraction(
+        dates=dates,
+        venues=find_venues(text),
+        title=_clean_title(page_title) or None,
+    )
+    result.event_time = _start_time(text, find_times(text))
+    result.price_currency, result.prices = find_prices(text)
+
+    if any(_mentions(text, name) for name in artist_names):
+        result.artist_name = artist_names[0]
+
+    if not (
+        result.artist_name
+        and len(result.venues) == 1
+        and 1 <= len(result.dates) <= MAX_DATES
+        and dates_supported
+    ):
+        return result
+
+    result.confidence = round(
+        DATE_WEIGHT
+        + VENUE_WEIGHT
+        + ARTIST_WEIGHT
+        + (TIME_WEIGHT if result.event_time else 0.0)
+        + (PRICE_WEIGHT if result.prices else 0.0),
+        2,
+    )
+
+    venue = result.venues[0]
+    title = result.title or f"{result.artist_name} @ {venue.name}"
+    result.events = [
+        ExtractedEvent(
+            title=title,
+            artist_name=result.artist_name,
+            category=_category(f"{page_title}\n{text}"),
+            event_date=event_date,
+            event_time=result.event_time,
+            venue=venue.name,
+            city=venue.city,
+            country=venue.country,
+            timezone=venue.timezone,
+            price_currency=result.price_currency,
+            price_min=min(result.prices) if result.prices else None,
+            price_max=max(result.prices) if result.prices else None,
+            source_url=source_url,
+            confidence=result.confidence,
+        )
+        for event_date in result.dates
+    ]
+    return result
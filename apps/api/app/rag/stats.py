@@ -0,0 +1,122 @@
+"""In-process counters for RAG pipeline caches and filters (per worker process)."""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a cache sitting in front of a paid API."""
+
+    hits: int = 0
+    misses: int = 0
+    miss_seconds: float = 0.0  # Upstream time spent on misses
+
+    def record_hits(self, count: int = 1) -> None:
+        """Record cache hits."""
+        self.hits += count
+
+    def record_miss(self, seconds: float = 0.0) -> None:
+        """Record a cache miss and the upstream time it cost."""
+        self.misses += 1
+        self.miss_seconds += seconds
+
+    def to_dict(self) -> dict:
+        """
+        Snapshot for the stats endpoint.
+
+        estimated_seconds_saved assumes a hit would have cost the
+        average observed miss latency.
+        """
+        lookups = self.hits + self.misses
+        avg_miss_seconds = self.miss_seconds / self.misses if self.misses else 0.0
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "avg_miss_seconds": round(avg_miss_seconds, 3),
+            "estimated_seconds_saved": round(self.hits * avg_miss_seconds, 1),
+        }
+
+
+@dataclass
+class FilterStats:
+    """Kept/skipped counters for a filter sitting in front of a paid API."""
+
+    kept: int = 0
+    skipped: int = 0
+
+    def record(self, kept: int, skipped: int) -> None:
+        """Record the outcome of one filter pass."""
+        self.kept += kept
+        self.skipped += skipped
+
+    def to_dict(self) -> dict:
+        """Snapshot for the stats endpoint."""
+        total = self.kept + self.skipped
+        return {
+            "kept": self.kept,
+            "skipped": self.skipped,
+            "skip_rate": round(self.skipped / total, 4) if total else 0.0,
+        }
+
+
+@dataclass
+class TierStats:
+    """Latency/yield counters for one tier of a model cascade."""
+
+    calls: int = 0
+    failures: int = 0
+    seconds: float = 0.0
+    events: int = 0
+    invalid: int = 0  # Returned objects that failed validation
+    escalated: int = 0  # Answers handed on to the next tier
+
+    def record_call(self, seconds: float, failed: bool = False) -> None:
+        """Record one request to the tier's model."""
+        self.calls += 1
+        self.seconds += seconds
+        if failed:
+            self.failures += 1
+
+    def record_yield(self, events: int, invalid: int) -> None:
+        """Record what one answer yielded."""
+        self.events += events
+        self.invalid += invalid
+
+    def to_dict(self) -> dict:
+        """Snapshot for the stats endpoint."""
+        answered = self.calls - self.failures
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "avg_seconds": round(self.seconds / self.calls, 3) if self.calls else 0.0,
+            "events_per_call": round(self.events / answered, 2) if answered else 0.0,
+            "invalid": self.invalid,
+            "escalated": self.escalated,
+            "escalation_rate": round(self.escalated / answered, 4) if answered else 0.0,
+        }
+
+
+@dataclass
+class CompactionStats:
+    """Token counters for compacted extraction input."""
+
+    documents: int = 0
+    tokens_in: int = 0
+    tokens_out: int = 0
+
+    def record(self, tokens_in: int, tokens_out: int) -> None:
+        """Record one compacted document."""
+        self.documents += 1
+        self.tokens_in += tokens_in
+        self.tokens_out += tokens_out
+
+    def to_dict(self) -> dict:
+        """Snapshot for the stats endpoint."""
+        saved = self.tokens_in - self.tokens_out
+        return {
+            "documents": self.documents,
+            "tokens_in": self.tokens_in,
+            "tokens_out": self.tokens_out,
+            "saved_rate": round(saved / self.tokens_in, 4) if self.tokens_in else 0.0,
+        }
@@ -0,0 +1,77 @@
+"""Incremental parsing of a streamed JSON array of objects."""
+
+from typing import List, Optional
+import json
+
+
+class JsonArrayStream:
+    """
+    Yields the objects of a JSON array as soon as each one closes.
+
+    Feed it the text of a streamed completion piece by piece. The first
+    array in the document is the one whose elements are returned, so both
+    a bare `[{...}, ...]` and a wrapper like `{"events": [{...}, ...]}`
+    work. Elements that are not objects, or don't parse, are skipped.
+    """
+
+    def __init__(self):
+        self._text = ""
+        self._position = 0  # Next character to scan
+        self._stack: List[str] = []  # Open "[" / "{"
+        self._in_string = False
+        self._escaped = False
+        self._array_depth: Optional[int] = None  # Stack size inside the array
+        self._object_start: Optional[int] = None  # Start of the current element
+
+    def feed(self, chunk: str) -> List[dict]:
+        """Add streamed text; returns the array elements completed by it."""
+        self._text += chunk
+        completed: List[dict] = []
+
+        text = self._text
+        for position in range(self._position, len(text)):
+            char = text[position]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char in "[{":
+                if char == "{" and len(self._stack) == self._array_depth:
+                    self._object_start = position
+                self._stack.append(char)
+                if char == "[" and self._array_depth is None:
+                    self._array_depth = len(self._stack)
+            elif char in "]}" and self._stack:
+                self._stack.pop()
+                if (
+                    char == "}"
+                    and self._object_start is not None
+                    and len(self._stack) == self._array_depth
+                ):
+                    item = self._parse(text[self._object_start : position + 1])
+                    if item is not None:
+                        completed.append(item)
+                    self._object_start = None
+
+        # Text before the current element is never looked at again
+        keep_from = self._object_start if self._object_start is not None else len(text)
+        self._text = text[keep_from:]
+        if self._object_start is not None:
+            self._object_start = 0
+        self._position = len(self._text)
+        return completed
+
+    @staticmethod
+    def _parse(raw: str) -> Optional[dict]:
+        try:
+            item = json.loads(raw)
+        except json.JSONDecodeError:
+            return None
+        return item if isinstance(item, dict) else None
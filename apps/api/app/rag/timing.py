@@ -0,0 +1,48 @@
+"""Per-stage timing for RAG pipeline runs."""
+
+from typing import Dict, Iterator
+from contextlib import contextmanager
+import time
+
+
+class StageTimings:
+    """
+    Monotonic wall-clock timings for pipeline stages.
+
+    Stages can be entered more than once (e.g. one store per streamed
+    batch); their durations add up. Per-source extraction times are kept
+    separately, keyed by source URL, as are the extracted objects dropped
+    for failing validation.
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+        self.sources: Dict[str, float] = {}
+        self.dropped: Dict[str, int] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a block of work as stage `name`."""
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start_time)
+
+    def add(self, name: str, seconds: float) -> None:
+        """Add seconds to stage `name`."""
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def record_source(self, source_url: str, seconds: float) -> None:
+        """Record extraction time for one source."""
+        self.sources[source_url] = self.sources.get(source_url, 0.0) + seconds
+
+    def to_dict(self) -> dict:
+        """Rounded breakdown, e.g. for SearchCache.stage_timings."""
+        return {
+            **{name: round(seconds, 3) for name, seconds in self.stages.items()},
+            "sources": {
+                url: round(seconds, 3) for url, seconds in self.sources.items()
+            },
+            "dropped": dict(self.dropped),
+        }
@@ -1,21 +1,28 @@
 """Search router for RAG search endpoints."""
 
-from uuid import UUID
+from typing import AsyncIterator
+from uuid import UUID, uuid4
+import time
 
-from fastapi import APIRouter, HTTPException, status, Query, Depends
+from fastapi import APIRouter, HTTPException, status, Query, Depends, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 
+from app.config import settings
 from app.dependencies import DbSession, get_current_user
-from app.models import User
+from app.models import User, SearchJobStatus
 from app.schemas import (
     RAGSearchRequest,
     SearchResult,
+    SearchStreamBatch,
+    SearchStreamSummary,
     EventResponse,
     RecentSearchResponse,
     RecentSearchListResponse,
     SaveRecentSearchRequest,
     MessageResponse,
 )
-from app.services import SearchService, RecentSearchService
+from app.services import SearchService, RecentSearchService, SearchJobService
 
 router = APIRouter(prefix="/search", tags=["Search"])
 
@@ -24,8 +31,10 @@ router = APIRouter(prefix="/search", tags=["Search"])
 async def rag_search(
     request: RAGSearchRequest,
     db: DbSession,
+    response: Response,
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    debug: bool = Query(False, description="Include per-stage pipeline timings"),
 ) -> SearchResult:
     """
     Perform RAG search for artist events.
@@ -40,9 +49,34 @@ async def rag_search(
     3. Returns paginated results
 
     Use force_refresh=true to bypass cache.
+    Use debug=true to get the pipeline's per-stage timings (only when the
+    server runs with DEBUG enabled).
+
+    With async_job=true, a cache miss queues the pipeline for a search
+    worker and returns 202 with status "pending" and the searchId to poll
+    via GET /search/{searchId}.
     """
     search_service = SearchService(db)
 
+    if request.async_job and (
+        request.force_refresh or not await search_service.get_cached_search(request.query)
+    ):
+        job = await SearchJobService(db).enqueue(
+            request.query, force_refresh=request.force_refresh
+        )
+        response.status_code = status.HTTP_202_ACCEPTED
+        return SearchResult(
+            searchId=str(job.id),
+            query=request.query,
+            events=[],
+            total=0,
+            searchTime=0.0,
+            cached=False,
+            page=page,
+            hasMore=False,
+            status=job.status.value,
+        )
+
     events, search_id, total, search_time, cached = await search_service.rag_search(
         query=request.query,
         force_refresh=request.force_refresh,
@@ -59,6 +93,70 @@ async def rag_search(
         cached=cached,
         page=page,
         hasMore=(page * per_page) < total,
+        timings=search_service.stage_timings if debug and settings.debug else None,
+    )
+
+
+def _sse_frame(event: str, data: BaseModel) -> str:
+    """Format a Server-Sent Events frame."""
+    return f"event: {event}\ndata: {data.model_dump_json()}\n\n"
+
+
+@router.post("/stream")
+async def rag_search_stream(
+    request: RAGSearchRequest,
+    db: DbSession,
+) -> StreamingResponse:
+    """
+    Perform RAG search, streaming results as Server-Sent Events.
+
+    Frames:
+    - `events`: SearchStreamBatch. Known DB matches come first, then one
+      batch per web source as soon as its extraction finishes
+      (a cache hit sends a single `cache` batch instead)
+    - `done`: SearchStreamSummary with total and searchTime
+
+    Events are not paginated and each event is sent once.
+    Use force_refresh=true to bypass cache.
+    """
+    search_service = SearchService(db)
+    search_id = str(uuid4())
+
+    async def frames() -> AsyncIterator[str]:
+        start_time = time.time()
+        total = 0
+        cached = False
+
+        async for stage, events in search_service.rag_search_stream(
+            query=request.query,
+            force_refresh=request.force_refresh,
+        ):
+            total += len(events)
+            cached = stage == "cache"
+            yield _sse_frame(
+                "events",
+                SearchStreamBatch(
+                    searchId=search_id,
+                    stage=stage,
+                    events=[EventResponse.from_db_model(e) for e in events],
+                ),
+            )
+
+        yield _sse_frame(
+            "done",
+            SearchStreamSummary(
+                searchId=search_id,
+                query=request.query,
+                total=total,
+                searchTime=round(time.time() - start_time, 2),
+                cached=cached,
+            ),
+        )
+
+    return StreamingResponse(
+        frames(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
@@ -158,3 +256,50 @@ async def clear_recent_searches(
     count = await recent_search_service.clear_recent_searches(current_user.id)
 
     return MessageResponse(message=f"Cleared {count} recent searches")
+
+
+# ============== Search Jobs ==============
+# Declared last so /search/{search_id} doesn't shadow the routes above.
+
+
+@router.get("/{search_id}", response_model=SearchResult)
+async def get_search_result(
+    search_id: UUID,
+    db: DbSession,
+    page: int = Query(1, ge=1, description="Page number"),
+    per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    wait: float = Query(
+        0, ge=0, le=30, description="Long-poll: seconds to wait for completion"
+    ),
+) -> SearchResult:
+    """
+    Get the result of a search queued with async_job=true.
+
+    status is "pending"/"running" until a worker finishes the job; pass
+    wait to long-poll instead of polling repeatedly.
+    """
+    job_service = SearchJobService(db)
+    job = await job_service.wait_for_job(search_id, timeout=wait)
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Search not found",
+        )
+
+    events = []
+    event_ids = [UUID(eid) for eid in job.event_ids or []]
+    if job.status == SearchJobStatus.COMPLETED:
+        events = await SearchService(db).load_page(event_ids, page, per_page)
+
+    return SearchResult(
+        searchId=str(job.id),
+        query=job.query,
+        events=[EventResponse.from_db_model(e) for e in events],
+        total=len(event_ids),
+        searchTime=round(job.search_time_seconds or 0.0, 2),
+        cached=False,
+        page=page,
+        hasMore=(page * per_page) < len(event_ids),
+        status=job.status.value,
+    )
@@ -41,6 +41,8 @@ from app.schemas.search import (
     RAGSearchRequest,
     SearchPageRequest,
     SearchResult,
+    SearchStreamBatch,
+    SearchStreamSummary,
     SearchCacheInfo,
     RecentSearchResponse,
     RecentSearchListResponse,
@@ -87,6 +89,8 @@ __all__ = [
     "RAGSearchRequest",
     "SearchPageRequest",
     "SearchResult",
+    "SearchStreamBatch",
+    "SearchStreamSummary",
     "SearchCacheInfo",
     "RecentSearchResponse",
     "RecentSearchListResponse",
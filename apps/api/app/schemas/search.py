@@ -1,7 +1,7 @@
 """Search schemas for API request/response."""
 
 from datetime import datetime
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from uuid import UUID
 from pydantic import BaseModel, Field
 
@@ -19,6 +19,11 @@ class RAGSearchRequest(BaseModel):
         default=False,
         description="Force bypass cache and perform fresh RAG search",
     )
+    async_job: bool = Field(
+        default=False,
+        description="On cache miss, queue a background search and return its "
+        "searchId immediately (poll GET /search/{searchId})",
+    )
 
 
 class SearchPageRequest(BaseModel):
@@ -42,6 +47,26 @@ class SearchResult(BaseModel):
     cached: bool
     page: int
     hasMore: bool
+    status: str = "completed"  # "pending" | "running" | "completed" | "failed"
+    timings: Optional[Dict[str, Any]] = None  # Stage breakdown (debug=true only)
+
+
+class SearchStreamBatch(BaseModel):
+    """Schema for one streamed batch of search results (SSE "events" frame)."""
+
+    searchId: str
+    stage: str  # "cache" | "db" | "web"
+    events: List[EventResponse]
+
+
+class SearchStreamSummary(BaseModel):
+    """Schema for the final streamed search frame (SSE "done" frame)."""
+
+    searchId: str
+    query: str
+    total: int
+    searchTime: float  # in seconds
+    cached: bool
 
 
 class SearchCacheInfo(BaseModel):
@@ -50,6 +75,7 @@ class SearchCacheInfo(BaseModel):
     query: str
     total_results: int
     search_time_seconds: float
+    stage_timings: Optional[Dict[str, Any]] = None
     created_at: datetime
     expires_at: datetime
 
@@ -9,6 +9,7 @@ from app.services.artist import ArtistService
 from app.services.event import EventService
 from app.services.search import SearchService
 from app.services.recent_search import RecentSearchService
+from app.services.search_job import SearchJobService
 
 __all__ = [
     "AuthService",
@@ -19,4 +20,5 @@ __all__ = [
     "EventService",
     "SearchService",
     "RecentSearchService",
+    "SearchJobService",
 ]
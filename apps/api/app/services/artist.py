@@ -1,12 +1,38 @@
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict
 from uuid import UUID
-from sqlalchemy import select, or_, func
+import re
+
+from sqlalchemy import select, insert, and_, or_, func, literal
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import Artist
 from app.schemas import ArtistCreate, ArtistUpdate
 
 
+def _regex_escape(text: str) -> str:
+    """Escape text for a Postgres regular expression (ARE)."""
+    return re.sub(r"([^\w\s])", r"\\\1", text)
+
+
+def _contains_name(text: str, name: str, word_bounded: bool) -> bool:
+    """Case-folded containment, optionally only on word boundaries."""
+    text, name = text.casefold(), name.casefold()
+    if word_bounded:
+        return re.search(rf"(?<!\w){re.escape(name)}(?!\w)", text) is not None
+    return name in text
+
+
+def _match_rank(query: str, names: List[str]) -> Optional[int]:
+    """0 = exact name, 1 = name in query, 2 = query in name, None = no match."""
+    if any(name.casefold() == query.casefold() for name in names):
+        return 0
+    if any(_contains_name(query, name, name.isascii()) for name in names):
+        return 1
+    if any(_contains_name(name, query, True) for name in names):
+        return 2
+    return None
+
+
 class ArtistService:
     """Service for artist operations."""
 
@@ -114,6 +140,83 @@ class ArtistService:
         artist = await self.create_artist(data)
         return artist, True
 
+    async def get_or_create_artist_ids(self, names: List[str]) -> Dict[str, UUID]:
+        """
+        Resolve artist IDs by exact name in bulk, creating missing artists.
+
+        Uses one SELECT for existing artists and one multi-row
+        INSERT ... RETURNING for new ones. Does not commit.
+        Returns {name: artist_id}.
+        """
+        unique_names = list(dict.fromkeys(names))
+        if not unique_names:
+            return {}
+
+        result = await self.db.execute(
+            select(Artist.name, Artist.id).where(Artist.name.in_(unique_names))
+        )
+        artist_ids = {name: artist_id for name, artist_id in result.all()}
+
+        missing = [name for name in unique_names if name not in artist_ids]
+        if missing:
+            result = await self.db.execute(
+                insert(Artist).returning(Artist.name, Artist.id),
+                [{"name": name} for name in missing],
+            )
+            artist_ids.update({name: artist_id for name, artist_id in result.all()})
+
+        return artist_ids
+
+    async def get_artists_in_query(self, query: str) -> List[List[str]]:
+        """
+        Get names of known artists mentioned in query, best match first.
+
+        An artist matches if its name or name_ko appears in the query
+        (ASCII names on word boundaries; Korean ones may carry particles),
+        or if the whole query is one of its names or a word-bounded part
+        of one. Exact matches rank first, then names found in the query,
+        then names containing the query; ties go to more followers.
+
+        No index serves these conditions, so every call scans the whole
+        artists table; fine for the current catalog size, but a trigram
+        index would be needed if it grows large.
+
+        Returns:
+            One list per artist: [name] or [name, name_ko]
+        """
+        query = query.strip()
+        if not query:
+            return []
+
+        # Word-bounded query inside a name (Postgres ARE; the query is
+        # escaped so its punctuation is matched literally)
+        query_regex = r"(^|\W)" + _regex_escape(query) + r"(\W|$)"
+        # Name inside the query; strpos rather than LIKE so a "%" or "_"
+        # in a name isn't a wildcard
+        lowered_query = func.lower(literal(query))
+        result = await self.db.execute(
+            select(Artist.name, Artist.name_ko, Artist.follower_count).where(
+                or_(
+                    func.strpos(lowered_query, func.lower(Artist.name)) > 0,
+                    and_(
+                        Artist.name_ko.isnot(None),
+                        func.strpos(lowered_query, func.lower(Artist.name_ko)) > 0,
+                    ),
+                    Artist.name.op("~*")(query_regex),
+                    Artist.name_ko.op("~*")(query_regex),
+                )
+            )
+        )
+
+        ranked: List[Tuple[int, int, List[str]]] = []
+        for name, name_ko, follower_count in result.all():
+            names = [n for n in (name, name_ko) if n and n.strip()]
+            rank = _match_rank(query, names) if names else None
+            if rank is not None:
+                ranked.append((rank, -follower_count, names))
+        ranked.sort(key=lambda item: item[:2])
+        return [names for _, _, names in ranked]
+
     async def get_related_artists(
         self,
         artist_id: UUID,
@@ -0,0 +1,129 @@
+"""Extraction cache service: skip LLM calls for unchanged pages."""
+
+from typing import Dict, List, Tuple
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, update, delete, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models import ExtractionCache
+from app.rag.extractor import ExtractedEvent, content_hash
+from app.rag.stats import CacheStats
+
+# Process-wide hit/miss counters (exposed via GET /stats)
+extraction_cache_stats = CacheStats()
+
+
+class ExtractionCacheService:
+    """Persistent cache of parsed LLM extraction results."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_many(self, cache_keys: List[str]) -> Dict[str, List[ExtractedEvent]]:
+        """
+        Look up cached extractions in one query.
+
+        Hits get their LRU timestamp and hit count bumped. Does not commit.
+        Returns {cache_key: events} for hits only.
+        """
+        unique_keys = list(dict.fromkeys(cache_keys))
+        if not unique_keys:
+            return {}
+
+        now = datetime.now(timezone.utc)
+        result = await self.db.execute(
+            select(ExtractionCache.cache_key, ExtractionCache.events).where(
+                ExtractionCache.cache_key.in_(unique_keys),
+                ExtractionCache.expires_at > now,
+            )
+        )
+        hits = {
+            cache_key: [ExtractedEvent.model_validate(item) for item in events]
+            for cache_key, events in result.all()
+        }
+
+        if hits:
+            await self.db.execute(
+                update(ExtractionCache)
+                .where(ExtractionCache.cache_key.in_(list(hits)))
+                .values(
+                    hit_count=ExtractionCache.hit_count + 1,
+                    last_hit_at=now,
+                )
+            )
+            extraction_cache_stats.record_hits(len(hits))
+
+        return hits
+
+    async def save_many(
+        self,
+        entries: List[Tuple[str, str, str, str, List[ExtractedEvent]]],
+        model: str,
+    ) -> None:
+        """
+        Save extraction results and evict old entries. Does not commit.
+
+        Args:
+            entries: (cache_key, source_url, content, prompt_version, events)
+                tuples
+            model: Extraction model that produced the events
+        """
+        if not entries:
+            return
+
+        now = datetime.now(timezone.utc)
+        expires_at = now + timedelta(hours=settings.extraction_cache_ttl_hours)
+        rows = {
+            cache_key: {
+                "cache_key": cache_key,
+                "source_url": source_url[:500],
+                "content_hash": content_hash(content),
+                "prompt_version": prompt_version,
+                "model": model,
+                "events": [event.model_dump(mode="json") for event in events],
+                "hit_count": 0,
+                "last_hit_at": now,
+                "expires_at": expires_at,
+            }
+            for cache_key, source_url, content, prompt_version, events in entries
+        }
+
+        stmt = insert(ExtractionCache)
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[ExtractionCache.cache_key],
+                set_={
+                    "events": stmt.excluded.events,
+                    "last_hit_at": stmt.excluded.last_hit_at,
+                    "expires_at": stmt.excluded.expires_at,
+                },
+            ),
+            list(rows.values()),
+        )
+
+        await self.evict()
+
+    async def evict(self) -> int:
+        """
+        Delete expired entries, then least recently used entries beyond
+        extraction_cache_max_entries. Returns count of deleted entries.
+        """
+        expired = await self.db.execute(
+            delete(ExtractionCache).where(
+                ExtractionCache.expires_at <= func.now()
+            )
+        )
+
+        overflow = (
+            select(ExtractionCache.id)
+            .order_by(ExtractionCache.last_hit_at.desc())
+            .offset(settings.extraction_cache_max_entries)
+        )
+        evicted = await self.db.execute(
+            delete(ExtractionCache).where(ExtractionCache.id.in_(overflow))
+        )
+
+        return expired.rowcount + evicted.rowcount
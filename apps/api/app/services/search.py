@@ -1,11 +1,13 @@
 """Search service for RAG search and caching."""
 
-from typing import Optional, List, Tuple
+from typing import AsyncIterator, Optional, List, Tuple
 from uuid import UUID, uuid4
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from contextlib import asynccontextmanager
 import time
 
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, text
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
@@ -13,6 +15,10 @@ from app.models import Event, SearchCache
 from app.services.event import EventService
 from app.rag import RAGPipeline, embeddings_service
 from app.schemas import EventResponse
+from app.services.single_flight import SingleFlight
+
+# In-process coalescing of concurrent cache-miss searches per query
+_search_flight: SingleFlight[Tuple[List[UUID], float, Optional[dict]]] = SingleFlight()
 
 
 class SearchService:
@@ -22,10 +28,12 @@ class SearchService:
         self.db = db
         self.event_service = EventService(db)
         self.rag_pipeline = RAGPipeline(db)
+        # Per-stage breakdown behind the last rag_search result
+        self.stage_timings: Optional[dict] = None
 
     async def get_cached_search(self, query: str) -> Optional[SearchCache]:
         """Get cached search result if not expired."""
-        normalized_query = query.lower().strip()
+        normalized_query = self._normalize_query(query)
 
         result = await self.db.execute(
             select(SearchCache).where(
@@ -40,9 +48,10 @@ class SearchService:
         query: str,
         event_ids: List[UUID],
         search_time_seconds: float,
+        stage_timings: Optional[dict] = None,
     ) -> SearchCache:
-        """Save search results to cache."""
-        normalized_query = query.lower().strip()
+        """Save search results to cache, with the run's stage breakdown."""
+        normalized_query = self._normalize_query(query)
 
         # Delete existing cache for this query
         await self.db.execute(
@@ -55,6 +64,7 @@ class SearchService:
             event_ids=[str(eid) for eid in event_ids],
             total_results=len(event_ids),
             search_time_seconds=search_time_seconds,
+            stage_timings=stage_timings,
             expires_at=datetime.utcnow()
             + timedelta(hours=settings.search_cache_ttl_hours),
         )
@@ -73,6 +83,10 @@ class SearchService:
         """
         Perform RAG search with caching.
 
+        Concurrent cache misses for the same normalized query are coalesced:
+        one request per process runs the pipeline (and one per cluster,
+        via a Postgres advisory lock); the others wait for its result.
+
         Args:
             query: Search query
             force_refresh: Bypass cache
@@ -81,6 +95,9 @@ class SearchService:
 
         Returns:
             Tuple of (events, search_id, total, search_time, cached)
+
+        The stage breakdown of the pipeline run behind the result (the
+        original run on cache hits) is left in self.stage_timings.
         """
         start_time = time.time()
         search_id = str(uuid4())
@@ -93,46 +110,219 @@ class SearchService:
         if cached:
             # Cache hit - return cached results
             event_ids = [UUID(eid) for eid in cached.event_ids]
-            all_events = await self.event_service.get_events_by_ids(event_ids)
-
-            # Paginate
-            start_idx = (page - 1) * per_page
-            end_idx = start_idx + per_page
-            events = all_events[start_idx:end_idx]
+            events = await self.load_page(event_ids, page, per_page)
+            self.stage_timings = cached.stage_timings
 
             search_time = time.time() - start_time
             return events, search_id, len(event_ids), search_time, True
 
-        # Cache miss - run RAG pipeline
-        new_events, rag_time = await self.rag_pipeline.run(query)
+        # Cache miss - run RAG pipeline (once per query across requests)
+        event_ids, search_time, self.stage_timings = await self.refresh_search(
+            query, force_refresh
+        )
+        events = await self.load_page(event_ids, page, per_page)
 
-        # Also search existing events by text
-        existing_events, _ = await self.event_service.search_events(
-            query=query, page=1, per_page=100
+        return events, search_id, len(event_ids), search_time, False
+
+    async def refresh_search(
+        self,
+        query: str,
+        force_refresh: bool = False,
+    ) -> Tuple[List[UUID], float, Optional[dict]]:
+        """
+        Run the RAG pipeline for a query and cache the result, coalescing
+        with any run already in flight for the same query.
+
+        Returns:
+            Tuple of (event_ids sorted by date, search_time, stage_timings)
+        """
+        return await _search_flight.do(
+            self._normalize_query(query),
+            lambda: self._refresh_search(query, force_refresh),
         )
 
-        # Combine and deduplicate
-        all_event_ids = set()
-        combined_events = []
-        for event in new_events + existing_events:
-            if event.id not in all_event_ids:
-                all_event_ids.add(event.id)
-                combined_events.append(event)
+    async def _refresh_search(
+        self,
+        query: str,
+        force_refresh: bool,
+    ) -> Tuple[List[UUID], float, Optional[dict]]:
+        """
+        Run the RAG pipeline for a query and save the result to cache.
+
+        Holds a Postgres advisory lock on the normalized query, so workers
+        in other processes wait and then reuse the cache entry written by
+        whichever got there first. Runs hit by upstream failures are
+        returned but not cached.
 
-        # Sort by date
-        combined_events.sort(key=lambda e: (e.event_date, e.event_time or "00:00"))
+        Returns:
+            Tuple of (event_ids sorted by date, search_time, stage_timings)
+        """
+        start_time = time.time()
+        started_at = datetime.now(timezone.utc)
+
+        async with self._advisory_lock(self._normalize_query(query)):
+            # Another worker may have refreshed while we waited for the lock
+            cached = await self.get_cached_search(query)
+            if cached and (not force_refresh or cached.created_at >= started_at):
+                event_ids = [UUID(eid) for eid in cached.event_ids]
+                return event_ids, cached.search_time_seconds, cached.stage_timings
+
+            new_events, rag_time = await self.rag_pipeline.run(query)
+            timings = self.rag_pipeline.timings
+
+            # Also search existing events by text
+            with timings.stage("db_search"):
+                existing_events, _ = await self.event_service.search_events(
+                    query=query, page=1, per_page=100
+                )
 
-        # Save to cache
-        event_ids = [e.id for e in combined_events]
-        search_time = time.time() - start_time
-        await self.save_search_cache(query, event_ids, search_time)
+            # Combine and deduplicate
+            all_event_ids = set()
+            combined_events = []
+            for event in new_events + existing_events:
+                if event.id not in all_event_ids:
+                    all_event_ids.add(event.id)
+                    combined_events.append(event)
+
+            # Sort by date
+            combined_events.sort(key=lambda e: (e.event_date, e.event_time or "00:00"))
+
+            event_ids = [e.id for e in combined_events]
+            search_time = time.time() - start_time
+            stage_timings = timings.to_dict()
+
+            # Save to cache, unless an upstream failure made the result partial
+            if self.rag_pipeline.upstream_errors:
+                print(
+                    f"Not caching search '{query}': "
+                    f"{len(self.rag_pipeline.upstream_errors)} upstream failure(s)"
+                )
+            else:
+                await self.save_search_cache(
+                    query, event_ids, search_time, stage_timings
+                )
+
+            return event_ids, search_time, stage_timings
+
+    @asynccontextmanager
+    async def _advisory_lock(self, key: str) -> AsyncIterator[None]:
+        """
+        Hold a session-level Postgres advisory lock for key.
+
+        Uses a dedicated connection because the session releases its
+        connection on every commit. Gives up waiting after
+        search_coalesce_timeout_seconds and proceeds without the lock.
+        """
+        lock_id = {"key": key}
+        async with self.db.bind.connect() as conn:
+            try:
+                await conn.execute(
+                    text("SELECT set_config('lock_timeout', :timeout, true)"),
+                    {"timeout": f"{settings.search_coalesce_timeout_seconds}s"},
+                )
+                await conn.execute(
+                    text("SELECT pg_advisory_lock(hashtextextended(:key, 0))"),
+                    lock_id,
+                )
+                await conn.commit()
+                locked = True
+            except DBAPIError:
+                # lock_timeout hit: run unlocked rather than fail the request
+                await conn.rollback()
+                locked = False
 
-        # Paginate
+            try:
+                yield
+            finally:
+                if locked:
+                    await conn.execute(
+                        text("SELECT pg_advisory_unlock(hashtextextended(:key, 0))"),
+                        lock_id,
+                    )
+                    await conn.commit()
+
+    async def load_page(
+        self,
+        event_ids: List[UUID],
+        page: int,
+        per_page: int,
+    ) -> List[Event]:
+        """Load one page of events, keeping the order of event_ids."""
         start_idx = (page - 1) * per_page
         end_idx = start_idx + per_page
-        events = combined_events[start_idx:end_idx]
+        page_ids = event_ids[start_idx:end_idx]
+
+        events = await self.event_service.get_events_by_ids(page_ids)
+        event_map = {e.id: e for e in events}
+        return [event_map[eid] for eid in page_ids if eid in event_map]
+
+    @staticmethod
+    def _normalize_query(query: str) -> str:
+        """Normalize query the same way the search cache does."""
+        return query.lower().strip()
+
+    async def rag_search_stream(
+        self,
+        query: str,
+        force_refresh: bool = False,
+    ) -> AsyncIterator[Tuple[str, List[Event]]]:
+        """
+        Perform RAG search, yielding events as soon as they are known.
+
+        Order of batches:
+        1. "cache": all cached events (cache hit, nothing else follows)
+        2. "db": existing events matching the query
+        3. "web": newly stored events, one batch per finished source
+
+        Each event is yielded at most once. On a cache miss the combined
+        result is saved to the search cache after the last batch, unless
+        an upstream API failed along the way.
 
-        return events, search_id, len(combined_events), search_time, False
+        Args:
+            query: Search query
+            force_refresh: Bypass cache
+
+        Yields:
+            Tuples of (stage, events)
+        """
+        start_time = time.time()
+
+        cached = None
+        if not force_refresh:
+            cached = await self.get_cached_search(query)
+
+        if cached:
+            event_ids = [UUID(eid) for eid in cached.event_ids]
+            yield "cache", await self.event_service.get_events_by_ids(event_ids)
+            return
+
+        # Already-known matches first
+        existing_events, _ = await self.event_service.search_events(
+            query=query, page=1, per_page=100
+        )
+        combined_events = list(existing_events)
+        all_event_ids = {e.id for e in combined_events}
+        yield "db", existing_events
+
+        # Then each source as it finishes extraction
+        async for new_events in self.rag_pipeline.run_stream(query):
+            batch = [e for e in new_events if e.id not in all_event_ids]
+            all_event_ids.update(e.id for e in batch)
+            combined_events.extend(batch)
+            if batch:
+                yield "web", batch
+
+        if self.rag_pipeline.upstream_errors:
+            # Partial result: don't cache it for search_cache_ttl_hours
+            return
+
+        combined_events.sort(key=lambda e: (e.event_date, e.event_time or "00:00"))
+        await self.save_search_cache(
+            query,
+            [e.id for e in combined_events],
+            time.time() - start_time,
+            self.rag_pipeline.timings.to_dict(),
+        )
 
     async def vector_search(
         self,
@@ -149,8 +339,9 @@ class SearchService:
         Returns:
             List of (event, distance) tuples
         """
-        # Generate query embedding
-        query_embedding = await embeddings_service.get_embedding(query)
+        # Generate query embedding (repeated queries are served from cache)
+        query_embedding = await embeddings_service.get_embedding(query, db=self.db)
+        await self.db.commit()
 
         # Vector search
         return await self.event_service.vector_search(query_embedding, limit)
@@ -0,0 +1,212 @@
+"""Search job service: Postgres-backed queue for background RAG searches."""
+
+from typing import Optional, List
+from uuid import UUID
+from datetime import datetime, timedelta, timezone
+import asyncio
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models import SearchJob, SearchJobStatus
+
+TERMINAL_STATUSES = (SearchJobStatus.COMPLETED, SearchJobStatus.FAILED)
+ACTIVE_STATUSES = (SearchJobStatus.PENDING, SearchJobStatus.RUNNING)
+
+
+class SearchJobService:
+    """Service for enqueuing, claiming and completing search jobs."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def enqueue(self, query: str, force_refresh: bool = False) -> SearchJob:
+        """
+        Enqueue a search job.
+
+        If a job for the same normalized query is already pending or
+        running, that job is returned instead of queueing a duplicate.
+        Jobs whose worker timed out are released first (see
+        release_stale_jobs), so a dead job is never returned. Concurrent
+        enqueues of one query are settled by the uq_search_jobs_active_query
+        index: the loser returns the winner's job.
+        """
+        normalized_query = query.lower().strip()
+
+        await self.release_stale_jobs(normalized_query)
+        existing = await self._active_job(normalized_query)
+        if existing:
+            await self.db.commit()
+            return existing
+
+        job = SearchJob(
+            query=normalized_query,
+            force_refresh=force_refresh,
+            status=SearchJobStatus.PENDING,
+        )
+        self.db.add(job)
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            existing = await self._active_job(normalized_query)
+            await self.db.commit()
+            if existing is None:
+                raise
+            return existing
+        await self.db.refresh(job)
+        return job
+
+    async def _active_job(self, normalized_query: str) -> Optional[SearchJob]:
+        result = await self.db.execute(
+            select(SearchJob)
+            .where(
+                SearchJob.query == normalized_query,
+                SearchJob.status.in_(ACTIVE_STATUSES),
+            )
+            .order_by(SearchJob.created_at.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    async def release_stale_jobs(self, normalized_query: Optional[str] = None) -> int:
+        """
+        Release jobs stuck in running longer than search_job_timeout_seconds.
+
+        The worker is presumed dead: jobs with attempts left go back to
+        pending, the rest are marked as failed. Not committed.
+
+        Args:
+            normalized_query: Only release jobs for this query (None: all)
+
+        Returns:
+            Number of jobs released
+        """
+        now = datetime.now(timezone.utc)
+        stale_before = now - timedelta(seconds=settings.search_job_timeout_seconds)
+        stale = [
+            SearchJob.status == SearchJobStatus.RUNNING,
+            SearchJob.started_at < stale_before,
+        ]
+        if normalized_query is not None:
+            stale.append(SearchJob.query == normalized_query)
+
+        failed = await self.db.execute(
+            update(SearchJob)
+            .where(*stale, SearchJob.attempts >= settings.search_job_max_attempts)
+            .values(
+                status=SearchJobStatus.FAILED,
+                error="Timed out: worker stopped responding",
+                finished_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        retried = await self.db.execute(
+            update(SearchJob)
+            .where(*stale)
+            .values(status=SearchJobStatus.PENDING)
+            .execution_options(synchronize_session=False)
+        )
+        return failed.rowcount + retried.rowcount
+
+    async def get_job(self, job_id: UUID) -> Optional[SearchJob]:
+        """Get job by ID."""
+        result = await self.db.execute(
+            select(SearchJob).where(SearchJob.id == job_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def wait_for_job(self, job_id: UUID, timeout: float) -> Optional[SearchJob]:
+        """
+        Long-poll a job until it finishes or timeout seconds pass.
+
+        The transaction is ended between polls so no connection is held
+        while waiting.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        while True:
+            result = await self.db.execute(
+                select(SearchJob)
+                .where(SearchJob.id == job_id)
+                .execution_options(populate_existing=True)
+            )
+            job = result.scalar_one_or_none()
+            await self.db.commit()
+
+            if job is None or job.status in TERMINAL_STATUSES:
+                return job
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return job
+
+            await asyncio.sleep(
+                min(settings.search_job_poll_interval_seconds, remaining)
+            )
+
+    async def claim_next(self) -> Optional[SearchJob]:
+        """
+        Claim the oldest pending job (FOR UPDATE SKIP LOCKED).
+
+        Jobs stuck in running longer than search_job_timeout_seconds (e.g.
+        the worker died) are released first: back to pending until
+        search_job_max_attempts, failed after that.
+        Returns None if the queue is empty.
+        """
+        await self.release_stale_jobs()
+
+        next_job = (
+            select(SearchJob.id)
+            .where(SearchJob.status == SearchJobStatus.PENDING)
+            .order_by(SearchJob.created_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            update(SearchJob)
+            .where(SearchJob.id == next_job)
+            .values(
+                status=SearchJobStatus.RUNNING,
+                started_at=datetime.now(timezone.utc),
+                attempts=SearchJob.attempts + 1,
+            )
+            .returning(SearchJob)
+        )
+        job = result.scalar_one_or_none()
+        await self.db.commit()
+        return job
+
+    async def complete(
+        self,
+        job: SearchJob,
+        event_ids: List[UUID],
+        search_time_seconds: float,
+    ) -> SearchJob:
+        """Mark job as completed with its result."""
+        job.status = SearchJobStatus.COMPLETED
+        job.event_ids = [str(eid) for eid in event_ids]
+        job.search_time_seconds = search_time_seconds
+        job.error = None
+        job.finished_at = datetime.now(timezone.utc)
+        await self.db.commit()
+        return job
+
+    async def fail(self, job: SearchJob, error: str) -> SearchJob:
+        """
+        Record a failed attempt.
+
+        The job goes back to pending while attempts remain, otherwise it
+        is marked as failed.
+        """
+        job.error = error[:1000]
+        if job.attempts < settings.search_job_max_attempts:
+            job.status = SearchJobStatus.PENDING
+        else:
+            job.status = SearchJobStatus.FAILED
+            job.finished_at = datetime.now(timezone.utc)
+        await self.db.commit()
+        return job
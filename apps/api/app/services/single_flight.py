@@ -0,0 +1,59 @@
+"""Single-flight: coalesce concurrent calls for the same key."""
+
+from typing import Awaitable, Callable, Dict, Generic, TypeVar
+import asyncio
+
+T = TypeVar("T")
+
+
+class _LeaderCancelled(Exception):
+    """The call that was doing the work got cancelled before finishing."""
+
+
+class SingleFlight(Generic[T]):
+    """
+    Run at most one call per key at a time within this process.
+
+    Callers arriving while a call for the same key is in flight await its
+    result instead of starting their own. If the leading call fails, its
+    exception is raised to everyone waiting; if it is cancelled (e.g. the
+    client disconnected), one of the waiters takes over.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Future] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run fn() for key, or wait for the call already in flight."""
+        while key in self._calls:
+            try:
+                return await asyncio.shield(self._calls[key])
+            except _LeaderCancelled:
+                continue
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            self._fail(future, _LeaderCancelled())
+            raise
+        except Exception as e:
+            self._fail(future, e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    def in_flight(self) -> int:
+        """Number of keys currently being computed."""
+        return len(self._calls)
+
+    @staticmethod
+    def _fail(future: asyncio.Future, exc: BaseException) -> None:
+        future.set_exception(exc)
+        # Mark as retrieved so a call with no waiters doesn't log a warning
+        future.exception()
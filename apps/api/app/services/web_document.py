@@ -0,0 +1,112 @@
+"""Web document service: remember crawled pages for incremental refreshes."""
+
+from typing import Dict, List, Optional, TypedDict
+from datetime import datetime, timezone
+
+from sqlalchemy import select, update, case
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import WebDocument
+
+# Longer URLs are not tracked (column limit)
+MAX_URL_LENGTH = 2000
+
+
+class DocumentVersion(TypedDict):
+    """A page version as seen in one pipeline run."""
+
+    content_hash: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+class WebDocumentService:
+    """Record of crawled pages: content hash, HTTP validators, derived events."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_many(self, urls: List[str], scope: str) -> Dict[str, WebDocument]:
+        """Get a scope's known documents by URL in one query. Returns {url: doc}."""
+        unique_urls = [url for url in dict.fromkeys(urls) if len(url) <= MAX_URL_LENGTH]
+        if not unique_urls:
+            return {}
+
+        result = await self.db.execute(
+            select(WebDocument).where(
+                WebDocument.scope == scope, WebDocument.url.in_(unique_urls)
+            )
+        )
+        return {document.url: document for document in result.scalars().all()}
+
+    async def save_many(
+        self,
+        versions: Dict[str, DocumentVersion],
+        event_ids: Dict[str, List[str]],
+        scope: str,
+    ) -> None:
+        """
+        Upsert fetched documents with the events derived from them.
+
+        changed_at only moves when the content hash differs from the
+        stored one. Does not commit.
+
+        Args:
+            versions: {url: version} of documents fetched in this run
+            event_ids: {url: event IDs} derived from each document
+            scope: Who the events were extracted for (extraction_scope)
+        """
+        rows = [
+            {
+                "url": url,
+                "scope": scope,
+                "content_hash": version["content_hash"],
+                "etag": version["etag"],
+                "last_modified": version["last_modified"],
+                "event_ids": event_ids.get(url, []),
+                "fetch_count": 1,
+            }
+            for url, version in versions.items()
+            if len(url) <= MAX_URL_LENGTH
+        ]
+        if not rows:
+            return
+
+        now = datetime.now(timezone.utc)
+        stmt = insert(WebDocument)
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[WebDocument.url, WebDocument.scope],
+                set_={
+                    "content_hash": stmt.excluded.content_hash,
+                    "etag": stmt.excluded.etag,
+                    "last_modified": stmt.excluded.last_modified,
+                    "event_ids": stmt.excluded.event_ids,
+                    "fetch_count": WebDocument.fetch_count + 1,
+                    "fetched_at": now,
+                    "changed_at": case(
+                        (
+                            WebDocument.content_hash != stmt.excluded.content_hash,
+                            now,
+                        ),
+                        else_=WebDocument.changed_at,
+                    ),
+                },
+            ),
+            rows,
+        )
+
+    async def touch(self, urls: List[str], scope: str) -> None:
+        """Mark unchanged documents of a scope as seen again. Does not commit."""
+        if not urls:
+            return
+
+        await self.db.execute(
+            update(WebDocument)
+            .where(WebDocument.scope == scope, WebDocument.url.in_(urls))
+            .values(
+                fetched_at=datetime.now(timezone.utc),
+                fetch_count=WebDocument.fetch_count + 1,
+            )
+        )
@@ -0,0 +1,224 @@
+"""
+Re-embed events with the current embedding settings and measure recall.
+
+Usage:
+    python -m app.workers.reembed             # re-embed every event
+    python -m app.workers.reembed --missing   # only events without one
+    python -m app.workers.reembed --recall    # measure, don't write
+
+Re-embedding walks events in id order, `openai_embedding_batch_size` at a
+time, and upserts event_embeddings with vectors of
+`openai_embedding_dimensions` values. Each batch is committed, so an
+interrupted run can simply be started again.
+
+--recall compares vector search as deployed (halfvec, shortened vectors,
+IVFFlat index) against exact search over full-size, full-precision
+vectors of the same events (the pre-009 storage without index error),
+for the most recent distinct search queries.
+"""
+
+from typing import List, Optional, Set
+from uuid import UUID
+import argparse
+import asyncio
+import heapq
+import math
+import operator
+
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.clients import clients
+from app.config import settings
+from app.models import Event, EventEmbedding, SearchCache
+from app.rag.embeddings import (
+    EmbeddingsService,
+    check_embedding_dimension,
+    embeddings_service,
+)
+
+
+def event_text(event: Event) -> str:
+    """Text embedded for an event (same as the RAG pipeline uses)."""
+    return embeddings_service.create_event_text(
+        title=event.title,
+        artist_name=event.artist_name,
+        category=event.category.value,
+        venue=event.venue,
+        city=event.city,
+        country=event.country,
+    )
+
+
+async def reembed(db: AsyncSession, missing_only: bool = False) -> int:
+    """
+    Recompute event embeddings batch by batch.
+
+    Args:
+        db: Database session
+        missing_only: Only embed events that have no embedding yet
+
+    Returns:
+        Number of events embedded
+    """
+    batch_size = max(1, settings.openai_embedding_batch_size)
+    last_id: Optional[UUID] = None
+    total = 0
+    while True:
+        stmt = select(Event).order_by(Event.id).limit(batch_size)
+        if last_id is not None:
+            stmt = stmt.where(Event.id > last_id)
+        if missing_only:
+            stmt = stmt.where(
+                ~select(EventEmbedding.id)
+                .where(EventEmbedding.event_id == Event.id)
+                .exists()
+            )
+        events = list((await db.scalars(stmt)).all())
+        if not events:
+            break
+
+        texts = [event_text(event) for event in events]
+        # Not through embedding_caches: its vectors may predate the change
+        vectors = await embeddings_service.get_embeddings(texts)
+
+        stmt = pg_insert(EventEmbedding)
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[EventEmbedding.event_id],
+                set_={
+                    "embedding": stmt.excluded.embedding,
+                    "embedded_text": stmt.excluded.embedded_text,
+                    "model": stmt.excluded.model,
+                },
+            ),
+            [
+                {
+                    "event_id": event.id,
+                    "embedding": vector,
+                    "embedded_text": embedded_text[:2000],
+                    "model": embeddings_service.model,
+                }
+                for event, embedded_text, vector in zip(events, texts, vectors)
+            ],
+        )
+        await db.commit()
+
+        total += len(events)
+        last_id = events[-1].id
+        print(f"Re-embedded {total} events")
+    return total
+
+
+async def measure_recall(db: AsyncSession, queries: int = 50, k: int = 10) -> float:
+    """
+    Recall@k of deployed vector search against full-precision exact search.
+
+    Args:
+        db: Database session
+        queries: Number of recent distinct search queries to evaluate
+        k: Results compared per query
+
+    Returns:
+        Mean fraction of the exact top-k also returned by vector search
+    """
+    query_texts = list(
+        (
+            await db.scalars(
+                select(SearchCache.query)
+                .group_by(SearchCache.query)
+                .order_by(func.max(SearchCache.created_at).desc())
+                .limit(queries)
+            )
+        ).all()
+    )
+    rows = (
+        await db.execute(
+            select(EventEmbedding.event_id, EventEmbedding.embedded_text)
+        )
+    ).all()
+    if not query_texts or not rows:
+        print("Nothing to measure: no search queries or no embedded events")
+        return 0.0
+
+    # Baseline: full-size vectors, exact cosine similarity. Not cached
+    # (embedding_caches only holds the deployed size).
+    full = EmbeddingsService(dimensions=0)
+    event_ids = [event_id for event_id, _ in rows]
+    event_vectors = _normalized(await full.get_embeddings([t for _, t in rows]))
+    query_vectors = _normalized(await full.get_embeddings(query_texts))
+
+    recalls: List[float] = []
+    for query, query_vector in zip(query_texts, query_vectors):
+        # Exact top-k by a full scan; slow in pure Python, but this is an
+        # offline measurement
+        scores = (_dot(query_vector, vector) for vector in event_vectors)
+        top = heapq.nlargest(k, zip(scores, event_ids), key=operator.itemgetter(0))
+        expected: Set[UUID] = {event_id for _, event_id in top}
+        embedding = await embeddings_service.get_embedding(query, db=db)
+        found = (
+            await db.scalars(
+                text(
+                    "SELECT event_id FROM event_embeddings "
+                    "ORDER BY embedding <=> CAST(:embedding AS halfvec) LIMIT :k"
+                ),
+                {"embedding": str(embedding), "k": k},
+            )
+        ).all()
+        recalls.append(len(expected & set(found)) / len(expected))
+    await db.commit()
+
+    index_bytes = await db.scalar(
+        text("SELECT pg_relation_size('ix_event_embeddings_embedding')")
+    )
+    recall = sum(recalls) / len(recalls)
+    print(
+        f"recall@{k} = {recall:.4f} over {len(recalls)} queries and "
+        f"{len(event_ids)} events ({embeddings_service.model}, "
+        f"{embeddings_service.dimensions} dimensions, halfvec); "
+        f"index size {index_bytes / 1024 / 1024:.1f} MiB"
+    )
+    return recall
+
+
+def _dot(a: List[float], b: List[float]) -> float:
+    return sum(map(operator.mul, a, b))
+
+
+def _normalized(vectors: List[List[float]]) -> List[List[float]]:
+    """Unit-length copies of vectors (zero vectors are left as they are)."""
+    normalized = []
+    for vector in vectors:
+        norm = math.sqrt(_dot(vector, vector)) or 1.0
+        normalized.append([value / norm for value in vector])
+    return normalized
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--missing", action="store_true", help="only events without an embedding"
+    )
+    parser.add_argument("--recall", action="store_true", help="measure recall only")
+    parser.add_argument("--queries", type=int, default=50, help="queries for --recall")
+    parser.add_argument("-k", type=int, default=10, help="top-k for --recall")
+    args = parser.parse_args()
+
+    engine = create_async_engine(settings.database_url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    try:
+        async with session_factory() as db:
+            await check_embedding_dimension(db)
+            if args.recall:
+                await measure_recall(db, args.queries, args.k)
+            else:
+                total = await reembed(db, missing_only=args.missing)
+                print(f"Done: {total} events re-embedded")
+    finally:
+        await clients.aclose()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
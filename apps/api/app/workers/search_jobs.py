@@ -0,0 +1,88 @@
+"""
+Search job workers: run queued RAG searches outside the API process.
+
+Usage:
+    python -m app.workers.search_jobs
+
+Runs `search_worker_count` concurrent workers, each claiming jobs from
+search_jobs with FOR UPDATE SKIP LOCKED, so any number of these
+processes can run side by side.
+"""
+
+import asyncio
+import signal
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.clients import clients
+from app.config import settings
+from app.services.search import SearchService
+from app.services.search_job import SearchJobService
+
+
+async def run_worker(
+    worker_id: int,
+    session_factory: async_sessionmaker[AsyncSession],
+    stop: asyncio.Event,
+) -> None:
+    """Claim and run search jobs until stop is set."""
+    while not stop.is_set():
+        async with session_factory() as db:
+            job_service = SearchJobService(db)
+            job = await job_service.claim_next()
+
+            if job is None:
+                # Queue empty: back off until the next poll or shutdown
+                try:
+                    await asyncio.wait_for(
+                        stop.wait(), settings.search_job_poll_interval_seconds
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            job_id = job.id
+            try:
+                event_ids, search_time, _ = await SearchService(db).refresh_search(
+                    job.query, force_refresh=job.force_refresh
+                )
+            except Exception as e:
+                print(f"Search worker {worker_id}: job {job_id} failed: {e}")
+                # Rollback expires loaded objects, so re-fetch the job
+                await db.rollback()
+                job = await job_service.get_job(job_id)
+                if job:
+                    await job_service.fail(job, str(e))
+            else:
+                await job_service.complete(job, event_ids, search_time)
+
+
+async def main() -> None:
+    """Run the worker pool until SIGINT/SIGTERM."""
+    engine = create_async_engine(
+        settings.database_url,
+        # Each worker holds a session, plus one advisory-lock connection
+        pool_size=settings.search_worker_count * 2,
+    )
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    print(f"Starting {settings.search_worker_count} search workers")
+    try:
+        await asyncio.gather(
+            *(
+                run_worker(worker_id, session_factory, stop)
+                for worker_id in range(settings.search_worker_count)
+            )
+        )
+    finally:
+        await clients.aclose()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
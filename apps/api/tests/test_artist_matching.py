@@ -0,0 +1,65 @@
+"""Tests for finding known artists mentioned in a search query."""
+
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from app.services.artist import ArtistService
+
+
+class FakeSession:
+    """Returns fixed (name, name_ko, follower_count) rows, keeps the query."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.statement = None
+
+    async def execute(self, statement):
+        self.statement = statement
+        return SimpleNamespace(all=lambda: self.rows)
+
+
+class TestArtistsInQuery:
+    """Tests for ArtistService.get_artists_in_query"""
+
+    async def test_ranked_by_match_quality(self):
+        """Test exact names beat substrings, which need word boundaries."""
+        db = FakeSession(
+            [
+                ("BTS World", None, 10),  # Query is a word of the name
+                ("V", "뷔", 900),  # "v" only inside another word
+                ("BTS", "방탄소년단", 100),  # Exact
+                ("Ive", None, 500),  # Substring of "live", not a word
+            ]
+        )
+
+        artists = await ArtistService(db).get_artists_in_query("BTS")
+
+        assert artists == [["BTS", "방탄소년단"], ["BTS World"]]
+
+    async def test_names_in_query(self):
+        """Test Korean names match with particles, followers break ties."""
+        db = FakeSession([("IU", "아이유", 300), ("BTS", "방탄소년단", 900)])
+
+        artists = await ArtistService(db).get_artists_in_query(
+            "방탄소년단의 아이유 콘서트 live"
+        )
+
+        assert artists == [["BTS", "방탄소년단"], ["IU", "아이유"]]
+
+    async def test_null_name_ko_never_matches(self):
+        """Test a NULL name_ko can't turn into a match-everything pattern."""
+        db = FakeSession([("Aespa", None, 10)])
+
+        assert await ArtistService(db).get_artists_in_query("BTS") == []
+        sql = str(db.statement.compile(dialect=postgresql.dialect()))
+        assert "artists.name_ko IS NOT NULL" in sql
+
+    async def test_names_matched_literally(self):
+        """Test names go through strpos, so "%" or "_" in them isn't a wildcard."""
+        db = FakeSession([])
+
+        await ArtistService(db).get_artists_in_query("100% 라이브")
+        sql = str(db.statement.compile(dialect=postgresql.dialect()))
+        assert "strpos(lower(" in sql
+        assert "ILIKE" not in sql.upper()
@@ -0,0 +1,131 @@
+"""Tests for micro-batching of concurrent upstream calls."""
+
+import asyncio
+
+import pytest
+
+from app.rag.batching import MicroBatcher, window_batches
+
+
+class Recorder:
+    """Batch function that records the batches it was called with."""
+
+    def __init__(self, fail: bool = False):
+        self.batches = []
+        self.fail = fail
+
+    async def __call__(self, items):
+        self.batches.append(items)
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("upstream down")
+        return [item.upper() for item in items]
+
+
+class TestMicroBatcher:
+    """Tests for MicroBatcher.submit"""
+
+    async def test_concurrent_submits_share_one_call(self):
+        """Test concurrent callers are merged, deduplicated and fanned out."""
+        fn = Recorder()
+        batcher = MicroBatcher(fn, max_items=100, window_seconds=0.01)
+
+        results = await asyncio.gather(
+            batcher.submit(["bts"]),
+            batcher.submit(["iu", "bts"]),
+            batcher.submit(["aespa"]),
+        )
+
+        assert results == [["BTS"], ["IU", "BTS"], ["AESPA"]]
+        assert fn.batches == [["bts", "iu", "aespa"]]
+        assert batcher.stats()["avg_batch_size"] == 3.0
+
+    async def test_full_batch_flushes_before_window(self):
+        """Test max_items sends at once instead of waiting for the window."""
+        fn = Recorder()
+        batcher = MicroBatcher(fn, max_items=2, window_seconds=10)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.submit(["a"]), batcher.submit(["b"])), timeout=1
+        )
+
+        assert results == [["A"], ["B"]]
+        assert fn.batches == [["a", "b"]]
+
+    async def test_failure_reaches_every_caller(self):
+        """Test an upstream error is raised to all callers of the batch."""
+        batcher = MicroBatcher(Recorder(fail=True), max_items=10, window_seconds=0.01)
+
+        results = await asyncio.gather(
+            batcher.submit(["a"]), batcher.submit(["b"]), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    async def test_window_zero_calls_directly(self):
+        """Test batching can be turned off."""
+        fn = Recorder()
+        batcher = MicroBatcher(fn, max_items=10, window_seconds=0)
+
+        await asyncio.gather(batcher.submit(["a"]), batcher.submit(["b"]))
+
+        assert sorted(fn.batches) == [["a"], ["b"]]
+
+    async def test_cancelled_caller_does_not_break_batch(self):
+        """Test a caller giving up doesn't affect the others."""
+        fn = Recorder()
+        batcher = MicroBatcher(fn, max_items=10, window_seconds=0.01)
+
+        gone = asyncio.ensure_future(batcher.submit(["a"]))
+        await asyncio.sleep(0)
+        gone.cancel()
+        result = await batcher.submit(["b"])
+
+        assert result == ["B"]
+        with pytest.raises(asyncio.CancelledError):
+            await gone
+
+
+async def trickle(batches, delay: float = 0.0):
+    """Async source yielding the given lists, delay seconds apart."""
+    for batch in batches:
+        await asyncio.sleep(delay)
+        yield batch
+
+
+class TestWindowBatches:
+    """Tests for window_batches"""
+
+    async def test_small_lists_merged_up_to_max_items(self):
+        """Test single-item lists are regrouped into full batches."""
+        batches = [
+            batch
+            async for batch in window_batches(
+                trickle([[1], [2], [3], [], [4], [5]]), max_items=2, window_seconds=10
+            )
+        ]
+        assert batches == [[1, 2], [3, 4], [5]]
+
+    async def test_window_flushes_partial_batch(self):
+        """Test a waiting item is released after window_seconds."""
+        received = []
+        async for batch in window_batches(
+            trickle([[1], [2]], delay=0.05), max_items=10, window_seconds=0.01
+        ):
+            received.append(batch)
+        assert received == [[1], [2]]
+
+    async def test_consumer_stopping_early(self):
+        """Test breaking out of the batches stops reading the source."""
+        read = []
+
+        async def source():
+            for item in range(100):
+                read.append(item)
+                yield [item]
+
+        async for batch in window_batches(source(), max_items=1, window_seconds=1):
+            break
+        await asyncio.sleep(0)
+        assert batch == [0]
+        assert len(read) < 100
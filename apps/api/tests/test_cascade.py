@@ -0,0 +1,106 @@
+"""Tests for the fast/strong model cascade of the event extractor."""
+
+from types import SimpleNamespace
+import asyncio
+import json
+
+from app.config import settings
+from app.rag.extractor import EventExtractor, extraction_tier_stats
+from app.rag.stats import TierStats
+
+
+def make_event(title: str, confidence: float) -> dict:
+    return {
+        "title": title,
+        "artist_name": "BTS",
+        "category": "concert",
+        "event_date": "2026-03-15",
+        "venue": "KSPO DOME",
+        "city": "Seoul",
+        "country": "South Korea",
+        "confidence": confidence,
+    }
+
+
+class FakeCompletions:
+    """Answers with a fixed event list per model."""
+
+    def __init__(self, answers: dict):
+        self.answers = answers
+        self.models = []
+        self.running = 0
+        self.max_running = 0
+
+    async def create(self, **kwargs):
+        self.models.append(kwargs["model"])
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        content = json.dumps({"events": self.answers[kwargs["model"]]})
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+        )
+
+
+def make_extractor(answers: dict) -> EventExtractor:
+    extractor = EventExtractor(api_key="test", model="fast", escalation_model="strong")
+    extractor._client = SimpleNamespace(
+        chat=SimpleNamespace(completions=FakeCompletions(answers))
+    )
+    return extractor
+
+
+class TestCascade:
+    """Tests for escalation from the fast to the strong model"""
+
+    async def test_confident_answer_not_escalated(self, monkeypatch):
+        """Test a confident, valid fast answer is used as-is."""
+        monkeypatch.setitem(extraction_tier_stats, "fast", TierStats())
+        extractor = make_extractor({"fast": [make_event("Fast", 0.9)]})
+
+        events = await extractor.try_extract_events("BTS", "content", "https://a.com")
+
+        assert [e.title for e in events] == ["Fast"]
+        assert extractor.client.chat.completions.models == ["fast"]
+        assert extraction_tier_stats["fast"].to_dict()["escalated"] == 0
+
+    async def test_low_confidence_or_invalid_escalates(self, monkeypatch):
+        """Test doubtful fast answers are redone by the strong model."""
+        monkeypatch.setitem(extraction_tier_stats, "fast", TierStats())
+        monkeypatch.setitem(extraction_tier_stats, "strong", TierStats())
+        extractor = make_extractor(
+            {
+                "fast": [make_event("Fast", 0.9), {"title": "missing fields"}],
+                "strong": [make_event("Strong", 0.8)],
+            }
+        )
+
+        events = await extractor.try_extract_events("BTS", "content", "https://a.com")
+
+        assert [e.title for e in events] == ["Strong"]
+        assert extractor.client.chat.completions.models == ["fast", "strong"]
+        fast = extraction_tier_stats["fast"].to_dict()
+        assert (fast["invalid"], fast["escalated"]) == (1, 1)
+        assert extraction_tier_stats["strong"].to_dict()["events_per_call"] == 1.0
+
+    async def test_limit_held_per_request(self, monkeypatch):
+        """Test chunk and escalation calls of one page share the caller's limit."""
+        monkeypatch.setitem(extraction_tier_stats, "fast", TierStats())
+        monkeypatch.setitem(extraction_tier_stats, "strong", TierStats())
+        monkeypatch.setattr(settings, "rag_extraction_chunk_tokens", 20)
+        monkeypatch.setattr(settings, "rag_extraction_chunk_overlap_tokens", 0)
+        monkeypatch.setattr(settings, "rag_extraction_max_chunks", 4)
+        extractor = make_extractor(
+            {"fast": [make_event("Fast", 0.1)], "strong": [make_event("Strong", 0.9)]}
+        )
+        content = "\n\n".join(f"BTS concert {i} at KSPO DOME " * 8 for i in range(4))
+
+        events = await extractor.try_extract_events(
+            "BTS", content, "https://a.com", limit=asyncio.Semaphore(2)
+        )
+
+        completions = extractor.client.chat.completions
+        assert [e.title for e in events] == ["Strong"]
+        assert completions.models.count("fast") == 4
+        assert completions.max_running == 2
@@ -0,0 +1,75 @@
+"""Tests for fitting page content to extraction prompts."""
+
+from app.rag.chunking import estimate_tokens, pack_documents, split_content
+
+
+def tour_schedule(stops: int) -> str:
+    """A long tour-schedule page, one paragraph per stop."""
+    return "\n\n".join(
+        f"2026.{month:02d}.{day:02d} BTS World Tour at Stadium {i} "
+        + "Ticket details and seat map information. " * 10
+        for i, (month, day) in enumerate(
+            ((i % 12) + 1, (i % 28) + 1) for i in range(stops)
+        )
+    )
+
+
+class TestSplitContent:
+    """Tests for split_content"""
+
+    def test_short_content_is_one_chunk(self):
+        """Test content under the limit is returned unchanged."""
+        assert split_content("BTS 2026.03.15 KSPO Dome", 8000, 400) == [
+            "BTS 2026.03.15 KSPO Dome"
+        ]
+
+    def test_long_content_keeps_every_stop(self):
+        """Test no schedule entry is lost past the old truncation point."""
+        content = tour_schedule(60)
+        chunks = split_content(content, 2000, 200)
+
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 2000 for chunk in chunks)
+        for i in range(60):
+            assert any(f"Stadium {i} " in chunk for chunk in chunks)
+
+    def test_chunks_overlap(self):
+        """Test each chunk starts with the tail of the previous one."""
+        chunks = split_content(tour_schedule(30), 2000, 200)
+
+        for previous, chunk in zip(chunks, chunks[1:]):
+            overlap = chunk.split("\n\n", 1)[0]
+            assert overlap and previous.endswith(overlap)
+
+    def test_long_paragraph_split_before_dates(self):
+        """Test a paragraph without breaks is cut before date mentions."""
+        content = " ".join(
+            f"2026.05.{day:02d} Stadium {day} " + "seat info " * 40
+            for day in range(1, 21)
+        )
+        chunks = split_content(content, 1000, 0)
+
+        assert len(chunks) > 1
+        assert all(chunk.startswith("2026.05.") for chunk in chunks)
+
+
+class TestPackDocuments:
+    """Tests for estimate_tokens / pack_documents"""
+
+    def test_estimate_tokens(self):
+        """Test ASCII counts ~4 chars per token and Hangul one each."""
+        assert estimate_tokens("a" * 400) == 100
+        assert estimate_tokens("방탄소년단") == 5
+
+    def test_packs_within_budget(self):
+        """Test groups stay within budget and cover every document once."""
+        sizes = [300, 500, 200, 400, 100, 250]
+        groups = pack_documents(sizes, 1000)
+
+        assert sorted(i for group in groups for i in group) == list(range(6))
+        assert all(sum(sizes[i] for i in group) <= 1000 for group in groups)
+        assert len(groups) == 2
+
+    def test_oversized_document_alone(self):
+        """Test a document over budget gets its own group."""
+        assert pack_documents([1500, 100, 100], 1000) == [[0], [1, 2]]
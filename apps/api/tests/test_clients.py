@@ -0,0 +1,80 @@
+"""Tests for the shared, pooled upstream clients."""
+
+import httpx
+import pytest
+
+from app.clients import ClientRegistry, clients
+from app.config import settings
+from app.rag.crawler import TavilyCrawler
+from app.rag.embeddings import EmbeddingsService
+from app.rag.extractor import EventExtractor
+
+
+class TestClientRegistry:
+    """Tests for ClientRegistry"""
+
+    async def test_client_reused_until_closed(self):
+        """Test one pooled client serves every call until aclose()."""
+        registry = ClientRegistry()
+        http = registry.http
+
+        assert registry.http is http
+        stats = registry.stats()["http"]
+        assert stats["open"] is True
+        assert stats["max_connections"] == settings.http_max_connections
+        assert stats["connections"] == stats["in_flight_requests"] == 0
+
+        await registry.aclose()
+
+        assert http.is_closed
+        assert registry.stats()["http"] == {"open": False}
+        # The next use opens a fresh client
+        assert registry.http is not http
+        await registry.aclose()
+
+    async def test_openai_client_shared(self, monkeypatch):
+        """Test the extractor and embeddings service share one OpenAI client."""
+        monkeypatch.setattr(settings, "openai_api_key", "test")
+        try:
+            shared = clients.openai
+            assert EventExtractor().client is shared
+            assert EmbeddingsService().client is shared
+            # An explicit key still gets its own client
+            assert EmbeddingsService(api_key="other").client is not shared
+        finally:
+            await clients.aclose()
+
+
+class TestCrawlerClient:
+    """Tests for TavilyCrawler's use of the shared client"""
+
+    @pytest.fixture
+    def hosts(self, monkeypatch) -> list:
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.url.host)
+            if request.url.host == "api.tavily.com":
+                return httpx.Response(200, json={"results": []})
+            return httpx.Response(
+                200, html="<html></html>", headers={"content-type": "text/html"}
+            )
+
+        monkeypatch.setattr(
+            clients, "_http", httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+        return seen
+
+    async def test_search_and_fetch_use_shared_client(self, hosts: list):
+        """Test searches and page fetches go through clients.http."""
+        crawler = TavilyCrawler(api_key="test")
+        http = clients.http
+
+        await crawler._search("BTS concert", 5, "basic", None)
+        await crawler._search("IU concert", 5, "basic", None)
+        page = await crawler.fetch_page("https://ticket.example.com/1")
+
+        assert hosts == ["api.tavily.com", "api.tavily.com", "ticket.example.com"]
+        assert page is not None
+        assert clients.http is http and not http.is_closed
+        await clients.aclose()
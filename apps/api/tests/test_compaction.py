@@ -0,0 +1,66 @@
+"""Tests for content compaction and token-sized extraction chunks."""
+
+from app.rag.chunking import count_tokens, split_content_tokens, truncate_tokens
+from app.rag.compaction import compact_content, is_boilerplate
+
+PAGE = """Home | News | Tour | Shop | Fan Club
+We use cookies to improve your experience. Accept all cookies.
+
+BTS   WORLD TOUR 'ARIRANG' IN SEOUL
+The group shared a behind-the-scenes video on Monday. Fans reacted quickly.
+The tour opens on 2026.04.09 at Goyang Stadium.   Tickets cost 165,000원.
+The members thanked fans in a long letter about the past year.
+
+Home | News | Tour | Shop | Fan Club
+© 2026 Example Media. All rights reserved.
+"""
+
+
+class TestCompactContent:
+    """Tests for compact_content"""
+
+    def test_keeps_event_sentences_and_context(self):
+        """Test boilerplate and eventless sentences go, details stay."""
+        compacted = compact_content(PAGE)
+
+        assert compacted == (
+            "Fans reacted quickly.\nThe tour opens on 2026.04.09 at Goyang "
+            "Stadium. Tickets cost 165,000원."
+        )
+        assert count_tokens(compacted) < count_tokens(PAGE) / 3
+
+    def test_schedule_rows_are_not_navigation(self):
+        """Test separator-heavy lines with dates aren't dropped as menus."""
+        row = "2026.04.09 | 19:00 | Goyang Stadium | 165,000원"
+        assert not is_boilerplate(row)
+        assert is_boilerplate("Home | News | Tour | Shop | Fan Club")
+        assert compact_content(row) == row
+
+    def test_no_event_detail_keeps_cleaned_text(self):
+        """Test text without any anchor is only cleaned, not emptied."""
+        text = "BTS  released a new album.\n\nLogin\nFans  loved it."
+        assert compact_content(text) == "BTS released a new album.\nFans loved it."
+
+
+class TestTokenBudget:
+    """Tests for split_content_tokens / truncate_tokens"""
+
+    def test_chunks_fit_token_budget(self):
+        """Test Hangul pages get chunks sized by tokens, not characters."""
+        content = "\n\n".join(
+            f"2026년 {month}월 {month}일 방탄소년단 월드투어 공연 안내입니다. " * 5
+            for month in range(1, 13)
+        )
+
+        chunks = split_content_tokens(content, 200, 20)
+
+        assert len(chunks) > 1
+        assert all(count_tokens(chunk) <= 200 for chunk in chunks)
+
+    def test_truncate(self):
+        """Test truncation returns a prefix within budget."""
+        text = "BTS world tour tickets " * 100
+        truncated = truncate_tokens(text, 50)
+        assert text.startswith(truncated)
+        assert 40 <= count_tokens(truncated) <= 50
+        assert truncate_tokens("short", 50) == "short"
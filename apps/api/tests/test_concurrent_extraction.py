@@ -0,0 +1,125 @@
+"""Tests for extracting web results concurrently in RAGPipeline."""
+
+from datetime import date
+from types import SimpleNamespace
+import asyncio
+
+import pytest
+
+from app.config import settings
+from app.models.event import EventCategory
+from app.rag import pipeline as pipeline_module
+from app.rag.crawler import WebSearchResult
+from app.rag.extractor import ExtractedEvent
+from app.rag.pipeline import RAGPipeline
+
+# Later results answer first, so completion order differs from result order
+DELAYS = [0.04, 0.03, 0.02, 0.01]
+
+
+def make_result(index: int) -> WebSearchResult:
+    return WebSearchResult(
+        title=f"Page {index}",
+        url=f"https://example.com/{index}",
+        content=f"BTS concert news {index}",
+        score=1.0,
+    )
+
+
+class FakeExtractor:
+    """Answers each page after its delay, tracking concurrent calls."""
+
+    model = "fake"
+    available = True
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+
+    def cache_key(self, *args) -> str:
+        return "|".join(args)
+
+    async def try_extract_events(self, query, content, source_url, limit, **kwargs):
+        index = int(source_url.rsplit("/", 1)[1])
+        async with limit:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            await asyncio.sleep(DELAYS[index])
+            self.active -= 1
+        # Pages 0 and 2 both report the first show; page 0's copy must win
+        title = "Day 1" if index in (0, 2) else f"Day {index + 1}"
+        return [
+            ExtractedEvent(
+                title=title,
+                artist_name="BTS",
+                category=EventCategory.CONCERT,
+                event_date=date(2026, 3, 15),
+                venue="KSPO DOME",
+                city="Seoul",
+                country="South Korea",
+                source_url=source_url,
+                confidence=0.9,
+            )
+        ]
+
+
+class FakeExtractionCache:
+    async def get_many(self, keys):
+        return {}
+
+    async def save_many(self, entries, model):
+        pass
+
+
+@pytest.fixture
+def fake_extractor(monkeypatch) -> FakeExtractor:
+    fake = FakeExtractor()
+    monkeypatch.setattr(pipeline_module, "extractor", fake)
+    # Every page goes to the LLM on its own
+    monkeypatch.setattr(settings, "structured_parsing_enabled", False)
+    monkeypatch.setattr(settings, "rag_rule_extraction_enabled", False)
+    monkeypatch.setattr(settings, "rag_compaction_enabled", False)
+    monkeypatch.setattr(settings, "rag_extraction_pack_tokens", 0)
+    return fake
+
+
+def make_pipeline(results) -> RAGPipeline:
+    async def commit():
+        pass
+
+    pipeline = RAGPipeline(SimpleNamespace(commit=commit))
+    pipeline.extraction_cache = FakeExtractionCache()
+
+    async def collect_sources(query, max_web_results):
+        return ["BTS"], results
+
+    pipeline._collect_sources = collect_sources
+    return pipeline
+
+
+class TestSearchAndExtract:
+    """Tests for RAGPipeline.search_and_extract"""
+
+    async def test_sources_extracted_concurrently(
+        self, fake_extractor: FakeExtractor, monkeypatch
+    ):
+        """Test the fan-out limit bounds concurrent calls, not a sequence."""
+        monkeypatch.setattr(settings, "rag_extraction_concurrency", 2)
+        pipeline = make_pipeline([make_result(i) for i in range(4)])
+
+        await pipeline.search_and_extract("BTS")
+
+        assert fake_extractor.max_active == 2
+
+    async def test_results_in_web_result_order(self, fake_extractor: FakeExtractor):
+        """Test results keep web result order and dedup regardless of timing."""
+        pipeline = make_pipeline([make_result(i) for i in range(4)])
+
+        events = await pipeline.search_and_extract("BTS")
+
+        assert fake_extractor.max_active == 4
+        assert [(e.title, e.source_url) for e in events] == [
+            ("Day 1", "https://example.com/0"),
+            ("Day 2", "https://example.com/1"),
+            ("Day 4", "https://example.com/3"),
+        ]
@@ -0,0 +1,89 @@
+"""Tests for crawler query variants and result merging."""
+
+import pytest
+
+from app.config import settings
+from app.rag.crawler import (
+    TavilyCrawler,
+    WebSearchResult,
+    build_query_variants,
+    merge_results,
+)
+from app.rag.resilience import UpstreamError
+
+
+def make_result(url: str, score: float) -> WebSearchResult:
+    return WebSearchResult(title="BTS", url=url, content="BTS concert", score=score)
+
+
+class TestBuildQueryVariants:
+    """Tests for build_query_variants"""
+
+    def test_default_variant_first(self):
+        """Test the original concert phrasing is always the first query."""
+        variants = build_query_variants("BTS", max_variants=1)
+        assert variants == ["BTS concert event schedule 콘서트 일정"]
+
+    def test_alias_swapped_into_query(self):
+        """Test the Korean name replaces the matched name."""
+        variants = build_query_variants("bts 서울", [["BTS", "방탄소년단"]], 4)
+
+        assert variants[:2] == [
+            "bts 서울 concert event schedule 콘서트 일정",
+            "방탄소년단 서울 concert event schedule 콘서트 일정",
+        ]
+        assert "bts 서울 fan meeting 팬미팅 일정" in variants
+        assert len(variants) == 4
+
+    def test_alias_of_other_artist_not_swapped(self):
+        """Test a matched name is only replaced by the same artist's alias."""
+        variants = build_query_variants(
+            "bts 서울", [["BTS", "방탄소년단"], ["BTS World", "비티에스 월드"]], 8
+        )
+
+        assert "방탄소년단 서울 concert event schedule 콘서트 일정" in variants
+        assert not any(variant.startswith("비티에스 월드 서울") for variant in variants)
+        assert "BTS World concert event schedule 콘서트 일정" in variants
+
+
+class TestMergeResults:
+    """Tests for merge_results / search_variants"""
+
+    def test_dedupes_by_url_keeping_best_score(self):
+        """Test a URL found twice keeps its best score, best first."""
+        merged = merge_results(
+            [
+                [make_result("https://a.com/1", 0.4), make_result("https://b.com", 0.7)],
+                [make_result("https://a.com/1/", 0.9)],
+            ]
+        )
+        assert [(r.url, r.score) for r in merged] == [
+            ("https://a.com/1/", 0.9),
+            ("https://b.com", 0.7),
+        ]
+
+    async def test_partial_variant_failure(self, monkeypatch):
+        """Test failed variants are skipped and reported while any succeeds."""
+        monkeypatch.setattr(settings, "crawler_query_variants", 3)
+        crawler = TavilyCrawler(api_key="test")
+
+        async def fake_search(full_query, *args):
+            if "팬미팅" in full_query:
+                raise UpstreamError("tavily", "503")
+            return [make_result(f"https://x.com/{len(full_query)}", 0.5)]
+
+        monkeypatch.setattr(crawler, "_search", fake_search)
+        results, errors = await crawler.search_variants("BTS", max_results=10)
+        assert len(results) == 2
+        assert len(errors) == 1
+
+    async def test_all_variants_failing_raises(self, monkeypatch):
+        """Test the search fails when every variant fails."""
+        crawler = TavilyCrawler(api_key="test")
+
+        async def fake_search(*args):
+            raise UpstreamError("tavily", "503")
+
+        monkeypatch.setattr(crawler, "_search", fake_search)
+        with pytest.raises(UpstreamError):
+            await crawler.search_variants("BTS")
@@ -0,0 +1,99 @@
+"""Tests for near-duplicate detection of web results."""
+
+from app.rag.crawler import WebSearchResult
+from app.rag.dedup import drop_near_duplicates, hamming_distance, simhash
+
+ARTICLE = (
+    "BTS will hold the world tour ARIRANG in Seoul on April 9 and 10, 2026 at "
+    "Goyang Stadium. Tickets go on sale on March 1 through Ticketlink, with "
+    "prices from 165,000 won to 198,000 won. The group announced additional "
+    "dates in Tokyo, Los Angeles and London later this year, and fan club "
+    "presale starts one week before general sale."
+)
+
+# Same press release on another news site: byline and footer added
+SYNDICATED = f"Reporter Kim Minji | {ARTICLE} Copyright, all rights reserved."
+
+# Same event, independently written
+REWRITE = (
+    "Seoul shows confirmed: BTS brings ARIRANG world tour to Goyang Stadium on "
+    "April 9-10, 2026. Ticketlink opens sales March 1; seats range from "
+    "165,000 to 198,000 won. Tokyo, Los Angeles and London dates follow later "
+    "in the year, and fan club members get presale access a week early."
+)
+
+# Ticket site page template, one page per tour stop
+TICKET_PAGE = (
+    "BTS WORLD TOUR ARIRANG {city} | 티켓링크. 공연정보 공연기간 {date} "
+    "공연장소 {venue} 관람시간 150분 관람등급 만 7세 이상 가격 R석 198,000원 "
+    "S석 165,000원 예매 안내 1인 4매까지 예매 가능합니다. 취소 수수료는 관람일 "
+    "기준으로 부과됩니다. 예매 시 유의사항을 반드시 확인하시기 바랍니다. "
+    "휠체어석은 고객센터로 문의해 주세요. 배송 안내 티켓은 공연 2주 전부터 순차 "
+    "배송됩니다. 공지사항 본 공연은 사정에 따라 변경될 수 있습니다."
+)
+
+
+def make_result(url: str, content: str) -> WebSearchResult:
+    return WebSearchResult(title="BTS", url=url, content=content, score=0.5)
+
+
+class TestSimhash:
+    """Tests for simhash"""
+
+    def test_copies_are_close_rewrites_are_not(self):
+        """Test syndicated copies differ in few bits, rewrites in many."""
+        fingerprint = simhash(ARTICLE)
+        assert hamming_distance(fingerprint, simhash(SYNDICATED)) <= 12
+        assert hamming_distance(fingerprint, simhash(REWRITE)) > 12
+
+    def test_short_text_not_fingerprinted(self):
+        """Test snippets too short to compare get no fingerprint."""
+        assert simhash("BTS 콘서트 4월 9일") is None
+
+
+class TestDropNearDuplicates:
+    """Tests for drop_near_duplicates"""
+
+    def test_keeps_first_copy_and_distinct_sources(self):
+        """Test only the later syndicated copy is dropped."""
+        results = [
+            make_result("https://news-a.com/1", ARTICLE),
+            make_result("https://news-b.com/2", REWRITE),
+            make_result("https://news-c.com/3", SYNDICATED),
+            make_result("https://blog.com/4", "BTS 콘서트 4월 9일"),
+        ]
+        kept, dropped = drop_near_duplicates(results, max_distance=12)
+
+        assert [r.url for r in kept] == [
+            "https://news-a.com/1",
+            "https://news-b.com/2",
+            "https://blog.com/4",
+        ]
+        assert [r.url for r in dropped] == ["https://news-c.com/3"]
+
+    def test_template_pages_for_different_dates_kept(self):
+        """Test same-template pages with another date and venue aren't copies."""
+        seoul = TICKET_PAGE.format(
+            city="SEOUL", date="2026.03.15", venue="KSPO DOME 올림픽체조경기장"
+        )
+        busan = TICKET_PAGE.format(
+            city="BUSAN", date="2026.04.20", venue="부산아시아드주경기장"
+        )
+        results = [
+            make_result("https://ticketlink.co.kr/1", seoul),
+            make_result("https://ticketlink.co.kr/2", busan),
+        ]
+        assert hamming_distance(simhash(seoul), simhash(busan)) <= 12
+
+        kept, dropped = drop_near_duplicates(results, max_distance=12)
+
+        assert len(kept) == 2 and dropped == []
+
+    def test_negative_distance_disables(self):
+        """Test max_distance -1 keeps every result."""
+        results = [
+            make_result("https://news-a.com/1", ARTICLE),
+            make_result("https://news-c.com/3", ARTICLE),
+        ]
+        kept, dropped = drop_near_duplicates(results, max_distance=-1)
+        assert len(kept) == 2 and dropped == []
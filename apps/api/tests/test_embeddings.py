@@ -0,0 +1,178 @@
+"""Tests for embedding requests: dimensions, caching and micro-batching."""
+
+from types import SimpleNamespace
+import asyncio
+
+import pytest
+
+from app.config import settings
+from app.models import EMBEDDING_DIMENSION
+from app.rag.embeddings import EmbeddingsService, check_embedding_dimension
+
+
+class FakeEmbeddings:
+    """Returns one vector per input, sized like the requested dimensions."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        await asyncio.sleep(0)
+        size = kwargs.get("dimensions", 1536)
+        return SimpleNamespace(
+            data=[
+                SimpleNamespace(index=index, embedding=[float(index + 1)] * size)
+                for index in range(len(kwargs["input"]))
+            ]
+        )
+
+
+def make_service(dimensions=None) -> EmbeddingsService:
+    service = EmbeddingsService(api_key="test", dimensions=dimensions)
+    service._client = SimpleNamespace(embeddings=FakeEmbeddings())
+    return service
+
+
+class TestEmbeddingsService:
+    """Tests for EmbeddingsService.get_embeddings"""
+
+    async def test_dimensions_requested(self, monkeypatch):
+        """Test vectors are requested at the configured size."""
+        monkeypatch.setattr(settings, "openai_api_key", "test")
+        service = make_service(dimensions=256)
+
+        vector = await service.get_embedding("BTS concert")
+
+        assert len(vector) == 256
+        assert service.client.embeddings.calls[0]["dimensions"] == 256
+
+    async def test_full_size_omits_dimensions(self, monkeypatch):
+        """Test dimensions=0 asks for the model's native size."""
+        monkeypatch.setattr(settings, "openai_api_key", "test")
+        service = make_service(dimensions=0)
+
+        vector = await service.get_embedding("BTS concert")
+
+        assert len(vector) == 1536
+        assert "dimensions" not in service.client.embeddings.calls[0]
+
+    async def test_concurrent_queries_share_a_request(self, monkeypatch):
+        """Test concurrent single-query misses are sent as one request."""
+        monkeypatch.setattr(settings, "openai_api_key", "test")
+        service = make_service(dimensions=8)
+
+        vectors = await asyncio.gather(
+            *(service.get_embedding(query) for query in ("BTS", "IU", "BTS", "aespa"))
+        )
+
+        calls = service.client.embeddings.calls
+        assert len(calls) == 1
+        assert calls[0]["input"] == ["BTS", "IU", "aespa"]
+        assert vectors[0] == vectors[2] != vectors[1]
+
+
+class FakeCacheSession:
+    """embedding_caches in memory: answers lookups, records inserts."""
+
+    def __init__(self, rows: dict):
+        self.rows = rows  # (model, text_hash) -> vector
+        self.inserted = []
+
+    async def execute(self, statement, params=None):
+        if params is not None:
+            self.inserted.extend(params)
+            return None
+        bound = statement.compile().params
+        model = next(v for k, v in bound.items() if k.startswith("model"))
+        hashes = next(v for k, v in bound.items() if k.startswith("text_hash"))
+        return SimpleNamespace(
+            all=lambda: [
+                (text_hash, self.rows[(model, text_hash)])
+                for text_hash in hashes
+                if (model, text_hash) in self.rows
+            ]
+        )
+
+
+class TestEmbeddingCache:
+    """Tests for the memory and embedding_caches levels of get_embeddings"""
+
+    async def test_db_hits_skip_the_api(self, monkeypatch):
+        """Test a vector cached in the DB is used for the normalized text."""
+        monkeypatch.setattr(settings, "openai_api_key", "test")
+        service = make_service(dimensions=EMBEDDING_DIMENSION)
+        text_hash = service.text_hash("BTS concert")
+        db = FakeCacheSession(
+            {(service.model, text_hash): [0.5] * EMBEDDING_DIMENSION}
+        )
+
+        vector = await service.get_embedding("  BTS\n concert ", db=db)
+
+        assert vector == [0.5] * EMBEDDING_DIMENSION
+        assert service.client.embeddings.calls == []
+        assert db.inserted == []
+
+    async def test_only_misses_sent_and_saved(self, monkeypatch):
+        """Test cached texts aren't requested and new vectors are written back."""
+        monkeypatch.setattr(settings, "openai_api_key", "test")
+        service = make_service(dimensions=EMBEDDING_DIMENSION)
+        cached_hash = service.text_hash("BTS")
+        db = FakeCacheSession(
+            {(service.model, cached_hash): [0.5] * EMBEDDING_DIMENSION}
+        )
+
+        vectors = await service.get_embeddings(["BTS", "IU", "IU"], db=db)
+
+        assert [call["input"] for call in service.client.embeddings.calls] == [["IU"]]
+        assert vectors[0] == [0.5] * EMBEDDING_DIMENSION
+        assert vectors[1] == vectors[2] == [1.0] * EMBEDDING_DIMENSION
+        assert [(row["model"], row["text_hash"]) for row in db.inserted] == [
+            (service.model, service.text_hash("IU"))
+        ]
+
+    async def test_memory_level_without_db(self, monkeypatch):
+        """Test a repeated text is served from memory, per model."""
+        monkeypatch.setattr(settings, "openai_api_key", "test")
+        service = make_service(dimensions=8)
+
+        first = await service.get_embedding("BTS concert")
+        again = await service.get_embedding("BTS concert")
+        service.model = "text-embedding-3-large"
+        await service.get_embedding("BTS concert")
+
+        assert first == again
+        assert len(service.client.embeddings.calls) == 2
+
+
+class FakeCatalog:
+    """Answers the column type query with fixed types per table."""
+
+    def __init__(self, types: dict):
+        self.types = types
+
+    async def scalar(self, statement, params):
+        return self.types[params["table"]]
+
+
+class TestCheckEmbeddingDimension:
+    """Tests for check_embedding_dimension"""
+
+    async def test_matching_columns_pass(self):
+        """Test columns of the configured size are accepted."""
+        column = f"halfvec({EMBEDDING_DIMENSION})"
+        await check_embedding_dimension(
+            FakeCatalog({"event_embeddings": column, "embedding_caches": column})
+        )
+
+    async def test_mismatch_raises(self):
+        """Test a column of another size stops startup with a clear error."""
+        db = FakeCatalog(
+            {
+                "event_embeddings": f"halfvec({EMBEDDING_DIMENSION})",
+                "embedding_caches": "vector(1536)",
+            }
+        )
+
+        with pytest.raises(RuntimeError, match="embedding_caches.embedding"):
+            await check_embedding_dimension(db)
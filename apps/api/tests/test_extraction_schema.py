@@ -0,0 +1,78 @@
+"""Tests for schema-constrained extraction output and batched validation."""
+
+from decimal import Decimal
+
+from app.rag.extractor import (
+    EXTRACTION_RESPONSE_FORMAT,
+    EventExtractor,
+    validate_events,
+)
+
+VALID = {
+    "title": "BTS World Tour",
+    "artist_name": "BTS",
+    "category": "concert",
+    "event_date": "2026-03-15",
+    "event_time": "18:00",
+    "venue": "KSPO DOME",
+    "address": None,
+    "city": "Seoul",
+    "country": "South Korea",
+    "timezone": "Asia/Seoul",
+    "price_currency": "KRW",
+    "price_min": 110000,
+    "price_max": None,
+    "ticket_url": None,
+    "source_url": "https://example.com",
+    "confidence": 0.9,
+}
+
+
+class TestResponseSchema:
+    """Tests for the strict JSON schema generated from ExtractedEvent"""
+
+    def test_schema_is_strict(self):
+        """Test every field is required, nullable if optional, nothing extra."""
+        schema = EXTRACTION_RESPONSE_FORMAT["json_schema"]
+        item = schema["schema"]["properties"]["events"]["items"]
+
+        assert schema["strict"] is True
+        assert item["additionalProperties"] is False
+        assert item["required"] == list(item["properties"]) == list(VALID)
+        assert item["properties"]["category"]["enum"] == [
+            "concert",
+            "fanmeeting",
+            "broadcast",
+            "festival",
+        ]
+        assert {"type": "null"} in item["properties"]["price_min"]["anyOf"]
+        assert "$ref" not in str(schema) and "format" not in str(schema)
+
+
+class TestValidateEvents:
+    """Tests for validate_events / per-source drop counts"""
+
+    def test_invalid_items_dropped_and_counted(self):
+        """Test one bad item doesn't sink the batch and is counted per source."""
+        items = [
+            VALID,
+            {**VALID, "category": "musical"},
+            {**VALID, "title": "Day 2", "event_date": "2026-02-30"},
+            {**VALID, "title": "Day 3", "event_date": "2026-03-17"},
+        ]
+        dropped = {}
+
+        events, invalid = EventExtractor._parse_events(
+            items, "https://a.com", dropped
+        )
+
+        assert [e.title for e in events] == ["BTS World Tour", "Day 3"]
+        assert invalid == 2
+        assert dropped == {"https://a.com": 2}
+        assert events[0].source_url == "https://a.com"
+        assert events[0].price_min == Decimal("110000")
+
+    def test_all_valid(self):
+        """Test a clean batch validates without drops."""
+        events, invalid = validate_events([VALID])
+        assert len(events) == 1 and invalid == set()
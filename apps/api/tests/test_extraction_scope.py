@@ -0,0 +1,55 @@
+"""Tests for scoping reused extractions to the searched artist."""
+
+from app.rag.extractor import (
+    EXTRACTION_PROMPT_VERSION,
+    PACKED_PROMPT_VERSION,
+    EventExtractor,
+    extraction_scope,
+)
+
+
+class TestExtractionScope:
+    """Tests for extraction_scope"""
+
+    def test_known_artist_shares_scope_across_phrasings(self):
+        """Test queries for the same artist map to the same scope."""
+        names = ["BTS", "방탄소년단"]
+        assert extraction_scope("BTS 서울", names) == extraction_scope(
+            "방탄소년단 콘서트", ["BTS", "방탄소년단"]
+        )
+        assert extraction_scope("BTS", names) != extraction_scope("IU", ["IU", "아이유"])
+
+    def test_unknown_artist_uses_query_words(self):
+        """Test generic words don't split the scope of an unknown artist."""
+        assert extraction_scope("NewJeans concert") == extraction_scope(
+            "newjeans 콘서트 2026년"
+        )
+
+
+class TestExtractionCacheKey:
+    """Tests for EventExtractor.cache_key"""
+
+    def test_scope_separates_cached_extractions(self):
+        """Test one page extracted for two artists is cached twice."""
+        extractor = EventExtractor(api_key="test", model="m", escalation_model="")
+        url, text = "https://news.example.com/1", "BTS and IU concerts"
+        bts = extraction_scope("BTS", ["BTS", "방탄소년단"])
+
+        assert extractor.cache_key(url, text, bts) != extractor.cache_key(
+            url, text, extraction_scope("IU", ["IU", "아이유"])
+        )
+        assert extractor.cache_key(url, text, bts) == extractor.cache_key(
+            url, text, extraction_scope("방탄소년단 콘서트", ["BTS", "방탄소년단"])
+        )
+
+    def test_packed_prompt_cached_apart(self):
+        """Test packed and single-page answers for a page don't share a key."""
+        extractor = EventExtractor(api_key="test", model="m", escalation_model="")
+        url, text = "https://news.example.com/1", "BTS concert"
+
+        assert extractor.cache_key(url, text, "bts") == extractor.cache_key(
+            url, text, "bts", EXTRACTION_PROMPT_VERSION
+        )
+        assert extractor.cache_key(url, text, "bts") != extractor.cache_key(
+            url, text, "bts", PACKED_PROMPT_VERSION
+        )
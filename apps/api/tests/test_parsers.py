@@ -0,0 +1,114 @@
+"""Tests for structured-data (JSON-LD) event parsers."""
+
+from datetime import date, time
+from decimal import Decimal
+from pathlib import Path
+
+from app.models.event import EventCategory
+from app.rag.parsers import TicketlinkParser, parse_structured_events, parser_for
+from app.rag.pipeline import RAGPipeline
+from app.rag.relevance import artist_terms
+
+FIXTURES = Path(__file__).parent / "fixtures" / "html"
+
+
+def load_fixture(name: str) -> str:
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+class TestParserRegistry:
+    """Tests for parser_for"""
+
+    def test_matches_site_and_subdomains(self):
+        """Test site parsers match the domain and its subdomains only."""
+        assert isinstance(
+            parser_for("https://www.ticketlink.co.kr/product/55555"), TicketlinkParser
+        )
+        assert parser_for("https://ticket.melon.com/performance/index.htm") is not None
+        assert parser_for("https://notticketlink.co.kr/product/1") is None
+
+
+class TestJsonLdEventParser:
+    """Tests for parse_structured_events"""
+
+    def test_parses_ticketlink_fixture(self):
+        """Test schema.org MusicEvents become ExtractedEvents."""
+        url = "https://www.ticketlink.co.kr/product/55555"
+        events = parse_structured_events(url, load_fixture("ticketlink_event.html"))
+
+        assert events is not None and len(events) == 2
+        first = events[0]
+        assert first.title == "2026 BTS WORLD TOUR <ARIRANG> IN SEOUL"
+        assert first.artist_name == "BTS"
+        assert first.category == EventCategory.CONCERT
+        assert first.event_date == date(2026, 4, 9)
+        assert first.event_time == time(19, 0)
+        assert first.venue == "고양종합운동장 주경기장"
+        assert first.city == "고양"
+        assert first.country == "KR"
+        assert first.price_currency == "KRW"
+        assert (first.price_min, first.price_max) == (Decimal("165000"), Decimal("198000"))
+        assert first.ticket_url == "https://www.ticketlink.co.kr/product/55555"
+        assert first.source_url == url
+
+        # Missing address falls back to the site's defaults
+        assert events[1].country == "South Korea"
+        assert events[1].price_min == Decimal("165000")
+
+    def test_no_events_means_llm_fallback(self):
+        """Test pages without Event data return None."""
+        events = parse_structured_events(
+            "https://blog.example.com/post/1", load_fixture("no_structured_data.html")
+        )
+        assert events is None
+
+    def test_artist_hint_used_without_performer(self):
+        """Test the artist hint fills in a missing performer."""
+        html = """<script type="application/ld+json">
+        {"@type": "Event", "name": "NewJeans 팬미팅", "startDate": "2026-06-01",
+         "location": {"name": "KSPO DOME"}}
+        </script>"""
+        events = parse_structured_events("https://example.com", html, "NewJeans")
+
+        assert events is not None
+        assert events[0].artist_name == "NewJeans"
+        assert events[0].category == EventCategory.FANMEETING
+        assert events[0].event_time is None
+
+    def test_utc_start_converted_to_event_timezone(self):
+        """Test a UTC startDate gives the local date and time, not the UTC ones."""
+        html = """<script type="application/ld+json">
+        {"@type": "MusicEvent", "name": "BTS LIVE", "startDate": "2026-03-15T16:00:00Z",
+         "location": {"name": "KSPO DOME"}, "performer": {"name": "BTS"}}
+        </script>"""
+        events = parse_structured_events("https://example.com", html)
+
+        assert events is not None
+        assert events[0].timezone == "Asia/Seoul"
+        assert events[0].event_date == date(2026, 3, 16)
+        assert events[0].event_time == time(1, 0)
+
+
+class TestSearchedArtistEvents:
+    """Tests for RAGPipeline._searched_artist_events"""
+
+    def test_listing_page_keeps_searched_artist_only(self):
+        """Test other performers and hint-filled events of others are dropped."""
+        html = """<script type="application/ld+json">
+        [{"@type": "MusicEvent", "name": "2026 BTS WORLD TOUR",
+          "startDate": "2026-06-01", "location": {"name": "KSPO DOME"},
+          "performer": {"name": "BTS"}},
+         {"@type": "MusicEvent", "name": "IU HEREH", "startDate": "2026-06-08",
+          "location": {"name": "KSPO DOME"}, "performer": {"name": "IU"}},
+         {"@type": "Event", "name": "뮤지컬 레미제라블", "startDate": "2026-06-15",
+          "location": {"name": "KSPO DOME"}}]
+        </script>"""
+        names = ["BTS", "방탄소년단"]
+        events = parse_structured_events("https://venue.example.com", html, "BTS")
+
+        kept = RAGPipeline._searched_artist_events(
+            events, artist_terms("방탄소년단 콘서트", names), "BTS"
+        )
+
+        assert len(events) == 3
+        assert [event.title for event in kept] == ["2026 BTS WORLD TOUR"]
@@ -0,0 +1,62 @@
+"""Tests for the relevance pre-filter in front of LLM extraction."""
+
+from app.rag.crawler import WebSearchResult
+from app.rag.relevance import artist_terms, filter_relevant, score_result
+
+
+def make_result(title: str, content: str, score: float = 0.5) -> WebSearchResult:
+    return WebSearchResult(
+        title=title, url="https://example.com", content=content, score=score
+    )
+
+
+class TestArtistTerms:
+    """Tests for artist_terms"""
+
+    def test_prefers_known_names(self):
+        """Test known names/aliases from the DB are used as terms."""
+        assert artist_terms("방탄 콘서트", ["BTS", "방탄소년단"]) == ["bts", "방탄소년단"]
+
+    def test_falls_back_to_query_words(self):
+        """Test generic words and years are dropped from the query."""
+        assert artist_terms("NewJeans 콘서트 2026년 schedule") == ["newjeans"]
+
+
+class TestScoreResult:
+    """Tests for score_result / filter_relevant"""
+
+    def test_event_page_scores_high(self):
+        """Test a page with artist, date and venue passes."""
+        result = make_result(
+            "BTS World Tour 2026",
+            "BTS will perform at KSPO Dome on 2026.03.15. 티켓 예매 99,000원",
+        )
+        assert score_result(result, ["bts"]) >= 0.85
+
+    def test_korean_dates_detected(self):
+        """Test Korean date notation counts as a date."""
+        with_date = make_result("뉴진스 팬미팅", "3월 15일 개최", score=0.0)
+        without_date = make_result("뉴진스 팬미팅", "개최 예정", score=0.0)
+        assert score_result(with_date, ["뉴진스"]) > score_result(
+            without_date, ["뉴진스"]
+        )
+
+    def test_artist_match_needs_word_boundary(self):
+        """Test short ASCII names don't match inside other words."""
+        result = make_result("Subtitles", "subtsbtsx", score=0.0)
+        assert score_result(result, ["bts"]) == 0.0
+
+    def test_filter_skips_irrelevant_pages(self):
+        """Test pages without artist, date or venue are skipped in order."""
+        relevant = make_result("BTS concert", "BTS live on May 12 at the arena")
+        irrelevant = make_result("Cooking tips", "How to make kimchi", score=0.3)
+
+        kept, skipped = filter_relevant([irrelevant, relevant], ["bts"], 0.45)
+
+        assert kept == [relevant]
+        assert skipped == [irrelevant]
+
+    def test_zero_threshold_keeps_everything(self):
+        """Test threshold 0 disables the filter."""
+        results = [make_result("Cooking tips", "How to make kimchi", score=0.0)]
+        assert filter_relevant(results, ["bts"], 0.0) == (results, [])
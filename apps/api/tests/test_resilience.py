@@ -0,0 +1,144 @@
+"""Tests for upstream rate limiting, retries and circuit breaking."""
+
+import time
+
+import httpx
+import pytest
+
+from app.config import settings
+from app.rag.resilience import (
+    CircuitOpenError,
+    ProviderGuard,
+    TokenBucket,
+    UpstreamError,
+)
+
+
+def status_error(status_code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "https://api.tavily.com/search")
+    response = httpx.Response(status_code, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+@pytest.fixture
+def guard(monkeypatch) -> ProviderGuard:
+    monkeypatch.setattr(settings, "upstream_retry_base_delay_seconds", 0.001)
+    monkeypatch.setattr(settings, "upstream_retry_max_delay_seconds", 0.01)
+    return ProviderGuard(
+        "tavily",
+        rate=0,
+        burst=1,
+        max_retries=2,
+        failure_threshold=2,
+        reset_seconds=60,
+    )
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket"""
+
+    async def test_waits_when_empty(self):
+        """Test calls beyond the burst wait for the refill rate."""
+        bucket = TokenBucket(rate=50, burst=2)
+
+        start = time.monotonic()
+        for _ in range(4):
+            await bucket.acquire()
+
+        # 2 from the burst, 2 more at 50/s
+        assert time.monotonic() - start >= 0.035
+
+
+class TestProviderGuard:
+    """Tests for ProviderGuard.call"""
+
+    async def test_retries_transient_errors(self, guard: ProviderGuard):
+        """Test a 429 followed by success returns the result."""
+        attempts = 0
+
+        async def flaky() -> str:
+            nonlocal attempts
+            attempts += 1
+            if attempts < 3:
+                raise status_error(429)
+            return "ok"
+
+        assert await guard.call(flaky) == "ok"
+        assert attempts == 3
+        assert guard.retries == 2
+
+    async def test_does_not_retry_client_errors(self, guard: ProviderGuard):
+        """Test a 400 is raised as-is without retries."""
+        attempts = 0
+
+        async def bad_request() -> str:
+            nonlocal attempts
+            attempts += 1
+            raise status_error(400)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await guard.call(bad_request)
+        assert attempts == 1
+
+    async def test_circuit_opens_and_fails_fast(self, guard: ProviderGuard):
+        """Test repeated failures open the circuit and later calls skip upstream."""
+        attempts = 0
+
+        async def down() -> str:
+            nonlocal attempts
+            attempts += 1
+            raise status_error(503)
+
+        for _ in range(2):
+            with pytest.raises(UpstreamError):
+                await guard.call(down)
+        assert guard.breaker.state == "open"
+
+        attempts = 0
+        with pytest.raises(CircuitOpenError):
+            await guard.call(down)
+        assert attempts == 0
+
+    async def test_half_open_trial_closes_circuit(self, guard: ProviderGuard):
+        """Test a successful trial after reset_seconds closes the circuit."""
+        guard.breaker.reset_seconds = 0
+
+        async def down() -> str:
+            raise status_error(503)
+
+        async def up() -> str:
+            return "ok"
+
+        for _ in range(2):
+            with pytest.raises(UpstreamError):
+                await guard.call(down)
+
+        assert guard.breaker.state == "half_open"
+        assert await guard.call(up) == "ok"
+        assert guard.breaker.state == "closed"
+
+    async def test_client_errors_leave_breaker_alone(self, guard: ProviderGuard):
+        """Test a 400 neither resets the failure count nor closes the circuit."""
+        guard.breaker.reset_seconds = 0
+
+        async def down() -> str:
+            raise status_error(503)
+
+        async def bad_request() -> str:
+            raise status_error(400)
+
+        with pytest.raises(UpstreamError):
+            await guard.call(down)
+        with pytest.raises(httpx.HTTPStatusError):
+            await guard.call(bad_request)
+        assert guard.breaker.failures == 1
+
+        with pytest.raises(UpstreamError):
+            await guard.call(down)
+        assert guard.breaker.state == "half_open"
+
+        # A bad trial request keeps the circuit half-open and frees the slot
+        with pytest.raises(httpx.HTTPStatusError):
+            await guard.call(bad_request)
+        assert guard.breaker.state == "half_open"
+        assert guard.breaker.allow()
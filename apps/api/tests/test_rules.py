@@ -0,0 +1,125 @@
+"""Tests for the rule-based event extractor."""
+
+from datetime import date, time
+from decimal import Decimal
+
+from app.models.event import EventCategory
+from app.rag.rules import extract_with_rules, find_dates, find_prices, find_times
+
+TODAY = date(2026, 1, 1)
+
+
+class TestPatterns:
+    """Tests for find_dates / find_times / find_prices"""
+
+    def test_date_formats(self):
+        """Test numeric, Korean, Japanese and English dates with a year."""
+        text = (
+            "2026.03.15 (토), 2026년 4월 9일, 2026年5月3日, "
+            "June 7, 2026, 12 July 2026, 3월 20일"
+        )
+        assert find_dates(text) == [
+            date(2026, 3, 15),
+            date(2026, 4, 9),
+            date(2026, 5, 3),
+            date(2026, 6, 7),
+            date(2026, 7, 12),
+        ]
+
+    def test_time_formats(self):
+        """Test 24h, am/pm and Korean/Japanese hour notation."""
+        text = "18:00 / 6:30 PM / 오후 7시 / 午後8時 / 2시간"
+        times = [found_time for _, found_time in find_times(text)]
+        assert times == [time(18, 0), time(18, 30), time(19, 0), time(20, 0)]
+
+    def test_prices_in_first_currency(self):
+        """Test amounts are collected for the first currency mentioned."""
+        assert find_prices("R석 198,000원 S석 165,000원 (약 $120)") == (
+            "KRW",
+            [Decimal("198000"), Decimal("165000")],
+        )
+        assert find_prices("全席指定 ¥12,000") == ("JPY", [Decimal("12000")])
+
+
+class TestExtractWithRules:
+    """Tests for extract_with_rules"""
+
+    def test_confident_snippet(self):
+        """Test a clean ticketing snippet becomes a complete event."""
+        result = extract_with_rules(
+            "방탄소년단 2026.03.15 (토) 18:00 / 올림픽체조경기장 / R석 198,000원",
+            "https://news.example.com/1",
+            ["BTS", "방탄소년단"],
+            "BTS WORLD TOUR IN SEOUL | 티켓링크",
+            today=TODAY,
+        )
+
+        assert result.confidence == 1.0
+        assert len(result.events) == 1
+        event = result.events[0]
+        assert event.title == "BTS WORLD TOUR IN SEOUL"
+        assert event.artist_name == "BTS"
+        assert event.category == EventCategory.CONCERT
+        assert (event.event_date, event.event_time) == (date(2026, 3, 15), time(18, 0))
+        assert (event.venue, event.city, event.country) == (
+            "KSPO DOME",
+            "Seoul",
+            "South Korea",
+        )
+        assert event.price_currency == "KRW"
+        assert event.price_min == event.price_max == Decimal("198000")
+
+    def test_start_time_after_doors(self):
+        """Test the show time is picked over doors open."""
+        result = extract_with_rules(
+            "BTS 2026年5月3日 東京ドーム 開場17:00 開演18:00",
+            "u",
+            ["BTS"],
+            today=TODAY,
+        )
+        assert result.events[0].event_time == time(18, 0)
+        assert result.events[0].timezone == "Asia/Tokyo"
+
+    def test_unknown_venue_gives_hints_only(self):
+        """Test pages without a known venue leave events to the LLM."""
+        result = extract_with_rules(
+            "BTS live at Some Club on 2026-03-15, 8 PM. Tickets $50",
+            "u",
+            ["BTS"],
+            today=TODAY,
+        )
+        assert result.events == []
+        assert result.hints() == (
+            "- dates: 2026-03-15\n- start time: 20:00\n- prices: USD 50"
+        )
+
+    def test_artist_must_be_mentioned(self):
+        """Test short ASCII names match whole words only."""
+        result = extract_with_rules(
+            "alive 2026.03.15 18:00 KSPO DOME", "u", ["IVE"], today=TODAY
+        )
+        assert result.events == []
+
+    def test_news_article_gives_hints_only(self):
+        """Test past, sale and unsupported dates in an article build no events."""
+        result = extract_with_rules(
+            "입력 2026.02.10 09:30\n"
+            "방탄소년단이 2024년 6월 13일 고척스카이돔 팬미팅 이후 "
+            "2026년 3월 20일 컴백을 확정했다. 티켓 오픈은 2026년 3월 1일 "
+            "오후 8시, 가격은 165,000원이다.",
+            "https://news.example.com/2",
+            ["BTS", "방탄소년단"],
+            "방탄소년단 컴백 확정 | 연합뉴스",
+            today=date(2026, 2, 10),
+        )
+
+        assert result.events == []
+        assert result.confidence == 0.0
+        assert result.dates == [date(2026, 3, 20)]
+
+    def test_title_adds_no_confidence(self):
+        """Test the artist must be in the text, not just the page title."""
+        result = extract_with_rules(
+            "2026.03.15 18:00 KSPO DOME", "u", ["BTS"], "BTS LIVE", today=TODAY
+        )
+        assert result.events == []
@@ -1,15 +1,18 @@
 """Tests for search API endpoints."""
 
+import json
 import pytest
 from uuid import uuid4
-from datetime import date, time, datetime
+from datetime import date, time, datetime, timedelta, timezone
 from decimal import Decimal
 
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import Event, Artist, RecentSearch
+from app.config import settings
+from app.models import Event, Artist, RecentSearch, SearchJob, SearchJobStatus
 from app.models.event import EventCategory
+from app.services.search_job import SearchJobService
 
 
 @pytest.fixture
@@ -87,6 +90,31 @@ class TestRAGSearch:
         )
         assert response.status_code == 422  # Validation error
 
+    async def test_search_debug_timings(
+        self, client: AsyncClient, test_searchable_events: list[Event]
+    ):
+        """Test debug=true returns the per-stage pipeline breakdown."""
+        response = await client.post(
+            "/api/v1/search?debug=true",
+            json={"query": "BTS", "force_refresh": True},
+        )
+        assert response.status_code == 200
+        timings = response.json()["timings"]
+        assert "crawl" in timings
+        assert "total" in timings
+        assert "sources" in timings
+
+    async def test_search_without_debug_omits_timings(
+        self, client: AsyncClient, test_searchable_events: list[Event]
+    ):
+        """Test timings are not returned by default."""
+        response = await client.post(
+            "/api/v1/search",
+            json={"query": "BTS", "force_refresh": True},
+        )
+        assert response.status_code == 200
+        assert response.json()["timings"] is None
+
     async def test_search_with_pagination(
         self, client: AsyncClient, test_searchable_events: list[Event]
     ):
@@ -100,6 +128,108 @@ class TestRAGSearch:
         assert data["page"] == 1
 
 
+class TestRAGSearchStream:
+    """Tests for POST /api/v1/search/stream"""
+
+    @staticmethod
+    def parse_frames(body: str) -> list[tuple[str, dict]]:
+        """Parse SSE body into (event, data) tuples."""
+        frames = []
+        for block in body.strip().split("\n\n"):
+            lines = dict(line.split(": ", 1) for line in block.splitlines())
+            frames.append((lines["event"], json.loads(lines["data"])))
+        return frames
+
+    async def test_stream_db_matches_then_summary(
+        self, client: AsyncClient, test_searchable_events: list[Event]
+    ):
+        """Test known DB matches are streamed before the summary frame."""
+        response = await client.post(
+            "/api/v1/search/stream",
+            json={"query": "BTS", "force_refresh": True},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+
+        frames = self.parse_frames(response.text)
+        assert frames[0][0] == "events"
+        assert frames[0][1]["stage"] == "db"
+        assert frames[0][1]["events"][0]["title"] == "BTS World Tour 2026"
+
+        event, summary = frames[-1]
+        assert event == "done"
+        assert summary["query"] == "BTS"
+        assert summary["total"] == 1
+        assert summary["cached"] is False
+        assert "searchTime" in summary
+
+    async def test_stream_empty_query(self, client: AsyncClient):
+        """Test stream with empty query."""
+        response = await client.post(
+            "/api/v1/search/stream",
+            json={"query": ""},
+        )
+        assert response.status_code == 422
+
+
+class TestSearchJobs:
+    """Tests for POST /api/v1/search with async_job and GET /api/v1/search/{searchId}"""
+
+    async def test_async_search_returns_pending_job(self, client: AsyncClient):
+        """Test cache miss with async_job queues a job."""
+        response = await client.post(
+            "/api/v1/search",
+            json={"query": "BTS", "async_job": True},
+        )
+        assert response.status_code == 202
+        data = response.json()
+        assert data["status"] == "pending"
+        assert data["events"] == []
+
+        poll_response = await client.get(f"/api/v1/search/{data['searchId']}")
+        assert poll_response.status_code == 200
+        assert poll_response.json()["status"] == "pending"
+        assert poll_response.json()["query"] == "bts"
+
+    async def test_async_search_reuses_pending_job(self, client: AsyncClient):
+        """Test queueing the same query twice returns the same job."""
+        first = await client.post(
+            "/api/v1/search",
+            json={"query": "BTS", "async_job": True},
+        )
+        second = await client.post(
+            "/api/v1/search",
+            json={"query": " bts ", "async_job": True},
+        )
+        assert first.json()["searchId"] == second.json()["searchId"]
+
+    async def test_stale_running_job_not_reused(self, db_session: AsyncSession):
+        """Test a timed-out job at max attempts fails and a new one is queued."""
+        stale = SearchJob(
+            query="bts",
+            status=SearchJobStatus.RUNNING,
+            attempts=settings.search_job_max_attempts,
+            started_at=datetime.now(timezone.utc)
+            - timedelta(seconds=settings.search_job_timeout_seconds + 60),
+        )
+        db_session.add(stale)
+        await db_session.commit()
+        service = SearchJobService(db_session)
+
+        job = await service.enqueue("BTS")
+
+        assert job.id != stale.id
+        assert job.status == SearchJobStatus.PENDING
+        await db_session.refresh(stale)
+        assert stale.status == SearchJobStatus.FAILED
+        assert (await service.claim_next()).id == job.id
+
+    async def test_get_search_not_found(self, client: AsyncClient):
+        """Test polling a non-existent search."""
+        response = await client.get(f"/api/v1/search/{uuid4()}")
+        assert response.status_code == 404
+
+
 class TestAutocomplete:
     """Tests for GET /api/v1/search/autocomplete"""
 
@@ -0,0 +1,78 @@
+"""Tests for single-flight coalescing of concurrent searches."""
+
+import asyncio
+
+import pytest
+
+from app.services.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight.do"""
+
+    async def test_concurrent_calls_run_once(self):
+        """Test concurrent calls for the same key share one execution."""
+        flight: SingleFlight[int] = SingleFlight()
+        calls = 0
+
+        async def work() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return 42
+
+        results = await asyncio.gather(*(flight.do("bts", work) for _ in range(10)))
+
+        assert results == [42] * 10
+        assert calls == 1
+        assert flight.in_flight() == 0
+
+    async def test_different_keys_run_separately(self):
+        """Test calls for different keys are not coalesced."""
+        flight: SingleFlight[str] = SingleFlight()
+
+        async def work(key: str) -> str:
+            await asyncio.sleep(0.01)
+            return key
+
+        results = await asyncio.gather(
+            flight.do("bts", lambda: work("bts")),
+            flight.do("newjeans", lambda: work("newjeans")),
+        )
+        assert results == ["bts", "newjeans"]
+
+    async def test_error_propagates_to_waiters(self):
+        """Test a failing call raises for every waiter."""
+        flight: SingleFlight[int] = SingleFlight()
+
+        async def fail() -> int:
+            await asyncio.sleep(0.01)
+            raise ValueError("upstream down")
+
+        results = await asyncio.gather(
+            flight.do("bts", fail),
+            flight.do("bts", fail),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, ValueError) for r in results)
+
+    async def test_waiter_takes_over_when_leader_cancelled(self):
+        """Test a waiter runs the call itself if the leader is cancelled."""
+        flight: SingleFlight[int] = SingleFlight()
+        calls = 0
+
+        async def work() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return calls
+
+        leader = asyncio.create_task(flight.do("bts", work))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(flight.do("bts", work))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        assert await waiter == 2
+        with pytest.raises(asyncio.CancelledError):
+            await leader
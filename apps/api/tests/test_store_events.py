@@ -0,0 +1,233 @@
+"""Tests for storing extracted events and recording their source pages."""
+
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.config import settings
+from app.models.event import EventCategory, make_event_natural_key
+from app.rag import pipeline as pipeline_module
+from app.rag.extractor import ExtractedEvent
+from app.rag.pipeline import RAGPipeline
+
+
+def make_event(title: str, source_url: str, **kwargs) -> ExtractedEvent:
+    return ExtractedEvent(
+        **{
+            "title": title,
+            "artist_name": "BTS",
+            "category": EventCategory.CONCERT,
+            "event_date": date(2026, 3, 15),
+            "venue": "KSPO DOME",
+            "city": "Seoul",
+            "country": "South Korea",
+            "source_url": source_url,
+            "confidence": 0.9,
+            **kwargs,
+        }
+    )
+
+
+class FakeSession:
+    """
+    Records statements and upserts events by natural_key in memory.
+
+    Artists are never found, so each name gets a new ID.
+    """
+
+    def __init__(self):
+        self.statements = []  # (table, rows, statement)
+        self.events = {}  # natural_key -> stored event
+        self.commits = 0
+
+    async def execute(self, statement, params=None):
+        table = getattr(statement, "table", None)
+        self.statements.append(
+            (table.name if table is not None else None, params, statement)
+        )
+        if table is not None and table.name == "artists":
+            return SimpleNamespace(all=lambda: [(p["name"], uuid4()) for p in params])
+        return SimpleNamespace(all=lambda: [])
+
+    async def scalars(self, statement, params, execution_options=None):
+        self.statements.append((statement.table.name, params, statement))
+        stored = []
+        for row in params:
+            event = self.events.setdefault(
+                row["natural_key"], SimpleNamespace(id=uuid4())
+            )
+            event.__dict__.update(row)
+            stored.append(event)
+        return SimpleNamespace(all=lambda: stored)
+
+    async def commit(self):
+        self.commits += 1
+
+
+class FakeWebDocuments:
+    def __init__(self):
+        self.saved = None
+
+    async def save_many(self, versions, event_ids, scope):
+        self.saved = event_ids
+
+    async def touch(self, urls, scope):
+        pass
+
+
+@pytest.fixture
+def pipeline(monkeypatch) -> RAGPipeline:
+    # Zero vectors without calling the embeddings API
+    monkeypatch.setattr(settings, "openai_api_key", "")
+    pipeline = RAGPipeline(FakeSession())
+    pipeline.web_documents = FakeWebDocuments()
+    return pipeline
+
+
+class TestRecordDocuments:
+    """Tests for RAGPipeline._record_documents"""
+
+    async def test_merged_pages_record_stored_events(self, pipeline: RAGPipeline):
+        """Test pages whose events were deduped or upserted away keep their IDs."""
+        a, b = "https://a.example.com/1", "https://b.example.com/2"
+        version = {"content_hash": "x", "etag": None, "last_modified": None}
+        pipeline._changed_documents = {a: dict(version), b: dict(version)}
+
+        tour = make_event("BTS World Tour", a)
+        pipeline._record_page_events(a, [tour])
+        pipeline._record_page_events(
+            b,
+            [
+                # Dropped by dedupe_events (same title and date as page a's)
+                make_event("BTS World Tour", b),
+                # Stored, but upserted onto page a's row (same natural key)
+                make_event("BTS WORLD TOUR!", b),
+            ],
+        )
+
+        stored = await pipeline.store_events(
+            [tour, make_event("BTS WORLD TOUR!", b)]
+        )
+        await pipeline._record_documents()
+
+        assert len(stored) == 1
+        assert pipeline.web_documents.saved == {
+            a: [str(stored[0].id)],
+            b: [str(stored[0].id)],
+        }
+
+
+class TestStoreEvents:
+    """Tests for RAGPipeline.store_events"""
+
+    async def test_bulk_round_trips(self, pipeline: RAGPipeline, monkeypatch):
+        """Test a batch costs one embeddings call and one statement per table."""
+        embedded = []
+
+        async def get_embeddings(texts, db=None):
+            embedded.append(texts)
+            return [[0.0] * 3 for _ in texts]
+
+        monkeypatch.setattr(
+            pipeline_module.embeddings_service, "get_embeddings", get_embeddings
+        )
+        url = "https://example.com"
+        extracted = [
+            make_event("Day 1", url),
+            make_event("Day 2", url, event_date=date(2026, 3, 16)),
+            make_event("Fan Meeting", url, artist_name="IU"),
+        ]
+
+        stored = await pipeline.store_events(extracted)
+
+        db = pipeline.db
+        assert [e.title for e in stored] == ["Day 1", "Day 2", "Fan Meeting"]
+        assert len(embedded) == 1 and len(embedded[0]) == 3
+        # SELECT artists, INSERT missing artists, INSERT events, INSERT embeddings
+        assert [table for table, _, _ in db.statements] == [
+            None,
+            "artists",
+            "events",
+            "event_embeddings",
+        ]
+        assert [row["name"] for row in db.statements[1][1]] == ["BTS", "IU"]
+        assert len(db.statements[2][1]) == 3
+        assert [row["event_id"] for row in db.statements[3][1]] == [
+            e.id for e in stored
+        ]
+        assert db.commits == 1
+
+    async def test_nothing_to_store(self, pipeline: RAGPipeline):
+        """Test an empty batch makes no round-trips."""
+        assert await pipeline.store_events([]) == []
+        assert pipeline.db.statements == []
+
+
+class TestNaturalKeyUpsert:
+    """Tests for the natural-key upsert in RAGPipeline.store_events"""
+
+    def test_natural_key_normalizes_venue_and_title(self):
+        """Test case, punctuation and spacing don't change the key."""
+        artist_id = uuid4()
+        key = make_event_natural_key(
+            artist_id, date(2026, 3, 15), "KSPO Dome", "BTS World Tour"
+        )
+
+        assert key == make_event_natural_key(
+            artist_id, date(2026, 3, 15), "KSPO DOME", "BTS WORLD  TOUR!"
+        )
+        assert key != make_event_natural_key(
+            artist_id, date(2026, 3, 16), "KSPO Dome", "BTS World Tour"
+        )
+        assert key != make_event_natural_key(
+            uuid4(), date(2026, 3, 15), "KSPO Dome", "BTS World Tour"
+        )
+
+    async def test_recollected_event_refreshes_row(self, pipeline: RAGPipeline):
+        """Test collecting an event again updates its row instead of adding one."""
+        url = "https://example.com"
+        pipeline.artist_service.get_or_create_artist_ids = _fixed_artist_ids
+
+        first = await pipeline.store_events([make_event("BTS World Tour", url)])
+        second = await pipeline.store_events(
+            [make_event("BTS WORLD TOUR!", url, price_min=Decimal("99000"))]
+        )
+
+        assert second[0].id == first[0].id
+        assert second[0].price_min == Decimal("99000")
+        assert len(pipeline.db.events) == 1
+
+        events_statement = next(
+            statement
+            for table, _, statement in pipeline.db.statements
+            if table == "events"
+        )
+        sql = str(events_statement.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (natural_key) DO UPDATE" in sql
+        assert "price_min = excluded.price_min" in sql
+
+    async def test_same_key_in_one_batch_inserted_once(self, pipeline: RAGPipeline):
+        """Test a batch never upserts one natural key twice (ON CONFLICT can't)."""
+        url = "https://example.com"
+
+        stored = await pipeline.store_events(
+            [make_event("BTS World Tour", url), make_event("bts world tour", url)]
+        )
+
+        assert len(stored) == 1
+        events_rows = next(
+            rows for table, rows, _ in pipeline.db.statements if table == "events"
+        )
+        assert len(events_rows) == 1
+
+
+_ARTIST_ID = uuid4()
+
+
+async def _fixed_artist_ids(names):
+    # The same artist across calls, as the real lookup would return
+    return {name: _ARTIST_ID for name in names}
@@ -0,0 +1,180 @@
+"""Tests for streamed LLM extraction."""
+
+from types import SimpleNamespace
+import json
+
+import pytest
+
+from app.config import settings
+from app.rag.extractor import EventExtractor
+from app.rag.resilience import UpstreamError
+from app.rag.streaming import JsonArrayStream
+
+EVENT = {
+    "title": "BTS {World} Tour \"Seoul\"",
+    "artist_name": "BTS",
+    "category": "concert",
+    "event_date": "2026-03-15",
+    "venue": "KSPO DOME",
+    "city": "Seoul",
+    "country": "South Korea",
+    "confidence": 0.9,
+}
+
+
+def pieces(text: str, size: int = 7):
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+class TestJsonArrayStream:
+    """Tests for JsonArrayStream"""
+
+    def test_objects_complete_as_they_close(self):
+        """Test each element is returned by the piece that closes it."""
+        text = json.dumps({"events": [EVENT, {**EVENT, "title": "Day 2"}]})
+        stream = JsonArrayStream()
+
+        completed = [
+            (index, item)
+            for index, piece in enumerate(pieces(text))
+            for item in stream.feed(piece)
+        ]
+
+        assert [item["title"] for _, item in completed] == [EVENT["title"], "Day 2"]
+        # The first event was available before the second was written
+        assert completed[0][0] < completed[1][0]
+
+    def test_bare_array_and_non_objects(self):
+        """Test a bare array works and non-object elements are skipped."""
+        stream = JsonArrayStream()
+        items = stream.feed('[1, {"a": [1, {"b": 2}]}, "x"') + stream.feed(", {}]")
+        assert items == [{"a": [1, {"b": 2}]}, {}]
+
+
+class FakeCompletions:
+    def __init__(self, text: str):
+        self.text = text
+        self.kwargs = None
+        self.sent = 0  # Pieces streamed so far
+
+    async def create(self, **kwargs):
+        self.kwargs = kwargs
+
+        async def parts():
+            for piece in pieces(self.text):
+                self.sent += 1
+                yield SimpleNamespace(
+                    choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))]
+                )
+
+        return parts()
+
+
+class CascadeCompletions:
+    """Streams the fast model's answer, answers the strong model at once."""
+
+    def __init__(self, answers: dict):
+        self.answers = answers
+        self.models = []
+
+    async def create(self, **kwargs):
+        self.models.append(kwargs["model"])
+        text = json.dumps({"events": self.answers[kwargs["model"]]})
+        if not kwargs.get("stream"):
+            return SimpleNamespace(
+                choices=[SimpleNamespace(message=SimpleNamespace(content=text))]
+            )
+        return await FakeCompletions(text).create(**kwargs)
+
+
+class TestStreamEvents:
+    """Tests for EventExtractor.stream_events"""
+
+    async def test_yields_validated_events(self):
+        """Test streamed objects become ExtractedEvents, invalid ones dropped."""
+        completions = FakeCompletions(
+            json.dumps({"events": [EVENT, {"title": "no date"}, EVENT]})
+        )
+        extractor = EventExtractor(api_key="test", escalation_model="")
+        extractor._client = SimpleNamespace(
+            chat=SimpleNamespace(completions=completions)
+        )
+
+        events = [
+            event
+            async for event in extractor.stream_events(
+                "BTS", "BTS concert at KSPO DOME", "https://example.com"
+            )
+        ]
+
+        assert completions.kwargs["stream"] is True
+        # Duplicates and invalid objects are dropped
+        assert [e.title for e in events] == [EVENT["title"]]
+        assert events[0].source_url == "https://example.com"
+
+    async def test_confident_events_yielded_per_object_by_default(self):
+        """Test the default cascade still yields each event as it closes."""
+        assert settings.openai_escalation_model
+        text = json.dumps({"events": [EVENT, {**EVENT, "title": "Day 2"}]})
+        completions = FakeCompletions(text)
+        extractor = EventExtractor(api_key="test")
+        extractor._client = SimpleNamespace(
+            chat=SimpleNamespace(completions=completions)
+        )
+
+        sent_at_yield = []
+        async for event in extractor.stream_events(
+            "BTS", "BTS concert at KSPO DOME", "https://example.com"
+        ):
+            sent_at_yield.append(completions.sent)
+
+        assert len(sent_at_yield) == 2
+        # The first event came out before the answer was complete
+        assert sent_at_yield[0] < len(pieces(text))
+
+    async def test_escalated_chunk_replaces_doubtful_events_only(self):
+        """Test doubtful fast events are held back and replaced, not yielded."""
+        completions = CascadeCompletions(
+            {
+                "fast": [
+                    {**EVENT, "title": "Sure"},
+                    {**EVENT, "title": "Guess", "confidence": 0.2},
+                ],
+                "strong": [EVENT],
+            }
+        )
+        extractor = EventExtractor(api_key="test", model="fast", escalation_model="strong")
+        extractor._client = SimpleNamespace(
+            chat=SimpleNamespace(completions=completions)
+        )
+
+        events = [
+            event
+            async for event in extractor.stream_events(
+                "BTS", "BTS concert at KSPO DOME", "https://example.com"
+            )
+        ]
+
+        assert completions.models == ["fast", "strong"]
+        assert [e.title for e in events] == ["Sure", EVENT["title"]]
+
+    async def test_failure_before_request_raises_upstream_error(self):
+        """Test an error while acquiring the limit is wrapped, not UnboundLocalError."""
+
+        class BrokenLimit:
+            async def __aenter__(self):
+                raise RuntimeError("limit unavailable")
+
+            async def __aexit__(self, *exc):
+                return False
+
+        extractor = EventExtractor(api_key="test", escalation_model="")
+        extractor._client = SimpleNamespace(
+            chat=SimpleNamespace(completions=FakeCompletions("{}"))
+        )
+
+        with pytest.raises(UpstreamError, match="limit unavailable"):
+            async for _ in extractor.stream_events(
+                "BTS", "BTS concert", "https://example.com", limit=BrokenLimit()
+            ):
+                pass